@@ -1,40 +1,33 @@
-from typing import Generator
-from fastapi import Depends, HTTPException, status
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+
+from fastapi import Depends, HTTPException, Query, Request, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
+from jose import JWTError
 from pydantic import ValidationError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud, models, schemas
-from app.core import security
+from app.core import http_cache, i18n, security
 from app.core.config import settings
-from app.db.session import SessionLocal
+from app.db.session import get_async_db
 
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/auth/login"
 )
 
-def get_db() -> Generator:
-    try:
-        db = SessionLocal()
-        yield db
-    finally:
-        db.close()
-
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)
+async def get_current_user(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(reusable_oauth2)
 ) -> models.models.User:
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
+        payload = security.decode_access_token(token)
         token_data = schemas.TokenData(**payload)
     except (JWTError, ValidationError):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         )
-    user = crud.user.get(db, id=token_data.sub)
+    # Admin panelindeki ardışık istekler her seferinde veritabanına gitmesin
+    user = await crud.user.get_principal(db, id=token_data.sub, iat=token_data.iat)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
@@ -45,3 +38,82 @@ def get_current_active_user(
     if not crud.user.is_active(current_user):
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+
+def get_locale(
+    request: Request,
+    lang: Optional[Literal["tr", "en", "auto"]] = Query(
+        None, description="Tek dilli yanıt; auto: Accept-Language. Boş bırakılırsa iki dil birlikte döner"
+    ),
+) -> i18n.Locale:
+    if lang == "auto":
+        return i18n.Locale(i18n.negotiate(request.headers.get("accept-language")), negotiated=True)
+    return i18n.Locale(lang)
+
+
+class FieldSelection:
+    """Resolved ``?view=`` / ``?fields=`` of a list endpoint."""
+
+    def __init__(self, schema, fields: Optional[Tuple[str, ...]], sparse: bool):
+        self.schema = schema
+        self.fields = fields  # None: tüm kolonlar
+        self.sparse = sparse
+
+    @property
+    def key(self) -> Tuple:
+        return (self.schema.__name__, self.fields)
+
+    async def fetch(self, crud_obj, db: AsyncSession, **filters) -> Any:
+        """Load rows with only the selected columns and make them JSON-ready."""
+        if self.fields is None:
+            return http_cache.to_jsonable(self.schema, await crud_obj.get_multi(db, **filters))
+        rows = await crud_obj.get_multi_fields(db, fields=self.fields, **filters)
+        # Seyrek alan listesi şemanın bir alt kümesi; satırlar doğrudan gönderilir
+        return rows if self.sparse else http_cache.to_jsonable(self.schema, rows)
+
+
+def field_selection(full_schema, summary_schema):
+    """Dependency for ``?view=full|summary`` and ``?fields=a,b`` on list endpoints.
+
+    Unrequested columns are left out of the SELECT; ``id`` is always included.
+    """
+    def dependency(
+        view: Literal["full", "summary"] = "full",
+        fields: Optional[str] = Query(None, description="Virgülle ayrılmış alan listesi, ör. id,title,slug"),
+        locale: i18n.Locale = Depends(get_locale),
+    ) -> FieldSelection:
+        schema = summary_schema if view == "summary" else full_schema
+        if not fields:
+            return FieldSelection(schema, tuple(schema.model_fields) if view == "summary" else None, sparse=False)
+        requested = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = sorted(set(requested) - set(schema.model_fields))
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Bilinmeyen alan(lar): {', '.join(unknown)}")
+        if locale.lang == "en":
+            # İngilizce alan boşsa Türkçeye düşülebilmesi için iki kolon da seçilir
+            requested += [name + i18n.SUFFIX for name in requested if name + i18n.SUFFIX in schema.model_fields]
+        return FieldSelection(schema, tuple(dict.fromkeys(["id", *requested])), sparse=True)
+
+    return dependency
+
+
+def field_selection_responses(full_schema, summary_schema) -> Dict[str, Any]:
+    """``response_model`` and ``responses`` for a list endpoint using ``field_selection``.
+
+    The handlers return pre-serialized bodies, so these only describe the
+    shape in OpenAPI: full items, summary items for ``?view=summary``, or
+    items with just ``id`` and the requested fields for ``?fields=``.
+    """
+    return {
+        "response_model": Union[List[full_schema], List[summary_schema]],
+        "responses": {
+            200: {
+                "description": (
+                    f"?view=full (varsayılan): {full_schema.__name__} listesi; "
+                    f"?view=summary: {summary_schema.__name__} listesi; "
+                    "?fields=a,b: seçilen görünümün yalnızca id ve istenen alanlarını içeren nesneler "
+                    "(?lang=en ile *_en alanları da döner)"
+                ),
+            },
+        },
+    }
@@ -1,8 +1,11 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, projects, resources
+from app.api.v1.endpoints import admin, auth, projects, public, resources, search
 
 api_router = APIRouter()
 
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(projects.router, prefix="/projects", tags=["projects"])
 api_router.include_router(resources.router, prefix="/resources", tags=["resources"])
+api_router.include_router(public.router, prefix="/public", tags=["public"])
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
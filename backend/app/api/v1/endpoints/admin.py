@@ -0,0 +1,43 @@
+from typing import Any
+from fastapi import APIRouter, Depends
+
+from app.api import deps
+from app.core.hashing import password_hasher
+from app.core.ingest import message_queue
+from app.core.ratelimit import rate_limiter
+from app.db import pool
+from app.db.session import async_engine, engine
+from app.models.models import User
+
+router = APIRouter()
+
+@router.get("/db/pool")
+def read_pool_stats(
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """Live connection pool statistics for sizing against the database connection limit."""
+    return {
+        "async": pool.stats_for("async").snapshot(async_engine.pool),
+        "sync": pool.stats_for("sync").snapshot(engine.pool),
+    }
+
+@router.get("/auth/hashing")
+def read_hashing_stats(
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """bcrypt executor queue depth, rejections and hash latency."""
+    return password_hasher.stats()
+
+@router.get("/messages/queue")
+def read_message_queue_stats(
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """Contact-form ingestion queue depth, batches written and rejections."""
+    return message_queue.stats()
+
+@router.get("/ratelimit")
+def read_rate_limit_stats(
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """Allowed and rejected requests per rate-limit rule."""
+    return rate_limiter.stats()
@@ -2,7 +2,7 @@ from datetime import timedelta
 from typing import Any
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import crud, models, schemas
 from app.api import deps
@@ -12,11 +12,12 @@ from app.core.config import settings
 router = APIRouter()
 
 @router.post("/login", response_model=schemas.Token)
-def login_access_token(
-    db: Session = Depends(deps.get_db), form_data: OAuth2PasswordRequestForm = Depends()
+async def login_access_token(
+    db: AsyncSession = Depends(deps.get_async_db), form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
     # Bu basit bir login, crud tarafında user kontrolü yapılacak
-    user = crud.user.authenticate(
+    # bcrypt kuyruğu doluysa HasherBusy uygulama genelinde 503 + Retry-After'a çevrilir (bkz. main.py)
+    user = await crud.user.authenticate(
         db, email=form_data.username, password=form_data.password
     )
     if not user:
@@ -33,15 +34,15 @@ def login_access_token(
     }
 
 @router.get("/me", response_model=schemas.User)
-def read_users_me(
+async def read_users_me(
     current_user: models.models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     return current_user
 
 @router.put("/me", response_model=schemas.User)
-def update_user_me(
+async def update_user_me(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     password: str = None,
     full_name: str = None,
     email: str = None,
@@ -54,5 +55,5 @@ def update_user_me(
         is_active=current_user.is_active,
         is_superuser=current_user.is_superuser
     )
-    user = crud.user.update(db, db_obj=current_user, obj_in=current_user_data)
+    user = await crud.user.update(db, db_obj=current_user, obj_in=current_user_data)
     return user
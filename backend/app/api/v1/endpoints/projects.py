@@ -2,96 +2,124 @@ import shutil
 import os
 import uuid
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Body
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Body, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 
 # Import yollarını sadeleştirelim
 from app import crud, schemas, models
 from app.api import deps
+from app.core import http_cache, i18n
+from app.crud.crud_resources import ReorderError
 
 router = APIRouter()
 
-@router.get("/", response_model=List[schemas.Project])
-def read_projects(
-    db: Session = Depends(deps.get_db),
+# ?view=summary (kart görünümü) ve ?fields=... seçimi
+project_fields = deps.field_selection(schemas.Project, schemas.ProjectSummary)
+project_list_responses = deps.field_selection_responses(schemas.Project, schemas.ProjectSummary)
+
+@router.get("/", **project_list_responses)
+async def read_projects(
+    request: Request,
+    db: AsyncSession = Depends(deps.get_async_db),
+    skip: int = 0,
+    limit: int = 100,
+    selection: deps.FieldSelection = Depends(project_fields),
+    locale: i18n.Locale = Depends(deps.get_locale),
+) -> Any:
+    """Published projects only; drafts are listed by /projects/admin."""
+    async def build():
+        # Order by 'order' column ascending
+        projects = await selection.fetch(
+            crud.project, db, skip=skip, limit=limit, order_by="order", published_only=True
+        )
+        return i18n.localize(projects, locale.lang)
+
+    return await http_cache.cached_response(
+        request,
+        key=("projects", skip, limit, selection.key, locale.key),
+        tables=[models.models.Project.__table__.name],
+        build=build,
+        headers=locale.headers(),
+    )
+
+@router.get("/admin", **project_list_responses)
+async def read_projects_admin(
+    db: AsyncSession = Depends(deps.get_async_db),
     skip: int = 0,
     limit: int = 100,
+    selection: deps.FieldSelection = Depends(project_fields),
+    current_user: models.models.User = Depends(deps.get_current_active_user),
 ) -> Any:
-    # return crud.project.get_multi(db, skip=skip, limit=limit)
-    # Order by 'order' column ascending
-    return db.query(models.models.Project).order_by(models.models.Project.order.asc()).offset(skip).limit(limit).all()
+    """All projects including drafts, for the admin panel."""
+    return http_cache.json_response(
+        await selection.fetch(crud.project, db, skip=skip, limit=limit, order_by="order")
+    )
 
 @router.post("/reorder", response_model=List[schemas.Project])
-def reorder_projects(
+async def reorder_projects(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     ordered_ids: List[int] = Body(...),
     current_user: models.models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """Updates the order of projects based on the provided list of IDs."""
-    projects = []
-    for index, project_id in enumerate(ordered_ids):
-        project = db.query(models.models.Project).filter(models.models.Project.id == project_id).first()
-        if project:
-            project.order = index
-            projects.append(project)
-    db.commit()
-    return projects
+    try:
+        return await crud.project.reorder(db, ordered_ids=ordered_ids)
+    except ReorderError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
 @router.get("/{id}", response_model=schemas.Project)
-def read_project(id: int, db: Session = Depends(deps.get_db)) -> Any:
-    project = crud.project.get(db=db, id=id)
+async def read_project(id: int, db: AsyncSession = Depends(deps.get_async_db)) -> Any:
+    project = await crud.project.get(db=db, id=id)
     if not project:
         raise HTTPException(status_code=404, detail="Proje bulunamadı")
     return project
 
 @router.post("/", response_model=schemas.Project)
-def create_project(
+async def create_project(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     project_in: schemas.ProjectCreate,
     current_user: models.models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """Proje oluşturur ve otomatik yayınlar."""
-    return crud.project.create(db, obj_in=project_in)
+    return await crud.project.create(db, obj_in=project_in)
 
 @router.put("/{id}", response_model=schemas.Project)
-def update_project(
+async def update_project(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     id: int,
     project_in: schemas.ProjectUpdate,
     current_user: models.models.User = Depends(deps.get_current_active_user),
 ) -> Any:
-    project = crud.project.get(db=db, id=id)
+    project = await crud.project.get(db=db, id=id)
     if not project:
         raise HTTPException(status_code=404, detail="Proje bulunamadı")
-    return crud.project.update(db=db, db_obj=project, obj_in=project_in)
+    return await crud.project.update(db=db, db_obj=project, obj_in=project_in)
 
 @router.delete("/{id}", response_model=schemas.Project)
-def delete_project(
+async def delete_project(
     id: int,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: models.models.User = Depends(deps.get_current_active_user),
 ) -> Any:
-    project = crud.project.get(db=db, id=id)
+    project = await crud.project.get(db=db, id=id)
     if not project:
         raise HTTPException(status_code=404, detail="Proje bulunamadı")
-    return crud.project.remove(db=db, id=id)
+    return await crud.project.remove(db=db, id=id)
 
 @router.post("/upload-image")
 async def upload_project_image(
     file: UploadFile = File(...),
     current_user: models.models.User = Depends(deps.get_current_active_user),
 ):
-    """Upload a project image to Supabase Storage."""
-    from app.core.storage import storage
-    
-    # Upload to Supabase Storage
-    public_url, file_path = await storage.upload_file(
+    """Upload a project image and its WebP variants to the configured storage backend."""
+    from app.core.images import upload_image
+
+    # image_url + image_variants (srcset) + image_placeholder
+    return await upload_image(
         file=file,
         folder="projects",
         allowed_extensions=["jpg", "jpeg", "png", "webp", "gif"]
     )
-    
-    return {"image_url": public_url}
\ No newline at end of file
@@ -0,0 +1,19 @@
+from typing import Any
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.api import deps
+from app.core import http_cache, i18n
+from app.core.snapshot import public_snapshot
+
+router = APIRouter()
+
+@router.get("/bundle", response_model=schemas.PublicBundle)
+async def read_public_bundle(
+    request: Request,
+    db: AsyncSession = Depends(deps.get_async_db),
+    locale: i18n.Locale = Depends(deps.get_locale),
+) -> Any:
+    """All public homepage content in a single response, served from the snapshot."""
+    return http_cache.respond(request, await public_snapshot.get(db, locale.lang), locale.headers())
@@ -1,14 +1,18 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, Body
-from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Body, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from app import crud, schemas
 from app.api import deps
+from app.core import http_cache, i18n
+from app.core.ingest import QueueFull, SpoolError, message_queue
+from app.core.rendering import render_post
+from app.crud.crud_resources import ReorderError
 from fastapi import File, UploadFile
 import shutil
 import os
 import uuid # Dosya isimlerinin çakışmaması için
 # Modelleri doğrudan dosyadan import ederek 'models.models' hatasını çözüyoruz
-from app.models.models import About, TimelineItem, User, BlogPost
+from app.models.models import About, TimelineItem, User, BlogPost, Service, Settings
 from app.core.config import settings 
 
 router = APIRouter()
@@ -19,199 +23,362 @@ async def upload_file(
     file: UploadFile = File(...),
     current_user: User = Depends(deps.get_current_active_user)
 ):
-    """Upload a file to Supabase Storage (for avatars, CVs, etc.)."""
+    """Upload a file to the configured storage backend (for avatars, CVs, etc.)."""
+    from app.core.images import upload_image
     from app.core.storage import storage
     
     # Determine folder based on file type
     extension = file.filename.split(".")[-1].lower() if file.filename else ""
     
     if extension == "pdf":
-        folder = "documents"
-        allowed_extensions = ["pdf"]
-    else:
-        folder = "images"
-        allowed_extensions = ["jpg", "jpeg", "png", "webp", "gif"]
+        # Upload to storage (content-addressed, duplicates are not stored twice)
+        public_url, file_path = await storage.upload_file(
+            file=file,
+            folder="documents",
+            allowed_extensions=["pdf"]
+        )
+        return {"url": public_url}
     
-    # Upload to Supabase Storage
-    public_url, file_path = await storage.upload_file(
+    # Görseller için WebP varyantları da üretilir
+    uploaded = await upload_image(
         file=file,
-        folder=folder,
-        allowed_extensions=allowed_extensions + ["pdf"]  # Allow both
+        folder="images",
+        allowed_extensions=["jpg", "jpeg", "png", "webp", "gif"]
     )
-    
-    return {"url": public_url}
+    return {"url": uploaded["image_url"], **uploaded}
     
 # --- Services ---
 @router.get("/services", response_model=List[schemas.schemas.Service])
-def read_services(db: Session = Depends(deps.get_db)) -> Any:
-    return crud.service.get_multi(db)
+async def read_services(
+    request: Request,
+    db: AsyncSession = Depends(deps.get_async_db),
+    locale: i18n.Locale = Depends(deps.get_locale),
+) -> Any:
+    async def build():
+        services = http_cache.to_jsonable(schemas.schemas.Service, await crud.service.get_multi(db))
+        return i18n.localize(services, locale.lang)
+
+    return await http_cache.cached_response(
+        request,
+        key=("services", locale.key),
+        tables=[Service.__table__.name],
+        build=build,
+        headers=locale.headers(),
+    )
 
 @router.post("/services", response_model=schemas.schemas.Service)
-def create_service(
-    db: Session = Depends(deps.get_db), 
+async def create_service(
+    db: AsyncSession = Depends(deps.get_async_db), 
     *, 
     obj_in: schemas.schemas.ServiceCreate,
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
-    return crud.service.create(db, obj_in=obj_in)
+    return await crud.service.create(db, obj_in=obj_in)
+
+@router.post("/services/reorder", response_model=List[schemas.schemas.Service])
+async def reorder_services(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    ordered_ids: List[int] = Body(...),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """Updates the order of services based on the provided list of IDs."""
+    try:
+        return await crud.service.reorder(db, ordered_ids=ordered_ids)
+    except ReorderError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
 # --- Timeline ---
 @router.get("/timeline", response_model=List[schemas.Timeline])
-def read_timeline(
-    db: Session = Depends(deps.get_db),
+async def read_timeline(
+    request: Request,
+    db: AsyncSession = Depends(deps.get_async_db),
     skip: int = 0,
     limit: int = 100,
+    locale: i18n.Locale = Depends(deps.get_locale),
 ) -> Any:
-    return db.query(TimelineItem).order_by(TimelineItem.order.asc()).all()
+    async def build():
+        items = await crud.timeline.get_multi(db, limit=None, order_by="order")
+        return i18n.localize(http_cache.to_jsonable(schemas.Timeline, items), locale.lang)
+
+    return await http_cache.cached_response(
+        request,
+        key=("timeline", locale.key),
+        tables=[TimelineItem.__table__.name],
+        build=build,
+        headers=locale.headers(),
+    )
 
 @router.post("/timeline", response_model=schemas.Timeline)
-def create_timeline_item(
+async def create_timeline_item(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     item_in: schemas.TimelineCreate,
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     item = TimelineItem(**item_in.dict())
     db.add(item)
-    db.commit()
-    db.refresh(item)
+    await db.commit()
+    await db.refresh(item)
     return item
 
+@router.post("/timeline/reorder", response_model=List[schemas.Timeline])
+async def reorder_timeline(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    ordered_ids: List[int] = Body(...),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """Updates the order of timeline items based on the provided list of IDs."""
+    try:
+        return await crud.timeline.reorder(db, ordered_ids=ordered_ids)
+    except ReorderError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
 @router.delete("/timeline/{id}", response_model=schemas.Timeline)
-def delete_timeline_item(
+async def delete_timeline_item(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     id: int,
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
-    item = db.query(TimelineItem).filter(TimelineItem.id == id).first()
+    item = await crud.timeline.get(db, id=id)
     if not item:
         raise HTTPException(status_code=404, detail="Öğe bulunamadı")
-    db.delete(item)
-    db.commit()
+    await db.delete(item)
+    await db.commit()
     return item
 
 @router.put("/timeline/{id}", response_model=schemas.Timeline)
-def update_timeline_item(
+async def update_timeline_item(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     id: int,
     item_in: schemas.TimelineUpdate,
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
-    item = db.query(TimelineItem).filter(TimelineItem.id == id).first()
+    item = await crud.timeline.get(db, id=id)
     if not item:
         raise HTTPException(status_code=404, detail="Öğe bulunamadı")
     update_data = item_in.dict(exclude_unset=True)
     for field, value in update_data.items():
         setattr(item, field, value)
-    db.commit()
-    db.refresh(item)
+    await db.commit()
+    await db.refresh(item)
     return item
 
 # --- Messages ---
 @router.get("/messages", response_model=List[schemas.schemas.Message])
-def read_messages(
-    db: Session = Depends(deps.get_db),
+async def read_messages(
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=100),
+    is_read: Optional[bool] = None,
+    q: Optional[str] = Query(None, max_length=200),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """Newest first. The cursor for the next page is returned in the X-Next-Cursor header."""
+    try:
+        messages, next_cursor = await crud.message.get_page(
+            db, cursor=cursor, limit=limit, is_read=is_read, q=q
+        )
+    except ValueError as exc:
+        # Bozuk imleç
+        raise HTTPException(status_code=400, detail=str(exc))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return messages
+
+@router.get("/messages/unread-count", response_model=Dict[str, int])
+async def read_message_counts(
+    db: AsyncSession = Depends(deps.get_async_db),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
-    return crud.message.get_multi(db)
+    """Unread and total message counts, without downloading the inbox."""
+    return await crud.message.get_counts(db)
 
-@router.post("/messages", response_model=schemas.schemas.Message)
-def create_message(db: Session = Depends(deps.get_db), *, obj_in: schemas.schemas.MessageCreate) -> Any:
-    return crud.message.create(db, obj_in=obj_in)
+@router.post("/messages", status_code=202, response_model=Dict[str, str])
+async def create_message(*, obj_in: schemas.schemas.MessageCreate) -> Any:
+    """Queue a contact-form message; 202 once it is fsynced to the spool, inserted in the next batch."""
+    try:
+        await message_queue.submit(obj_in.model_dump())
+    except QueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail="Çok fazla mesaj işleniyor, lütfen biraz sonra tekrar deneyin",
+            headers={"Retry-After": str(max(1, round(message_queue.flush_interval * 2)))},
+        )
+    except SpoolError:
+        raise HTTPException(
+            status_code=503,
+            detail="Mesaj kaydedilemedi, lütfen tekrar deneyin",
+            headers={"Retry-After": "1"},
+        )
+    return {"status": "accepted"}
 
 @router.delete("/messages/{id}", response_model=schemas.schemas.Message)
-def delete_message(
+async def delete_message(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     id: int,
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
-    message = crud.message.get(db=db, id=id)
+    message = await crud.message.get(db=db, id=id)
     if not message:
         raise HTTPException(status_code=404, detail="Mesaj bulunamadı")
-    message = crud.message.remove(db=db, id=id)
+    message = await crud.message.remove(db=db, id=id)
     return message
 
 @router.put("/messages/{id}", response_model=schemas.schemas.Message)
-def update_message(
+async def update_message(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     id: int,
     obj_in: dict, # Using dict for partial updates like {"is_read": True}
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
-    message = crud.message.get(db=db, id=id)
+    message = await crud.message.get(db=db, id=id)
     if not message:
         raise HTTPException(status_code=404, detail="Mesaj bulunamadı")
     
     # Simple update wrapper since schema might not have an unexpected update class
-    message = crud.message.update(db=db, db_obj=message, obj_in=obj_in)
+    message = await crud.message.update(db=db, db_obj=message, obj_in=obj_in)
     return message
 
 # --- Blog ---
-@router.get("/blog", response_model=List[schemas.schemas.BlogPost])
-def read_blog_posts(db: Session = Depends(deps.get_db)) -> Any:
-    return db.query(BlogPost).order_by(BlogPost.order.asc()).all()
+# ?view=summary (kart görünümü) ve ?fields=... seçimi
+blog_fields = deps.field_selection(schemas.schemas.BlogPost, schemas.schemas.BlogPostSummary)
+blog_list_responses = deps.field_selection_responses(schemas.schemas.BlogPost, schemas.schemas.BlogPostSummary)
+
+@router.get("/blog", **blog_list_responses)
+async def read_blog_posts(
+    request: Request,
+    db: AsyncSession = Depends(deps.get_async_db),
+    selection: deps.FieldSelection = Depends(blog_fields),
+    locale: i18n.Locale = Depends(deps.get_locale),
+) -> Any:
+    """Published posts only; drafts are listed by /blog/admin."""
+    async def build():
+        posts = await selection.fetch(crud.blog, db, limit=None, order_by="order", published_only=True)
+        return i18n.localize(posts, locale.lang)
+
+    return await http_cache.cached_response(
+        request,
+        key=("blog", selection.key, locale.key),
+        tables=[BlogPost.__table__.name],
+        build=build,
+        headers=locale.headers(),
+    )
+
+@router.get("/blog/admin", **blog_list_responses)
+async def read_blog_posts_admin(
+    db: AsyncSession = Depends(deps.get_async_db),
+    selection: deps.FieldSelection = Depends(blog_fields),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """All posts including drafts, for the admin panel."""
+    return http_cache.json_response(
+        await selection.fetch(crud.blog, db, limit=None, order_by="order")
+    )
+
+# /blog/admin'den sonra tanımlanmalı; aksi halde "admin" slug olarak yakalanır
+@router.get("/blog/{slug}", response_model=schemas.schemas.BlogPostDetail)
+async def read_blog_post(
+    slug: str,
+    request: Request,
+    db: AsyncSession = Depends(deps.get_async_db),
+    locale: i18n.Locale = Depends(deps.get_locale),
+) -> Any:
+    """A single published post with its full body, rendered to sanitized HTML with a TOC."""
+    async def build():
+        post = await crud.blog.get_by_slug(db, slug=slug, published_only=True)
+        if not post:
+            raise HTTPException(status_code=404, detail="Blog yazısı bulunamadı")
+        detail = schemas.schemas.BlogPostDetail(
+            **schemas.schemas.BlogPost.model_validate(post).model_dump(),
+            **await render_post(post),
+        )
+        return i18n.localize(detail, locale.lang)
+
+    return await http_cache.cached_response(
+        request,
+        key=("blog", "slug", slug, locale.key),
+        tables=[BlogPost.__table__.name],
+        build=build,
+        headers=locale.headers(),
+    )
 
 @router.post("/blog/reorder", response_model=List[schemas.schemas.BlogPost])
-def reorder_blog_posts(
+async def reorder_blog_posts(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     ordered_ids: List[int] = Body(...),
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """Updates the order of blog posts based on the provided list of IDs."""
-    posts = []
-    for index, post_id in enumerate(ordered_ids):
-        post = db.query(BlogPost).filter(BlogPost.id == post_id).first()
-        if post:
-            post.order = index
-            posts.append(post)
-    db.commit()
-    return posts
+    try:
+        return await crud.blog.reorder(db, ordered_ids=ordered_ids)
+    except ReorderError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
 @router.post("/blog", response_model=schemas.schemas.BlogPost)
-def create_blog_post(
-    db: Session = Depends(deps.get_db), 
+async def create_blog_post(
+    db: AsyncSession = Depends(deps.get_async_db), 
     *, 
     obj_in: schemas.schemas.BlogPostCreate,
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
-    return crud.blog.create(db, obj_in=obj_in)
+    return await crud.blog.create(db, obj_in=obj_in)
 
 @router.put("/blog/{id}", response_model=schemas.schemas.BlogPost)
-def update_blog_post(
+async def update_blog_post(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     id: int,
     obj_in: schemas.schemas.BlogPostUpdate,
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
-    post = crud.blog.get(db=db, id=id)
+    post = await crud.blog.get(db=db, id=id)
     if not post:
         raise HTTPException(status_code=404, detail="Blog post not found")
-    post = crud.blog.update(db=db, db_obj=post, obj_in=obj_in)
+    post = await crud.blog.update(db=db, db_obj=post, obj_in=obj_in)
     return post
 
 @router.delete("/blog/{id}", response_model=schemas.schemas.BlogPost)
-def delete_blog_post(
+async def delete_blog_post(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     id: int,
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
-    post = crud.blog.get(db=db, id=id)
+    post = await crud.blog.get(db=db, id=id)
     if not post:
         raise HTTPException(status_code=404, detail="Blog post not found")
-    post = crud.blog.remove(db=db, id=id)
+    post = await crud.blog.remove(db=db, id=id)
     return post
 
 # --- About ---
 @router.get("/about", response_model=schemas.About)
-def get_about(db: Session = Depends(deps.get_db)):
-    about = db.query(About).first()
+async def get_about(
+    request: Request,
+    db: AsyncSession = Depends(deps.get_async_db),
+    locale: i18n.Locale = Depends(deps.get_locale),
+):
+    async def build():
+        about = http_cache.to_jsonable(schemas.About, await _get_or_create_about(db))
+        return i18n.localize(about, locale.lang)
+
+    return await http_cache.cached_response(
+        request,
+        key=("about", locale.key),
+        tables=[About.__table__.name],
+        build=build,
+        headers=locale.headers(),
+    )
+
+async def _get_or_create_about(db: AsyncSession) -> About:
+    about = await crud.about.get_first(db)
     if not about:
         about = About(
             full_name="Ad Soyad", 
@@ -223,18 +390,18 @@ def get_about(db: Session = Depends(deps.get_db)):
             social_links={}
         )
         db.add(about)
-        db.commit()
-        db.refresh(about)
+        await db.commit()
+        await db.refresh(about)
     return about
 
 @router.post("/about", response_model=schemas.About)
-def update_about(
+async def update_about(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     about_in: schemas.AboutUpdate,
     current_user: User = Depends(deps.get_current_active_user),
 ):
-    about = db.query(About).first()
+    about = await crud.about.get_first(db)
     if not about:
         about = About(**about_in.dict())
         db.add(about)
@@ -242,26 +409,39 @@ def update_about(
         update_data = about_in.dict(exclude_unset=True)
         for field, value in update_data.items():
             setattr(about, field, value)
-    db.commit()
-    db.refresh(about)
+    await db.commit()
+    await db.refresh(about)
     return about
 
 # --- Settings ---
 @router.get("/settings", response_model=schemas.schemas.Settings)
-def read_settings(db: Session = Depends(deps.get_db)) -> Any:
-    settings = crud.settings.get_first(db)
-    if not settings:
-        return schemas.schemas.Settings(id=0, site_title="Portfolio")
-    return settings
+async def read_settings(
+    request: Request,
+    db: AsyncSession = Depends(deps.get_async_db),
+    locale: i18n.Locale = Depends(deps.get_locale),
+) -> Any:
+    async def build():
+        settings = await crud.settings.get_first(db)
+        if not settings:
+            return i18n.localize(schemas.schemas.Settings(id=0, site_title="Portfolio"), locale.lang)
+        return i18n.localize(http_cache.to_jsonable(schemas.schemas.Settings, settings), locale.lang)
+
+    return await http_cache.cached_response(
+        request,
+        key=("settings", locale.key),
+        tables=[Settings.__table__.name],
+        build=build,
+        headers=locale.headers(),
+    )
 
 @router.post("/settings", response_model=schemas.schemas.Settings)
-def create_or_update_settings(
-    db: Session = Depends(deps.get_db),
+async def create_or_update_settings(
+    db: AsyncSession = Depends(deps.get_async_db),
     *,
     obj_in: schemas.schemas.SettingsCreate,
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
-    settings = crud.settings.get_first(db)
+    settings = await crud.settings.get_first(db)
     if settings:
-        return crud.settings.update(db, db_obj=settings, obj_in=obj_in)
-    return crud.settings.create(db, obj_in=obj_in)
\ No newline at end of file
+        return await crud.settings.update(db, db_obj=settings, obj_in=obj_in)
+    return await crud.settings.create(db, obj_in=obj_in)
@@ -0,0 +1,18 @@
+from typing import Any, List, Literal
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, schemas
+from app.api import deps
+
+router = APIRouter()
+
+@router.get("/", response_model=List[schemas.SearchResult])
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    lang: Literal["tr", "en"] = "tr",
+    limit: int = Query(20, ge=1, le=50),
+    db: AsyncSession = Depends(deps.get_async_db),
+) -> Any:
+    """Ranked search over published projects and blog posts with highlighted snippets."""
+    return await crud.search.search(db, q=q, lang=lang, limit=limit)
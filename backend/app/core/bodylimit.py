@@ -0,0 +1,72 @@
+"""
+Request body size limit for the upload endpoints.
+
+Starlette parses a multipart body into a temporary file before the endpoint
+runs, so a size check in the endpoint only fires after every byte has been
+received (and written to disk). This ASGI middleware rejects an upload
+earlier: a declared Content-Length over the limit gets 413 before the body
+is read, and a body without one (chunked) or with a wrong one is counted as
+it arrives and cut off with 413 as soon as it passes the limit.
+"""
+import json
+from typing import Iterable
+
+from fastapi import HTTPException
+from starlette.datastructures import Headers
+
+# Sınır dosya boyutu içindir; multipart sınırları ve parça başlıkları için pay bırakılır
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+def format_size(size: int) -> str:
+    """Human-readable size for error messages (``512 KB``, ``1.5 MB``)."""
+    for unit, factor in (("MB", 1024 * 1024), ("KB", 1024)):
+        if size >= factor:
+            return f"{size / factor:.1f}".rstrip("0").rstrip(".") + f" {unit}"
+    return f"{size} bayt"
+
+
+def too_large_detail(max_bytes: int) -> str:
+    return f"Dosya çok büyük. En fazla {format_size(max_bytes)} yüklenebilir"
+
+
+class BodySizeLimitMiddleware:
+    def __init__(self, app, max_bytes: int, paths: Iterable[str]):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.max_body = max_bytes + MULTIPART_OVERHEAD
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.paths:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_body:
+            body = json.dumps({"detail": too_large_detail(self.max_bytes)}, ensure_ascii=False).encode()
+            await send({
+                "type": "http.response.start",
+                "status": 413,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"connection", b"close"),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body:
+                    # FastAPI gövde ayrıştırırken HTTPException'ı olduğu gibi yeniden fırlatır
+                    raise HTTPException(status_code=413, detail=too_large_detail(self.max_bytes))
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,176 @@
+"""
+In-process read-through cache used by the CRUD layer.
+
+Each model gets its own namespace (keyed by table name) backed by a bounded
+LRU with a TTL. Namespaces are cleared automatically when a commit touches
+their table, see ``app.db.changes``.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.core.config import settings
+from app.db import changes
+
+MISS = object()
+
+
+class CacheBackend:
+    """Interface for cache backends. Subclasses implement get/set/clear."""
+
+    def get(self, key: Hashable) -> Any:
+        raise NotImplementedError
+
+    def set(self, key: Hashable, value: Any, *, generation: Optional[int] = None) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    @property
+    def generation(self) -> int:
+        return 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the cached value for key, awaiting loader on a miss."""
+        value = self.get(key)
+        if value is MISS:
+            generation = self.generation
+            value = await loader()
+            self.set(key, value, generation=generation)
+        return value
+
+
+class NullCache(CacheBackend):
+    """Cache that never stores anything (used when caching is disabled)."""
+
+    def get(self, key: Hashable) -> Any:
+        return MISS
+
+    def set(self, key: Hashable, value: Any, *, generation: Optional[int] = None) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class LRUCache(CacheBackend):
+    """Thread-safe bounded LRU with per-entry TTL and hit/miss counters."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return MISS
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, *, generation: Optional[int] = None) -> None:
+        with self._lock:
+            # Value was loaded before an invalidation; storing it would resurrect stale data.
+            if generation is not None and generation != self._generation:
+                return
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class CacheRegistry:
+    """Creates one cache backend per namespace and clears them on change."""
+
+    def __init__(self, factory: Callable[[], CacheBackend]):
+        self.factory = factory
+        self._namespaces: Dict[str, CacheBackend] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str) -> CacheBackend:
+        with self._lock:
+            if namespace not in self._namespaces:
+                self._namespaces[namespace] = self.factory()
+            return self._namespaces[namespace]
+
+    def register(self, namespace: str, backend: CacheBackend) -> CacheBackend:
+        """Use a specific backend for a namespace (e.g. a shorter TTL)."""
+        with self._lock:
+            self._namespaces[namespace] = backend
+            return backend
+
+    def invalidate(self, namespaces: Optional[Set[str]] = None) -> None:
+        for name, backend in list(self._namespaces.items()):
+            if namespaces is None or name in namespaces:
+                backend.clear()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: backend.stats() for name, backend in self._namespaces.items()}
+
+
+def _default_backend() -> CacheBackend:
+    if not settings.CACHE_ENABLED:
+        return NullCache()
+    return LRUCache(maxsize=settings.CACHE_MAX_ENTRIES, ttl=settings.CACHE_TTL_SECONDS)
+
+
+def to_row(obj) -> Optional[Dict[str, Any]]:
+    """Copy the column values of an ORM instance into a plain dict."""
+    if obj is None:
+        return None
+    return {attr.key: getattr(obj, attr.key) for attr in inspect(obj).mapper.column_attrs}
+
+
+async def from_row(db: AsyncSession, model, row: Optional[Dict[str, Any]]):
+    """Rebuild a session-bound ORM instance from a cached row without querying."""
+    if row is None:
+        return None
+    obj = model(**row)
+    make_transient_to_detached(obj)
+    return await db.merge(obj, load=False)
+
+
+# Singleton instance
+caches = CacheRegistry(_default_backend)
+changes.subscribe(caches.invalidate)
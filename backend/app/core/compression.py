@@ -0,0 +1,271 @@
+"""
+Response compression: brotli (when the ``brotli`` package is installed) or gzip,
+negotiated from Accept-Encoding.
+
+Bodies below COMPRESSION_MIN_SIZE, non-text media types and responses that
+already carry a Content-Encoding (e.g. precompressed uploads) pass through
+untouched. Public responses with a strong ETag are compressed once per
+ETag: the ETag changes with the content version, so the compressed bytes
+are reused until the underlying tables change.
+"""
+import zlib
+from typing import Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+
+from app.core.cache import MISS, CacheBackend, LRUCache, NullCache, caches
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # brotli isteğe bağlı; yoksa yalnızca gzip
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+# Her istekte sıkıştırılan gövdeler için hızlı seviyeler; cache'lenenler bir kez
+# sıkıştırıldığı için daha yüksek seviyeye değer
+GZIP_LEVEL, GZIP_LEVEL_CACHED = 6, 9
+BROTLI_QUALITY, BROTLI_QUALITY_CACHED = 5, 9
+
+# Bu boyuttan büyük gövdeler event loop'u bloklamasın diye thread'de sıkıştırılır
+THREADPOOL_THRESHOLD = 64 * 1024
+
+
+def supported_encodings() -> tuple:
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the best supported encoding the client accepts (q > 0), or None."""
+    weights = {}
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        weight = 1.0
+        params = params.strip().replace(" ", "")
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[name] = weight
+    candidates = [
+        encoding for encoding in supported_encodings()
+        if weights.get(encoding, weights.get("*", 0.0)) > 0
+    ]
+    return max(candidates, key=lambda encoding: weights.get(encoding, weights.get("*", 0.0)), default=None)
+
+
+def compress(body: bytes, encoding: str, cached: bool = False) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY_CACHED if cached else BROTLI_QUALITY)
+    compressor = zlib.compressobj(GZIP_LEVEL_CACHED if cached else GZIP_LEVEL, zlib.DEFLATED, 31)
+    return compressor.compress(body) + compressor.flush()
+
+
+class _StreamCompressor:
+    """Incremental compressor for streamed (more_body) responses."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """ETag of the compressed representation: ``"abc"`` -> ``"abc-gzip"``."""
+    if not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def strip_encoding(etag: str) -> str:
+    """Inverse of encoded_etag, used when comparing If-None-Match values."""
+    for encoding in ("br", "gzip"):
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[: -len(suffix)] + '"'
+    return etag
+
+
+def _is_compressible(headers: MutableHeaders) -> bool:
+    content_type = headers.get("content-type", "")
+    return content_type.startswith(COMPRESSIBLE_TYPES) and "content-encoding" not in headers
+
+
+def _add_vary(headers: MutableHeaders) -> None:
+    vary = headers.get("vary")
+    if not vary:
+        headers["vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower() and vary.strip() != "*":
+        headers["vary"] = f"{vary}, Accept-Encoding"
+
+
+def _is_shared_cacheable(headers: MutableHeaders) -> bool:
+    etag = headers.get("etag", "")
+    cache_control = headers.get("cache-control", "").lower()
+    return (
+        etag.startswith('"')
+        and "public" in cache_control
+        and "no-store" not in cache_control
+        and "private" not in cache_control
+    )
+
+
+class CompressionMiddleware:
+    def __init__(self, app, minimum_size: int = 1024, cache: Optional[CacheBackend] = None):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.cache = cache if cache is not None else NullCache()
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        responder = _Responder(
+            self,
+            send,
+            encoding=negotiate(request_headers.get("accept-encoding")),
+            if_none_match=request_headers.get("if-none-match", ""),
+            head=scope["method"] == "HEAD",
+        )
+        await self.app(scope, receive, responder)
+
+
+class _Responder:
+    """Wraps ``send`` for one request; holds the start message until the first body chunk."""
+
+    def __init__(self, middleware: CompressionMiddleware, send, *, encoding, if_none_match, head):
+        self.middleware = middleware
+        self.send = send
+        self.encoding = encoding
+        self.if_none_match = if_none_match
+        self.head = head
+        self.start = None
+        self.stream: Optional[_StreamCompressor] = None
+        self.started = False
+
+    async def __call__(self, message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if self.started:
+            await self._send_body(message)
+            return
+        self.started = True
+        if message["type"] != "http.response.body":
+            # pathsend / zerocopysend: sunucu dosyayı doğrudan gönderir, dokunulmaz
+            await self.send(self.start)
+            await self.send(message)
+            return
+
+        headers = MutableHeaders(scope=self.start)
+        status = self.start["status"]
+        etag = headers.get("etag")
+        if status == 304:
+            # İstemci sıkıştırılmış temsili doğruladıysa aynı ETag'i geri ver
+            if etag and self.encoding and encoded_etag(etag, self.encoding) in self.if_none_match:
+                headers["etag"] = encoded_etag(etag, self.encoding)
+                _add_vary(headers)
+            await self.send(self.start)
+            await self.send(message)
+            return
+        if not _is_compressible(headers):
+            await self.send(self.start)
+            await self.send(message)
+            return
+        _add_vary(headers)
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.encoding is None or self.head or status in (204, 206):
+            await self.send(self.start)
+            await self.send(message)
+            return
+
+        if not more_body:
+            if len(body) < self.middleware.minimum_size:
+                await self.send(self.start)
+                await self.send(message)
+                return
+            compressed = await self._compress(body, cacheable=_is_shared_cacheable(headers), etag=etag)
+            if len(compressed) >= len(body):
+                await self.send(self.start)
+                await self.send(message)
+                return
+            self._mark_encoded(headers, etag)
+            headers["content-length"] = str(len(compressed))
+            await self.send(self.start)
+            await self.send({"type": "http.response.body", "body": compressed})
+            return
+
+        content_length = headers.get("content-length")
+        if content_length is not None and int(content_length) < self.middleware.minimum_size:
+            await self.send(self.start)
+            await self.send(message)
+            return
+        self.stream = _StreamCompressor(self.encoding)
+        self._mark_encoded(headers, etag)
+        del headers["content-length"]
+        await self.send(self.start)
+        await self._send_body(message)
+
+    async def _compress(self, body: bytes, *, cacheable: bool, etag: Optional[str]) -> bytes:
+        if not cacheable:
+            if len(body) >= THREADPOOL_THRESHOLD:
+                return await run_in_threadpool(compress, body, self.encoding)
+            return compress(body, self.encoding)
+        cache = self.middleware.cache
+        key = (etag, self.encoding, len(body))
+        compressed = cache.get(key)
+        if compressed is MISS:
+            compressed = await run_in_threadpool(compress, body, self.encoding, True)
+            cache.set(key, compressed)
+        return compressed
+
+    def _mark_encoded(self, headers: MutableHeaders, etag: Optional[str]) -> None:
+        headers["content-encoding"] = self.encoding
+        if etag:
+            headers["etag"] = encoded_etag(etag, self.encoding)
+
+    async def _send_body(self, message) -> None:
+        if self.stream is None:
+            await self.send(message)
+            return
+        more_body = message.get("more_body", False)
+        data = self.stream.compress(message.get("body", b""))
+        if not more_body:
+            data += self.stream.finish()
+        await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+
+# Sıkıştırılmış gövdeler ETag (içerik sürümü) başına saklanır
+compressed_bodies = caches.register(
+    "compressed",
+    LRUCache(maxsize=settings.COMPRESSION_CACHE_MAX_ENTRIES, ttl=settings.CACHE_TTL_SECONDS)
+    if settings.CACHE_ENABLED
+    else NullCache(),
+)
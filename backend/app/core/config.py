@@ -10,6 +10,15 @@ class Settings(BaseSettings):
     
     # Veritabanı
     DATABASE_URL: str = os.getenv("DATABASE_URL")
+    # Boş bırakılırsa DATABASE_URL'den türetilir (postgresql -> asyncpg, sqlite -> aiosqlite)
+    ASYNC_DATABASE_URL: str = os.getenv("ASYNC_DATABASE_URL", "")
+    
+    # Bağlantı havuzu (Supabase/PgBouncer bağlantı limitine göre ayarlayın)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 1800))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
     
     # Güvenlik - Production'da varsayılan değer KULLANILMAMALI
     SECRET_KEY: str = os.getenv("SECRET_KEY", "dev-secret-key-change-in-production")
@@ -21,10 +30,72 @@ class Settings(BaseSettings):
     ALLOWED_ORIGINS: str = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000")
     ENVIRONMENT: str = os.getenv("ENVIRONMENT", "development")
     
+    # Dosya depolama: "local" (LOCAL_STORAGE_DIR, /uploads altında sunulur) veya "supabase"
+    STORAGE_BACKEND: str = os.getenv("STORAGE_BACKEND", "supabase" if os.getenv("SUPABASE_URL") else "local")
+    LOCAL_STORAGE_DIR: str = os.getenv("LOCAL_STORAGE_DIR", "uploads")
+    
     # Supabase Storage
     SUPABASE_URL: str = os.getenv("SUPABASE_URL", "")
     SUPABASE_KEY: str = os.getenv("SUPABASE_KEY", "")
     SUPABASE_BUCKET: str = os.getenv("SUPABASE_BUCKET", "uploads")
+    # Yükleme sınırı (bayt); istek gövdesi okunurken uygulanır (Content-Length ve sayaç), aşılırsa 413
+    MAX_UPLOAD_BYTES: int = int(os.getenv("MAX_UPLOAD_BYTES", 10 * 1024 * 1024))
+    
+    # Görsel varyantları (WebP, srcset genişlikleri)
+    IMAGE_VARIANT_WIDTHS: str = os.getenv("IMAGE_VARIANT_WIDTHS", "320,640,1280")
+    IMAGE_QUALITY: int = int(os.getenv("IMAGE_QUALITY", 80))
+    IMAGE_WORKERS: int = int(os.getenv("IMAGE_WORKERS", 2))
+    
+    # Önbellek (CRUD okuma cache'i)
+    CACHE_ENABLED: bool = os.getenv("CACHE_ENABLED", "true").lower() == "true"
+    CACHE_TTL_SECONDS: int = int(os.getenv("CACHE_TTL_SECONDS", 300))
+    CACHE_MAX_ENTRIES: int = int(os.getenv("CACHE_MAX_ENTRIES", 256))
+    
+    # HTTP cache başlıkları (ETag / Cache-Control)
+    HTTP_CACHE_MAX_AGE: int = int(os.getenv("HTTP_CACHE_MAX_AGE", 60))
+    HTTP_CACHE_STALE_WHILE_REVALIDATE: int = int(os.getenv("HTTP_CACHE_STALE_WHILE_REVALIDATE", 300))
+    HTTP_CACHE_MAX_ENTRIES: int = int(os.getenv("HTTP_CACHE_MAX_ENTRIES", 128))
+    
+    # Yanıt sıkıştırma (gzip / brotli); bu boyutun altındaki gövdeler olduğu gibi gönderilir
+    COMPRESSION_MIN_SIZE: int = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+    COMPRESSION_CACHE_MAX_ENTRIES: int = int(os.getenv("COMPRESSION_CACHE_MAX_ENTRIES", 256))
+    
+    # Blog yazılarının HTML'e çevrilmiş hali (yazı ve dil başına bir girdi)
+    MARKDOWN_CACHE_MAX_ENTRIES: int = int(os.getenv("MARKDOWN_CACHE_MAX_ENTRIES", 256))
+    
+    # İletişim formu kuyruğu: mesajlar önce spool dosyasına yazılır, toplu INSERT ile veritabanına aktarılır
+    MESSAGE_QUEUE_MAX_SIZE: int = int(os.getenv("MESSAGE_QUEUE_MAX_SIZE", 1000))
+    MESSAGE_BATCH_SIZE: int = int(os.getenv("MESSAGE_BATCH_SIZE", 50))
+    MESSAGE_FLUSH_INTERVAL_MS: int = int(os.getenv("MESSAGE_FLUSH_INTERVAL_MS", 500))
+    MESSAGE_SPOOL_DIR: str = os.getenv("MESSAGE_SPOOL_DIR", "spool")
+    
+    # İstek sınırlama (token bucket): "adet/periyot", periyot second|minute|hour|day; boş bırakılırsa kapalı
+    # *_GLOBAL sınırlar tüm istemciler için ortaktır. Redis adresi verilirse sınırlar işçiler arasında paylaşılır
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    RATE_LIMIT_LOGIN: str = os.getenv("RATE_LIMIT_LOGIN", "10/minute")
+    RATE_LIMIT_LOGIN_GLOBAL: str = os.getenv("RATE_LIMIT_LOGIN_GLOBAL", "300/minute")
+    RATE_LIMIT_MESSAGES: str = os.getenv("RATE_LIMIT_MESSAGES", "5/minute")
+    RATE_LIMIT_MESSAGES_GLOBAL: str = os.getenv("RATE_LIMIT_MESSAGES_GLOBAL", "120/minute")
+    RATE_LIMIT_REDIS_URL: str = os.getenv("RATE_LIMIT_REDIS_URL", "")
+    # Uygulamanın önündeki güvenilen proxy sayısı; istemci IP'si X-Forwarded-For'dan buna göre alınır
+    RATE_LIMIT_PROXY_HOPS: int = int(os.getenv("RATE_LIMIT_PROXY_HOPS", 0))
+    
+    # Sorgu gözlemi: bu süreyi aşan sorgular loglanır (parametre değerleri gizlenir); bir istekte
+    # aynı sorgu bu kadar kez çalışırsa olası N+1 olarak uyarı verilir
+    DB_SLOW_QUERY_MS: int = int(os.getenv("DB_SLOW_QUERY_MS", 200))
+    DB_REPEATED_QUERY_THRESHOLD: int = int(os.getenv("DB_REPEATED_QUERY_THRESHOLD", 5))
+    
+    # Prometheus /metrics; token verilirse "Authorization: Bearer <token>" istenir
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_TOKEN: str = os.getenv("METRICS_TOKEN", "")
+    
+    # Kimlik doğrulama cache'i (çözülmüş JWT'ler ve oturum kullanıcısı)
+    AUTH_CACHE_TTL_SECONDS: int = int(os.getenv("AUTH_CACHE_TTL_SECONDS", 30))
+    AUTH_CACHE_MAX_ENTRIES: int = int(os.getenv("AUTH_CACHE_MAX_ENTRIES", 512))
+    
+    # bcrypt için ayrılmış iş parçacıkları ve bekleme kuyruğu (dolunca login ve şifre değişikliği 503 döner)
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", 2))
+    PASSWORD_HASH_QUEUE_SIZE: int = int(os.getenv("PASSWORD_HASH_QUEUE_SIZE", 8))
     
     class Config:
         case_sensitive = True
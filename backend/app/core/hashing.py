@@ -0,0 +1,121 @@
+"""
+Bounded executor for bcrypt.
+
+Hashing and verification run on a small dedicated thread pool (bcrypt
+releases the GIL) instead of the shared threadpool, so a burst of logins
+cannot starve other endpoints. At most ``workers + queue_size`` jobs are
+admitted at a time; further calls fail immediately with ``HasherBusy``.
+"""
+import asyncio
+import bisect
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.core.security import get_password_hash, verify_password
+
+# Histogram bucket upper bounds, in seconds (bcrypt cost 12 is ~0.25s per call)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class HasherBusy(Exception):
+    """Raised when the hashing queue is full."""
+
+
+class PasswordHasher:
+    def __init__(self, workers: int, queue_size: int):
+        self.workers = workers
+        self.max_pending = workers + queue_size
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._dummy_hash: Optional[str] = None
+        self.pending = 0
+        self.pending_max = 0
+        self.completed = 0
+        self.rejected = 0
+        self.seconds_total = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bcrypt")
+            return self._executor
+
+    def _timed(self, func: Callable, *args) -> Any:
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.completed += 1
+                self.seconds_total += elapsed
+                self.buckets[bisect.bisect_left(LATENCY_BUCKETS, elapsed)] += 1
+
+    async def _submit(self, func: Callable, *args) -> Any:
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise HasherBusy()
+            self.pending += 1
+            self.pending_max = max(self.pending_max, self.pending)
+        try:
+            future = self._get_executor().submit(self._timed, func, *args)
+        except BaseException:
+            self._release()
+            raise
+        # Yer, iş bitince (ya da başlamadan iptal edilince) boşalır; bekleyen istek iptal
+        # edilse bile çalışmakta olan bcrypt sayılmaya devam eder
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: Optional[Future] = None) -> None:
+        with self._lock:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(get_password_hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._submit(verify_password, password, hashed_password)
+
+    async def warm_up(self) -> None:
+        """Create the dummy hash up front so the first unknown-email login is not slower."""
+        if self._dummy_hash is None:
+            self._dummy_hash = await self.hash("dummy-password-for-timing")
+
+    async def verify_dummy(self, password: str) -> bool:
+        """Spend the same bcrypt time as a real check, so unknown emails are not distinguishable by timing."""
+        await self.warm_up()
+        await self.verify(password, self._dummy_hash)
+        return False
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> Dict[str, Any]:
+        histogram = {str(bound): count for bound, count in zip(LATENCY_BUCKETS, self.buckets)}
+        histogram["+Inf"] = self.buckets[-1]
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "pending_max": self.pending_max,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "seconds_avg": round(self.seconds_total / self.completed, 6) if self.completed else 0.0,
+            "latency_histogram": histogram,
+        }
+
+
+# Singleton instance
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    queue_size=settings.PASSWORD_HASH_QUEUE_SIZE,
+)
@@ -0,0 +1,195 @@
+"""
+Conditional GET support (ETag / Last-Modified) for public read endpoints.
+
+Every public table carries an in-process version number that is bumped when
+a commit touches it. Rendered response bodies are memoized per
+(endpoint key, table versions), so an unchanged collection is served from
+memory, and clients holding the current ETag get a bodiless 304.
+"""
+import hashlib
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import pydantic_core
+from fastapi import Request, Response
+from pydantic import BaseModel, TypeAdapter
+
+from app.core.cache import LRUCache
+from app.core.compression import strip_encoding
+from app.core.config import settings
+from app.db import changes
+
+
+class ContentVersions:
+    """Per-table version counters and last-change times for this process."""
+
+    def __init__(self):
+        self._versions: Dict[str, int] = {}
+        self._changed_at: Dict[str, datetime] = {}
+        self._started_at = datetime.now(timezone.utc).replace(microsecond=0)
+        self._lock = threading.Lock()
+
+    def bump(self, tables: Set[str]) -> None:
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+                self._changed_at[table] = now
+
+    def get(self, tables: Iterable[str]) -> Tuple[int, ...]:
+        return tuple(self._versions.get(table, 0) for table in sorted(tables))
+
+    def changed_at(self, tables: Iterable[str]) -> datetime:
+        return max((self._changed_at.get(table, self._started_at) for table in tables), default=self._started_at)
+
+
+@dataclass(frozen=True)
+class CachedBody:
+    """A serialized response body plus its validators."""
+
+    body: bytes
+    etag: str
+    last_modified: datetime
+    media_type: str = "application/json"
+    extra_headers: Dict[str, str] = field(default_factory=dict)
+
+    def headers(self) -> Dict[str, str]:
+        return {
+            "ETag": self.etag,
+            "Last-Modified": format_datetime(self.last_modified, usegmt=True),
+            "Cache-Control": cache_control(),
+            **self.extra_headers,
+        }
+
+
+def cache_control() -> str:
+    return (
+        f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, "
+        f"stale-while-revalidate={settings.HTTP_CACHE_STALE_WHILE_REVALIDATE}"
+    )
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+def to_jsonable(schema, data) -> Any:
+    """Validate ORM rows (or a single row) through a schema, once.
+
+    Returns model instances; ``render`` serializes them straight to JSON bytes
+    in pydantic-core, without building intermediate dicts.
+    """
+    if data is None:
+        return None
+    if isinstance(data, (list, tuple)):
+        return _list_adapter(schema).validate_python(data, from_attributes=True)
+    return schema.model_validate(data)
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _latest_timestamp(payload: Any) -> Optional[datetime]:
+    """Newest updated_at/created_at found in the top level of the payload."""
+    items = payload if isinstance(payload, list) else [payload]
+    latest = None
+    for item in items:
+        if isinstance(item, BaseModel):
+            item = item.__dict__
+        if not isinstance(item, dict):
+            continue
+        for key in ("updated_at", "created_at"):
+            stamp = _parse_timestamp(item.get(key))
+            if stamp and (latest is None or stamp > latest):
+                latest = stamp
+    return latest
+
+
+def render(payload: Any, tables: Iterable[str]) -> CachedBody:
+    """Serialize a payload (or take pre-serialized bytes) and compute validators."""
+    if isinstance(payload, bytes):
+        body = payload
+        data_modified = None
+    else:
+        body = pydantic_core.to_json(payload)
+        data_modified = _latest_timestamp(payload)
+    last_modified = versions.changed_at(tables)
+    if data_modified and data_modified > last_modified:
+        last_modified = data_modified
+    etag = '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+    return CachedBody(body=body, etag=etag, last_modified=last_modified.replace(microsecond=0))
+
+
+def etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison function; the ETag of a gzip/br
+    # representation (see app.core.compression) also validates the identity body
+    candidates = (candidate.strip().removeprefix("W/") for candidate in header.split(","))
+    return any(candidate == etag or strip_encoding(candidate) == etag for candidate in candidates)
+
+
+def is_not_modified(request: Request, entry: CachedBody) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, entry.etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return entry.last_modified <= since
+    return False
+
+
+def respond(request: Request, entry: CachedBody, headers: Optional[Dict[str, str]] = None) -> Response:
+    """Build a 200 or 304 response for a cached body."""
+    response_headers = {**entry.headers(), **(headers or {})}
+    if is_not_modified(request, entry):
+        return Response(status_code=304, headers=response_headers)
+    return Response(content=entry.body, media_type=entry.media_type, headers=response_headers)
+
+
+def json_response(payload: Any) -> Response:
+    """Uncached JSON response serialized by pydantic-core (authenticated endpoints)."""
+    return Response(content=pydantic_core.to_json(payload), media_type="application/json")
+
+
+async def cached_response(
+    request: Request,
+    *,
+    key: Tuple,
+    tables: Iterable[str],
+    build: Callable[[], Awaitable[Any]],
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """Serve a conditional response, rebuilding the body only when the tables changed."""
+    tables = tuple(tables)
+
+    async def load() -> CachedBody:
+        return render(await build(), tables)
+
+    entry = await _bodies.get_or_load((key, versions.get(tables)), load)
+    return respond(request, entry, headers)
+
+
+# Singleton instances
+versions = ContentVersions()
+changes.subscribe(versions.bump)
+_bodies = LRUCache(maxsize=settings.HTTP_CACHE_MAX_ENTRIES, ttl=settings.CACHE_TTL_SECONDS)
@@ -0,0 +1,81 @@
+"""
+Single-language projection of bilingual content.
+
+Models keep Turkish in ``x`` and English in ``x_en``. With ``?lang=tr`` or
+``?lang=en`` (``auto`` reads Accept-Language) public endpoints return only one
+of them under the plain key, falling back to Turkish when the English value
+is empty. Without ``lang`` both languages are returned as before.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+LANGUAGES = ("tr", "en")
+DEFAULT_LANGUAGE = "tr"
+SUFFIX = "_en"
+
+
+@dataclass(frozen=True)
+class Locale:
+    lang: Optional[str] = None  # None: iki dil birlikte
+    negotiated: bool = False  # Accept-Language'den seçildi
+
+    @property
+    def key(self) -> Tuple:
+        return ("lang", self.lang)
+
+    def headers(self) -> Dict[str, str]:
+        headers = {"Content-Language": self.lang} if self.lang else {}
+        if self.negotiated:
+            headers["Vary"] = "Accept-Language"
+        return headers
+
+
+def negotiate(accept_language: Optional[str]) -> str:
+    """Best of LANGUAGES by Accept-Language q-value; Turkish if none matches."""
+    best, best_weight = DEFAULT_LANGUAGE, 0.0
+    for part in (accept_language or "").split(","):
+        tag, _, params = part.strip().partition(";")
+        primary = tag.strip().lower().split("-")[0]
+        if primary not in LANGUAGES:
+            continue
+        weight = 1.0
+        params = params.strip().replace(" ", "")
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        if weight > best_weight:
+            best, best_weight = primary, weight
+    return best
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == []
+
+
+def localize(data: Any, lang: Optional[str]) -> Any:
+    """Project a payload (models, dicts, lists; nested) onto one language.
+
+    Returns new objects; cached rows passed in are never modified.
+    """
+    if lang is None:
+        return data
+    if isinstance(data, BaseModel):
+        data = data.model_dump()
+    if isinstance(data, list):
+        return [localize(item, lang) for item in data]
+    if not isinstance(data, dict):
+        return data
+    result = {}
+    for key, value in data.items():
+        if key.endswith(SUFFIX) and key[: -len(SUFFIX)] in data:
+            continue
+        if lang != DEFAULT_LANGUAGE:
+            translated = data.get(key + SUFFIX)
+            if not _is_empty(translated):
+                value = translated
+        result[key] = localize(value, lang) if isinstance(value, (dict, list, BaseModel)) else value
+    return result
@@ -0,0 +1,132 @@
+"""
+Responsive image variants for uploaded images.
+
+Each uploaded JPEG/PNG/WebP gets WebP copies at IMAGE_VARIANT_WIDTHS (never
+upscaled) stored next to the original as ``<name>_<width>w.webp``, plus a tiny
+blurred WebP placeholder returned as a data URI. Resizing is CPU-bound, so it
+runs in a process pool instead of on the event loop.
+"""
+import asyncio
+import base64
+import io
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, UploadFile
+from PIL import Image
+
+from app.core.config import settings
+from app.core.storage import storage
+
+# GIF'ler (animasyon) ve PDF'ler olduğu gibi saklanır
+VARIANT_EXTENSIONS = ("jpg", "jpeg", "png", "webp")
+
+PLACEHOLDER_WIDTH = 16
+
+
+def render_variants(data: bytes, widths: Tuple[int, ...], quality: int) -> Dict[str, Any]:
+    """Resize to each width as WebP and build a blur placeholder. Runs in a worker process."""
+    from PIL import ImageFilter, ImageOps
+
+    with Image.open(io.BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source)
+        image = image.convert("RGBA" if "A" in image.getbands() else "RGB")
+
+    variants: Dict[int, bytes] = {}
+    for width in sorted(widths):
+        target = min(width, image.width)
+        if target in variants:
+            break
+        height = max(1, round(image.height * target / image.width))
+        buffer = io.BytesIO()
+        image.resize((target, height), Image.LANCZOS).save(buffer, "WEBP", quality=quality, method=4)
+        variants[target] = buffer.getvalue()
+
+    height = max(1, round(image.height * PLACEHOLDER_WIDTH / image.width))
+    placeholder = image.resize((PLACEHOLDER_WIDTH, height), Image.BILINEAR).filter(ImageFilter.GaussianBlur(1))
+    buffer = io.BytesIO()
+    placeholder.save(buffer, "WEBP", quality=40)
+    return {
+        "variants": variants,
+        "placeholder": "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode(),
+    }
+
+
+class ImageProcessor:
+    def __init__(self, workers: int, widths: List[int], quality: int):
+        self.workers = workers
+        self.widths = tuple(widths)
+        self.quality = quality
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn: uygulama çok iş parçacıklı, fork ile kilitler kopyalanmasın
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    async def render(self, data: bytes) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        try:
+            return await loop.run_in_executor(executor, render_variants, data, self.widths, self.quality)
+        except BrokenProcessPool:
+            # Bir işçi çöktüyse (ör. bellek) sonraki istek yeni havuz açsın
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            raise
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Singleton instance
+image_processor = ImageProcessor(
+    workers=settings.IMAGE_WORKERS,
+    widths=[int(width) for width in settings.IMAGE_VARIANT_WIDTHS.split(",") if width.strip()],
+    quality=settings.IMAGE_QUALITY,
+)
+
+
+async def upload_image(file: UploadFile, folder: str, allowed_extensions: list) -> Dict[str, Any]:
+    """
+    Upload the original, then its WebP variants next to it.
+
+    Returns:
+        {"image_url", "image_variants": {"<width>": url}, "image_placeholder"}
+    """
+    public_url, file_path = await storage.upload_file(
+        file=file, folder=folder, allowed_extensions=allowed_extensions
+    )
+    result = {"image_url": public_url, "image_variants": {}, "image_placeholder": None}
+    stem, _, extension = file_path.rpartition(".")
+    if extension not in VARIANT_EXTENSIONS:
+        return result
+
+    await file.seek(0)
+    try:
+        rendered = await image_processor.render(await file.read())
+    except (OSError, ValueError, Image.DecompressionBombError):
+        # Uzantı doğru ama içerik görsel değil (veya bozuk / aşırı büyük)
+        await storage.delete_file(file_path)
+        raise HTTPException(status_code=400, detail="Geçersiz veya bozuk görsel dosyası")
+
+    widths = list(rendered["variants"])
+    urls = await asyncio.gather(*(
+        storage.upload_bytes(f"{stem}_{width}w.webp", rendered["variants"][width], "image/webp")
+        for width in widths
+    ))
+    result["image_variants"] = {str(width): url for width, url in zip(widths, urls)}
+    result["image_placeholder"] = rendered["placeholder"]
+    return result
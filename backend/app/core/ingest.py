@@ -0,0 +1,309 @@
+"""
+Write-behind queue for contact-form messages.
+
+``submit`` adds the message to an in-memory queue and hands it to a writer
+thread, then waits until that thread has appended it to a local spool file
+and fsynced it; only then does the POST answer 202. The writer drains every
+append waiting for it and fsyncs once per round (group commit), so a burst
+of submissions costs one fsync per round rather than per message, and no
+file I/O runs on the event loop. A background task inserts queued messages
+in multi-row batches when MESSAGE_BATCH_SIZE is reached or every
+MESSAGE_FLUSH_INTERVAL_MS, and then has the writer rewrite the spool
+(temp file, fsync, rename) with whatever is still pending.
+
+Every worker process has its own spool (``messages-<pid>.jsonl``). On startup
+spools left behind by processes that are no longer running are claimed and
+replayed, so every accepted message survives restarts, crashes and power
+loss. Delivery is at-least-once: a crash between the commit and the spool
+rewrite replays the last batch. When MESSAGE_QUEUE_MAX_SIZE messages are
+pending, ``submit`` raises ``QueueFull``; if the spool cannot be written it
+raises ``SpoolError``. The endpoint answers 503 in both cases.
+"""
+import asyncio
+import glob
+import json
+import logging
+import os
+import queue
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from app import crud
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+SPOOL_PREFIX = "messages-"
+SPOOL_SUFFIX = ".jsonl"
+
+# Veritabanı hatasında tekrar denemeden önce beklenecek en uzun süre (saniye)
+MAX_RETRY_DELAY = 30.0
+
+
+class QueueFull(Exception):
+    """Raised when too many messages are waiting to be written."""
+
+
+class SpoolError(Exception):
+    """Raised when a message could not be made durable in the spool."""
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class MessageQueue:
+    def __init__(self, spool_dir: str, max_size: int, batch_size: int, flush_interval: float):
+        self.spool_dir = spool_dir
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: List[Dict[str, Any]] = []
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._writes: "queue.SimpleQueue[Optional[Tuple[str, Any]]]" = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.accepted = 0
+        self.rejected = 0
+        self.written = 0
+        self.batches = 0
+        self.failures = 0
+
+    @property
+    def spool_path(self) -> str:
+        return os.path.join(self.spool_dir, f"{SPOOL_PREFIX}{os.getpid()}{SPOOL_SUFFIX}")
+
+    async def start(self) -> None:
+        os.makedirs(self.spool_dir, exist_ok=True)
+        self._pending = self._read(self.spool_path) + self._claim_orphans()
+        await run_in_threadpool(self._replace_spool, list(self._pending))
+        self._loop = asyncio.get_running_loop()
+        self._writer = threading.Thread(target=self._write_loop, name="message-spool", daemon=True)
+        self._writer.start()
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        if self._pending:
+            self._wakeup.set()
+
+    async def stop(self) -> None:
+        """Stop the flusher and try one last flush; anything left stays in the spool."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        while self._pending:
+            if not await self._flush():
+                break
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            self._writes.put(None)
+            await run_in_threadpool(writer.join)
+
+    async def submit(self, message: Dict[str, Any]) -> None:
+        """Enqueue a message and return once it is fsynced to the spool."""
+        record = {**message, "created_at": datetime.now(timezone.utc).isoformat()}
+        if len(self._pending) >= self.max_size:
+            self.rejected += 1
+            raise QueueFull()
+        # Kuyruğa ve yazma sırasına aynı adımda girer: sonradan istenen her spool yeniden yazımı bu kaydı içerir
+        self._pending.append(record)
+        durable = self._loop.create_future()
+        self._writes.put(("append", (record, durable)))
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+        try:
+            await durable
+        except OSError as exc:
+            # Kalıcı hale gelmedi: istemci 503 alıp tekrar deneyecek, kayıt kuyruktan çıkarılır
+            for index, pending in enumerate(self._pending):
+                if pending is record:
+                    del self._pending[index]
+                    break
+            raise SpoolError() from exc
+        self.accepted += 1
+
+    async def _run(self) -> None:
+        delay = self.flush_interval
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            if not self._pending:
+                continue
+            if await self._flush():
+                delay = self.flush_interval
+                if len(self._pending) >= self.batch_size:
+                    self._wakeup.set()
+            else:
+                # Veritabanı erişilemiyor; mesajlar kuyrukta ve spool'da bekler
+                delay = min(delay * 2, MAX_RETRY_DELAY)
+
+    async def _flush(self) -> bool:
+        batch = self._pending[: self.batch_size]
+        rows = [
+            {
+                "sender_name": record.get("sender_name"),
+                "sender_email": record.get("sender_email"),
+                "subject": record.get("subject"),
+                "content": record.get("content"),
+                "is_read": False,
+                "created_at": datetime.fromisoformat(record["created_at"]),
+            }
+            for record in batch
+        ]
+        try:
+            async with AsyncSessionLocal() as db:
+                await crud.message.create_many(db, rows=rows)
+        except Exception:
+            self.failures += 1
+            logger.exception("Mesaj kuyruğu veritabanına yazılamadı (%d mesaj bekliyor)", len(self._pending))
+            return False
+        # Yazılan kısım çıkarılır; INSERT sürerken gelen mesajlar kuyrukta kalır
+        del self._pending[: len(batch)]
+        # Anlık kopya: sonradan gelen mesajların "append" işleri bu işten sonra sıraya girer
+        self._writes.put(("rewrite", list(self._pending)))
+        self.written += len(batch)
+        self.batches += 1
+        return True
+
+    @staticmethod
+    def _read(path: str) -> List[Dict[str, Any]]:
+        records = []
+        try:
+            with open(path, encoding="utf-8") as spool:
+                for line in spool:
+                    try:
+                        records.append(json.loads(line))
+                    except ValueError:
+                        # Çökme anında yarım kalmış son satır
+                        continue
+        except FileNotFoundError:
+            pass
+        return records
+
+    def _claim_orphans(self) -> List[Dict[str, Any]]:
+        records = []
+        for path in glob.glob(os.path.join(self.spool_dir, f"{SPOOL_PREFIX}*{SPOOL_SUFFIX}")):
+            try:
+                pid = int(os.path.basename(path)[len(SPOOL_PREFIX): -len(SPOOL_SUFFIX)])
+            except ValueError:
+                continue
+            if pid == os.getpid() or _pid_alive(pid):
+                continue
+            # rename atomik: aynı anda açılan iki işçiden yalnızca biri sahiplenir
+            claimed = f"{path}.claimed-{os.getpid()}"
+            try:
+                os.rename(path, claimed)
+            except FileNotFoundError:
+                continue
+            records.extend(self._read(claimed))
+            os.remove(claimed)
+        return records
+
+    def _replace_spool(self, records: List[Dict[str, Any]]) -> None:
+        """Replace the spool with records (write to temp, fsync, rename)."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.spool_dir, prefix=".spool-")
+        with os.fdopen(fd, "w", encoding="utf-8") as spool:
+            for record in records:
+                spool.write(json.dumps(record, ensure_ascii=False) + "\n")
+            spool.flush()
+            os.fsync(spool.fileno())
+        os.replace(tmp_path, self.spool_path)
+
+    def _resolve(self, future: asyncio.Future, error: Optional[OSError]) -> None:
+        # Event loop üzerinde çalışır; istek iptal edildiyse future zaten kapanmıştır
+        if future.done():
+            return
+        if error is None:
+            future.set_result(None)
+        else:
+            future.set_exception(error)
+
+    def _write_loop(self) -> None:
+        """Writer thread: applies spool operations in submission order until stop() sends None.
+
+        Each round drains all queued operations, then flushes and fsyncs once
+        before acknowledging the appends it wrote.
+        """
+        spool = open(self.spool_path, "a", encoding="utf-8")
+        try:
+            stopping = False
+            while not stopping:
+                operations = [self._writes.get()]
+                while True:
+                    try:
+                        operations.append(self._writes.get_nowait())
+                    except queue.Empty:
+                        break
+                waiting: List[Tuple[asyncio.Future, Optional[OSError]]] = []
+                for operation in operations:
+                    if operation is None:
+                        # Kalan işler yine de yazılır ve onaylanır
+                        stopping = True
+                        continue
+                    kind, payload = operation
+                    try:
+                        if kind == "append":
+                            record, durable = payload
+                            spool.write(json.dumps(record, ensure_ascii=False) + "\n")
+                            waiting.append((durable, None))
+                        else:
+                            # Yeniden yazım kendi fsync'ini yapar; önceki eklemeler ya bu kopyada ya da veritabanındadır
+                            spool.close()
+                            self._replace_spool(payload)
+                            spool = open(self.spool_path, "a", encoding="utf-8")
+                    except OSError as exc:
+                        logger.exception("Mesaj spool dosyasına yazılamadı")
+                        if kind == "append":
+                            waiting.append((payload[1], exc))
+                        if spool.closed:
+                            spool = open(self.spool_path, "a", encoding="utf-8")
+                error: Optional[OSError] = None
+                try:
+                    spool.flush()
+                    os.fsync(spool.fileno())
+                except OSError as exc:
+                    logger.exception("Mesaj spool dosyası diske yazılamadı")
+                    error = exc
+                for durable, failure in waiting:
+                    self._loop.call_soon_threadsafe(self._resolve, durable, failure or error)
+        finally:
+            spool.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": len(self._pending),
+            "max_size": self.max_size,
+            "batch_size": self.batch_size,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "written": self.written,
+            "batches": self.batches,
+            "failures": self.failures,
+        }
+
+
+# Singleton instance
+message_queue = MessageQueue(
+    spool_dir=settings.MESSAGE_SPOOL_DIR,
+    max_size=settings.MESSAGE_QUEUE_MAX_SIZE,
+    batch_size=settings.MESSAGE_BATCH_SIZE,
+    flush_interval=settings.MESSAGE_FLUSH_INTERVAL_MS / 1000,
+)
@@ -0,0 +1,298 @@
+"""
+Prometheus metrics without a client library.
+
+Counters, gauges and histograms keep one cell per thread: the hot path
+updates a thread-local dict without taking a lock, and a scrape sums the
+cells of all threads. A scrape may miss an update that is in progress on
+another thread; the next one includes it. Only the first update of a
+metric on a new thread registers that thread's cells under a lock.
+
+``render()`` returns the text exposition format (version 0.0.4) for
+``GET /metrics``. Collectors registered with ``registry.collector`` add
+values that are computed at scrape time (cache ratios, pool checkouts).
+"""
+import bisect
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.core.cache import caches
+from app.db import pool, queries
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Saniye cinsinden üst sınırlar
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._local = threading.local()
+        self._threads: List[Dict[Labels, object]] = []
+        self._register_lock = threading.Lock()
+
+    def _cells(self) -> Dict[Labels, object]:
+        try:
+            return self._local.cells
+        except AttributeError:
+            cells = self._local.cells = {}
+            with self._register_lock:
+                self._threads.append(cells)
+            return cells
+
+    def _snapshots(self) -> List[Dict[Labels, object]]:
+        with self._register_lock:
+            threads = list(self._threads)
+        # dict() kopyası GIL altında tek adımda alınır; sahibi olan thread yazmaya devam edebilir
+        return [dict(cells) for cells in threads]
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}", *self.samples()]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        cells = self._cells()
+        cells[labels] = cells.get(labels, 0) + amount
+
+    def totals(self) -> Dict[Labels, float]:
+        totals: Dict[Labels, float] = {}
+        for cells in self._snapshots():
+            for labels, value in cells.items():
+                totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self.totals().items())
+        ]
+
+
+class Gauge(Counter):
+    """Up/down value kept as per-thread deltas (e.g. requests in flight)."""
+
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, *labels: str) -> None:
+        cells = self._cells()
+        cell = cells.get(labels)
+        if cell is None:
+            # [kova sayıları..., +Inf, toplam]
+            cell = cells[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        cell[bisect.bisect_left(self.buckets, value)] += 1
+        cell[-1] += value
+
+    def samples(self) -> List[str]:
+        merged: Dict[Labels, List[float]] = {}
+        for cells in self._snapshots():
+            for labels, cell in cells.items():
+                cell = list(cell)
+                total = merged.setdefault(labels, [0] * len(cell))
+                for index, value in enumerate(cell):
+                    total[index] += value
+        return render_histogram(self.name, self.labelnames, self.buckets, merged)
+
+
+def render_histogram(
+    name: str, labelnames: Tuple[str, ...], buckets: Tuple[float, ...], series: Dict[Labels, List[float]]
+) -> List[str]:
+    """Histogram samples from per-bucket (non-cumulative) counts plus a trailing sum."""
+    lines = []
+    for labels, cell in sorted(series.items()):
+        cumulative = 0
+        for bound, count in zip((*buckets, float("inf")), cell[:-1]):
+            cumulative += count
+            le = f'le="{_format_value(bound)}"'
+            lines.append(f"{name}_bucket{_format_labels(labelnames, labels, le)} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labelnames, labels)} {_format_value(cell[-1])}")
+        lines.append(f"{name}_count{_format_labels(labelnames, labels)} {cumulative}")
+    return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], List[str]]] = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def collector(self, func: Callable[[], List[str]]) -> Callable[[], List[str]]:
+        """Register a function returning exposition lines computed at scrape time."""
+        self._collectors.append(func)
+        return func
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+def gauge_lines(name: str, documentation: str, labelnames: Tuple[str, ...], values: Dict[Labels, float], kind: str = "gauge") -> List[str]:
+    """Exposition lines for a value read at scrape time."""
+    return [
+        f"# HELP {name} {documentation}",
+        f"# TYPE {name} {kind}",
+        *(f"{name}{_format_labels(labelnames, labels)} {_format_value(value)}" for labels, value in sorted(values.items())),
+    ]
+
+
+def _route_label(scope) -> str:
+    """Full route template (``/api/v1/resources/blog/{slug}``) so label cardinality stays bounded."""
+    route = scope.get("route")
+    if route is None:
+        root_path = scope.get("root_path", "")
+        # Mount edilmiş uygulamalar (/uploads) tek etikette toplanır
+        if root_path and root_path != scope.get("app_root_path", ""):
+            return root_path + "/{path}"
+        return "unmatched"
+    # Dahil edilen router'ların route'ları yolu prefix olmadan taşır; prefix, route'un eşleştiği
+    # son parçanın önünde kalan kısımdır
+    path = scope["path"]
+    for index in range(len(path) - 1, -1, -1):
+        if path[index] == "/" and route.path_regex.match(path[index:]):
+            return path[:index] + route.path
+    return route.path
+
+
+class MetricsMiddleware:
+    """Counts requests, latency, response size and DB queries per route template."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        status = 500
+        content_length: Optional[int] = None
+        body_bytes = 0
+
+        async def send_wrapper(message) -> None:
+            nonlocal status, content_length, body_bytes
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                for name, value in message.get("headers", ()):
+                    if name.lower() == b"content-length":
+                        content_length = int(value)
+            elif message["type"] == "http.response.body":
+                body_bytes += len(message.get("body", b""))
+            await send(message)
+
+        http_requests_in_flight.inc()
+        try:
+            with queries.track() as tracker:
+                await self.app(scope, receive, send_wrapper)
+        finally:
+            http_requests_in_flight.dec()
+            method, route = scope["method"], _route_label(scope)
+            http_requests_total.inc(method, route, str(status))
+            http_request_duration_seconds.observe(time.perf_counter() - start, method, route)
+            # pathsend / zerocopysend gövdeyi mesajla taşımaz; boyut Content-Length'ten alınır
+            http_response_size_bytes.observe(content_length if content_length is not None else body_bytes, method, route)
+            db_queries_per_request.observe(tracker.count, method, route)
+
+
+registry = Registry()
+
+http_requests_total = registry.register(
+    Counter("http_requests_total", "HTTP requests by route template and status.", ("method", "route", "status"))
+)
+http_request_duration_seconds = registry.register(
+    Histogram("http_request_duration_seconds", "Time to produce the full response.", ("method", "route"))
+)
+http_requests_in_flight = registry.register(Gauge("http_requests_in_flight", "Requests currently being served."))
+http_response_size_bytes = registry.register(
+    Histogram("http_response_size_bytes", "Response body size on the wire.", ("method", "route"), buckets=SIZE_BUCKETS)
+)
+db_queries_per_request = registry.register(
+    Histogram("db_queries_per_request", "SQL statements executed per request.", ("method", "route"), buckets=COUNT_BUCKETS)
+)
+storage_operation_seconds = registry.register(
+    Histogram("storage_operation_seconds", "Object storage call latency.", ("backend", "operation"))
+)
+
+
+@registry.collector
+def _cache_samples() -> List[str]:
+    stats = {name: values for name, values in caches.stats().items() if values}
+    lines = []
+    for field, kind, documentation in (
+        ("hits", "counter", "Cache lookups served from memory."),
+        ("misses", "counter", "Cache lookups that went to the loader."),
+        ("evictions", "counter", "Entries dropped to stay under maxsize."),
+        ("size", "gauge", "Entries currently cached."),
+        ("hit_ratio", "gauge", "hits / (hits + misses) since startup."),
+    ):
+        suffix = "_total" if kind == "counter" else ""
+        values = {(name,): namespace[field] for name, namespace in stats.items()}
+        lines.extend(gauge_lines(f"cache_{field}{suffix}", documentation, ("namespace",), values, kind=kind))
+    return lines
+
+
+@registry.collector
+def _pool_samples() -> List[str]:
+    series = {}
+    timeouts = {}
+    for name, stats in pool.all_stats().items():
+        series[(name,)] = [*stats.buckets, stats.wait_seconds_total]
+        timeouts[(name,)] = stats.timeouts
+    return [
+        "# HELP db_pool_checkout_seconds Connection checkout time (queue wait, connect and pre-ping).",
+        "# TYPE db_pool_checkout_seconds histogram",
+        *render_histogram("db_pool_checkout_seconds", ("pool",), pool.LATENCY_BUCKETS, series),
+        *gauge_lines("db_pool_checkout_timeouts_total", "Checkouts that hit pool_timeout.", ("pool",), timeouts, kind="counter"),
+    ]
+
+
+def render() -> str:
+    return registry.render()
@@ -0,0 +1,39 @@
+"""
+Per-request database profile.
+
+``QueryProfilerMiddleware`` tracks the SQL run for each request (see
+``app.db.queries``). Outside production it adds ``X-DB-Queries`` and a
+``Server-Timing: db;dur=...`` entry to the response, which browser dev tools
+show next to the request. In every environment it logs statements that
+repeat within one request often enough to look like an N+1 loop.
+"""
+from starlette.datastructures import MutableHeaders
+
+from app.db import queries
+
+
+class QueryProfilerMiddleware:
+    def __init__(self, app, expose_headers: bool = False):
+        self.app = app
+        self.expose_headers = expose_headers
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # MetricsMiddleware dışarıda bir izleyici açtıysa aynı izleyici paylaşılır
+        with queries.track() as tracker:
+
+            async def send_wrapper(message) -> None:
+                if message["type"] == "http.response.start" and self.expose_headers:
+                    # Yanıt başlamadan önce çalışan sorgular; akış yanıtlarında sonrakiler sayılmaz
+                    headers = MutableHeaders(scope=message)
+                    headers["X-DB-Queries"] = str(tracker.count)
+                    headers.append("Server-Timing", f'db;dur={tracker.seconds * 1000:.1f};desc="{tracker.count} queries"')
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                queries.report_repeats(tracker, f"{scope['method']} {scope['path']}")
@@ -0,0 +1,240 @@
+"""
+Token-bucket rate limiting for the login and contact-form endpoints.
+
+Each rule has a per-client bucket (keyed by IP) and an optional route-wide
+bucket shared by all clients. Limits are written as ``"<count>/<period>"``
+(e.g. ``"10/minute"``): up to ``count`` requests in a burst, refilled at
+``count`` per period. The check runs as ASGI middleware, before routing, so
+a rejected request never opens a database session or hashes a password; it
+gets 429 with ``Retry-After``.
+
+Buckets live in memory per worker, split across shards; all access happens
+on the event loop thread, so no locks are taken. A bucket that has refilled
+completely carries no state and is evicted by a periodic per-shard sweep.
+With RATE_LIMIT_REDIS_URL set (and the ``redis`` package installed) buckets
+are kept in Redis instead, so limits hold across workers; if Redis is
+unreachable the in-memory buckets are used.
+"""
+import json
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from starlette.datastructures import Headers
+
+from app.core.config import settings
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # redis isteğe bağlı; yoksa her işçi kendi sayaçlarını tutar
+    redis = None
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+SHARDS = 16
+# Bir shard en fazla bu sıklıkta taranır (saniye)
+SWEEP_INTERVAL = 60.0
+
+# Redis tarafında atomik token bucket; saat Redis'ten alınır, işçiler arası kayma olmaz
+_REDIS_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+else
+    wait = (1 - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((burst - tokens) / rate * 1000) + 1000)
+return tostring(wait)
+"""
+
+
+@dataclass(frozen=True)
+class Limit:
+    burst: int
+    rate: float  # saniyede eklenen token
+
+    @classmethod
+    def parse(cls, spec: str) -> Optional["Limit"]:
+        """``"10/minute"`` -> Limit(10, 10/60); an empty spec disables the bucket."""
+        spec = spec.strip()
+        if not spec:
+            return None
+        count, _, period = spec.partition("/")
+        seconds = PERIODS.get(period.strip().lower())
+        if seconds is None or not count.strip().isdigit() or int(count) < 1:
+            raise ValueError(f"Invalid rate limit {spec!r}, expected e.g. '10/minute'")
+        return cls(burst=int(count), rate=int(count) / seconds)
+
+
+@dataclass(frozen=True)
+class Rule:
+    name: str
+    method: str
+    path: str
+    per_client: Optional[Limit]
+    per_route: Optional[Limit]
+
+
+class MemoryBuckets:
+    """Sharded in-memory buckets: key -> (tokens, updated_at, full_at)."""
+
+    def __init__(self, shards: int = SHARDS):
+        self._shards: List[Dict[Tuple, Tuple[float, float, float]]] = [{} for _ in range(shards)]
+        self._swept = [0.0] * shards
+
+    def acquire(self, key: Tuple, limit: Limit, now: float) -> float:
+        """Take one token; returns 0 if allowed, else seconds until one is available."""
+        index = hash(key) % len(self._shards)
+        shard = self._shards[index]
+        tokens, updated_at, _ = shard.get(key, (limit.burst, now, now))
+        tokens = min(limit.burst, tokens + (now - updated_at) * limit.rate)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / limit.rate
+        shard[key] = (tokens, now, now + (limit.burst - tokens) / limit.rate)
+        if now - self._swept[index] >= SWEEP_INTERVAL:
+            self._sweep(index, now)
+        return wait
+
+    def _sweep(self, index: int, now: float) -> None:
+        # Tamamen dolmuş bir kova yeni bir kovayla aynıdır; silmek davranışı değiştirmez
+        shard = self._shards[index]
+        for key in [key for key, (_, _, full_at) in shard.items() if full_at <= now]:
+            del shard[key]
+        self._swept[index] = now
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+
+class RateLimiter:
+    def __init__(self, rules: List[Rule], redis_url: str = "", proxy_hops: int = 0):
+        self.rules = {(rule.method, rule.path): rule for rule in rules}
+        self.proxy_hops = proxy_hops
+        self.memory = MemoryBuckets()
+        self._redis = redis.from_url(redis_url) if redis is not None and redis_url else None
+        self._script = None
+        self.allowed: Dict[str, int] = {rule.name: 0 for rule in rules}
+        self.rejected: Dict[str, int] = {rule.name: 0 for rule in rules}
+        self.redis_errors = 0
+
+    def match(self, scope) -> Optional[Rule]:
+        return self.rules.get((scope["method"], scope["path"]))
+
+    def client_ip(self, scope) -> str:
+        if self.proxy_hops:
+            # Güvenilen proxy'lerin eklediği son N adres atlanır; öncesi istemcinin beyanıdır
+            forwarded = Headers(scope=scope).get("x-forwarded-for")
+            if forwarded:
+                hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+                if len(hops) >= self.proxy_hops:
+                    return hops[-self.proxy_hops]
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+
+    async def _acquire(self, key: Tuple, limit: Limit) -> float:
+        if self._redis is not None:
+            try:
+                if self._script is None:
+                    self._script = self._redis.register_script(_REDIS_SCRIPT)
+                redis_key = "ratelimit:" + ":".join(str(part) for part in key)
+                return float(await self._script(keys=[redis_key], args=[limit.rate, limit.burst]))
+            except Exception:
+                # Redis erişilemiyorsa sınır işçi başına uygulanmaya devam eder
+                self.redis_errors += 1
+        return self.memory.acquire(key, limit, time.monotonic())
+
+    async def check(self, rule: Rule, ip: str) -> float:
+        """0 if the request may proceed, else the Retry-After in seconds."""
+        wait = 0.0
+        if rule.per_client is not None:
+            wait = await self._acquire((rule.name, ip), rule.per_client)
+        if not wait and rule.per_route is not None:
+            wait = await self._acquire((rule.name, "*"), rule.per_route)
+        if wait:
+            self.rejected[rule.name] += 1
+        else:
+            self.allowed[rule.name] += 1
+        return wait
+
+    async def aclose(self) -> None:
+        if self._redis is not None:
+            await self._redis.aclose()
+
+    def stats(self) -> Dict:
+        return {
+            "backend": "redis" if self._redis is not None else "memory",
+            "rules": {
+                rule.name: {
+                    "method": rule.method,
+                    "path": rule.path,
+                    "allowed": self.allowed[rule.name],
+                    "rejected": self.rejected[rule.name],
+                }
+                for rule in self.rules.values()
+            },
+            "memory_buckets": len(self.memory),
+            "redis_errors": self.redis_errors,
+        }
+
+
+class RateLimitMiddleware:
+    def __init__(self, app, limiter: "RateLimiter", enabled: bool = True):
+        self.app = app
+        self.limiter = limiter
+        self.enabled = enabled
+
+    async def __call__(self, scope, receive, send) -> None:
+        rule = self.limiter.match(scope) if self.enabled and scope["type"] == "http" else None
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+        wait = await self.limiter.check(rule, self.limiter.client_ip(scope))
+        if not wait:
+            await self.app(scope, receive, send)
+            return
+        retry_after = str(max(1, int(wait + 0.999)))
+        body = json.dumps(
+            {"detail": f"Çok fazla istek, lütfen {retry_after} saniye sonra tekrar deneyin"},
+            ensure_ascii=False,
+        ).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", retry_after.encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+# Singleton instance
+rate_limiter = RateLimiter(
+    rules=[
+        Rule(
+            "login", "POST", f"{settings.API_V1_STR}/auth/login",
+            per_client=Limit.parse(settings.RATE_LIMIT_LOGIN),
+            per_route=Limit.parse(settings.RATE_LIMIT_LOGIN_GLOBAL),
+        ),
+        Rule(
+            "messages", "POST", f"{settings.API_V1_STR}/resources/messages",
+            per_client=Limit.parse(settings.RATE_LIMIT_MESSAGES),
+            per_route=Limit.parse(settings.RATE_LIMIT_MESSAGES_GLOBAL),
+        ),
+    ],
+    redis_url=settings.RATE_LIMIT_REDIS_URL,
+    proxy_hops=settings.RATE_LIMIT_PROXY_HOPS,
+)
@@ -0,0 +1,112 @@
+"""
+Server-side Markdown rendering for blog posts.
+
+Post bodies are rendered to HTML with markdown-it (CommonMark + tables and
+strikethrough, raw HTML disabled), then sanitized with nh3 as a second line
+of defence. Headings get stable ids for the table of contents. Results are
+cached per (post id, updated_at, language), so a post is rendered once per
+edit instead of on every page view.
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+import nh3
+from markdown_it import MarkdownIt
+from starlette.concurrency import run_in_threadpool
+
+from app.core.cache import MISS, LRUCache, caches
+from app.core.config import settings
+from app.core.search import tokenize
+
+WORDS_PER_MINUTE = 200
+TOC_LEVELS = (1, 2, 3)
+
+ALLOWED_TAGS = {
+    "h1", "h2", "h3", "h4", "h5", "h6", "p", "br", "hr", "blockquote",
+    "ul", "ol", "li", "strong", "em", "s", "del", "code", "pre", "a", "img",
+    "table", "thead", "tbody", "tr", "th", "td",
+}
+ALLOWED_ATTRIBUTES = {
+    "h1": {"id"}, "h2": {"id"}, "h3": {"id"}, "h4": {"id"}, "h5": {"id"}, "h6": {"id"},
+    "a": {"href", "title"},
+    "img": {"src", "alt", "title"},
+    "code": {"class"},
+    "ol": {"start"},
+    "th": {"style"},
+    "td": {"style"},
+}
+
+_WORD_RE = re.compile(r"\w+")
+
+_markdown = MarkdownIt("commonmark", {"html": False}).enable(["table", "strikethrough"])
+
+
+def _heading_id(title: str, used: Dict[str, int]) -> str:
+    base = "-".join(tokenize(title)) or "bolum"
+    count = used.get(base, 0)
+    used[base] = count + 1
+    return base if count == 0 else f"{base}-{count}"
+
+
+def render_markdown(source: str) -> Dict[str, Any]:
+    """Render Markdown to sanitized HTML; returns {"html", "toc", "reading_time"}."""
+    tokens = _markdown.parse(source)
+    toc: List[Dict[str, Any]] = []
+    used: Dict[str, int] = {}
+    words = 0
+    for index, token in enumerate(tokens):
+        if token.type == "inline":
+            words += len(_WORD_RE.findall(token.content))
+        if token.type != "heading_open":
+            continue
+        title = tokens[index + 1].content
+        heading_id = _heading_id(title, used)
+        token.attrSet("id", heading_id)
+        level = int(token.tag[1])
+        if level in TOC_LEVELS:
+            toc.append({"level": level, "id": heading_id, "title": title})
+
+    html = _markdown.renderer.render(tokens, _markdown.options, {})
+    html = nh3.clean(
+        html,
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        url_schemes={"http", "https", "mailto"},
+        link_rel="noopener noreferrer nofollow",
+    )
+    return {
+        "html": html,
+        "toc": toc,
+        "reading_time": max(1, round(words / WORDS_PER_MINUTE)),
+    }
+
+
+async def render_cached(key: tuple, source: Optional[str]) -> Optional[Dict[str, Any]]:
+    if not source:
+        return None
+    # Aynı saniye içindeki iki düzenleme updated_at'i değiştirmeyebilir; içerik özeti de anahtarda
+    cache_key = (*key, hash(source))
+    rendered = _rendered.get(cache_key)
+    if rendered is MISS:
+        # Uzun yazılar event loop'u bloklamasın
+        rendered = await run_in_threadpool(render_markdown, source)
+        _rendered.set(cache_key, rendered)
+    return rendered
+
+
+async def render_post(post) -> Dict[str, Any]:
+    """Rendered fields for schemas.BlogPostDetail, in both languages."""
+    fields: Dict[str, Any] = {}
+    for lang, source, suffix in (("tr", post.content, ""), ("en", post.content_en, "_en")):
+        rendered = await render_cached((post.id, post.updated_at, lang), source)
+        fields[f"content_html{suffix}"] = rendered["html"] if rendered else None
+        fields[f"toc{suffix}"] = rendered["toc"] if rendered else []
+        fields[f"reading_time{suffix}"] = rendered["reading_time"] if rendered else None
+    return fields
+
+
+# Anahtar düzenlemeyle değiştiği için girdiler bayatlamaz; TTL yalnızca belleği sınırlar
+_rendered = caches.register(
+    "markdown",
+    LRUCache(maxsize=settings.MARKDOWN_CACHE_MAX_ENTRIES, ttl=24 * 60 * 60),
+)
@@ -0,0 +1,194 @@
+"""
+In-process inverted index used for search when the database is not Postgres.
+
+Documents are indexed per language ("tr" and "en") and ranked with BM25.
+Query terms match as prefixes, which handles Turkish suffixes
+("proje" finds "projeler"). The index is built from the database on first
+use and then kept current by the project and blog CRUD writes.
+"""
+import bisect
+import html
+import math
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+LANGUAGES = ("tr", "en")
+
+# One-to-one character folding so that offsets in folded text match the original
+_FOLD = str.maketrans({
+    "İ": "i", "I": "i", "ı": "i",
+    "Ş": "s", "ş": "s",
+    "Ğ": "g", "ğ": "g",
+    "Ü": "u", "ü": "u",
+    "Ö": "o", "ö": "o",
+    "Ç": "c", "ç": "c",
+    "Â": "a", "â": "a",
+    "Î": "i", "î": "i",
+    "Û": "u", "û": "u",
+})
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# BM25 parameters; title matches count double
+_K1 = 1.2
+_B = 0.75
+_TITLE_WEIGHT = 2
+
+SNIPPET_CHARS = 160
+
+
+def fold(text: str) -> str:
+    folded = text.translate(_FOLD).lower()
+    # lower() can change length for a few exotic characters; keep offsets usable
+    return folded if len(folded) == len(text) else text.translate(_FOLD)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return _TOKEN_RE.findall(fold(text or ""))
+
+
+def highlight(text: Optional[str], terms: Iterable[str], width: int = SNIPPET_CHARS) -> str:
+    """HTML-escaped excerpt around the first match, with matches wrapped in <mark>."""
+    text = text or ""
+    terms = [term for term in terms if term]
+    folded = fold(text)
+    spans = []
+    for match in _TOKEN_RE.finditer(folded):
+        if any(match.group().startswith(term) for term in terms):
+            spans.append(match.span())
+    start = max(0, spans[0][0] - width // 3) if spans else 0
+    end = min(len(text), start + width)
+
+    parts, cursor = [], start
+    for span_start, span_end in spans:
+        if span_start < start or span_end > end:
+            continue
+        parts.append(html.escape(text[cursor:span_start]))
+        parts.append("<mark>" + html.escape(text[span_start:span_end]) + "</mark>")
+        cursor = span_end
+    parts.append(html.escape(text[cursor:end]))
+    return ("…" if start > 0 else "") + "".join(parts) + ("…" if end < len(text) else "")
+
+
+@dataclass
+class IndexedDocument:
+    title: str
+    body: str
+    length: int
+    meta: Dict = field(default_factory=dict)
+
+
+class InvertedIndex:
+    """Per-language postings (term -> {doc key: weighted tf}) ranked with BM25."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._docs: Dict[str, Dict[Tuple[str, int], IndexedDocument]] = {lang: {} for lang in LANGUAGES}
+        self._postings: Dict[str, Dict[str, Dict[Tuple[str, int], int]]] = {lang: {} for lang in LANGUAGES}
+        self._vocabulary: Dict[str, Optional[List[str]]] = {lang: None for lang in LANGUAGES}
+        self._total_length = {lang: 0 for lang in LANGUAGES}
+        self.ready = False
+
+    def upsert(self, key: Tuple[str, int], texts: Dict[str, Tuple[str, str]], meta: Dict) -> None:
+        """Index a document; texts maps language -> (title, body)."""
+        with self._lock:
+            self._remove_locked(key)
+            for lang, (title, body) in texts.items():
+                frequencies: Dict[str, int] = {}
+                for token in tokenize(title):
+                    frequencies[token] = frequencies.get(token, 0) + _TITLE_WEIGHT
+                body_tokens = tokenize(body)
+                for token in body_tokens:
+                    frequencies[token] = frequencies.get(token, 0) + 1
+                length = sum(frequencies.values())
+                self._docs[lang][key] = IndexedDocument(title or "", body or "", length, meta)
+                self._total_length[lang] += length
+                postings = self._postings[lang]
+                for token, frequency in frequencies.items():
+                    if token not in postings:
+                        postings[token] = {}
+                        self._vocabulary[lang] = None
+                    postings[token][key] = frequency
+
+    def remove(self, key: Tuple[str, int]) -> None:
+        with self._lock:
+            self._remove_locked(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            for lang in LANGUAGES:
+                self._docs[lang].clear()
+                self._postings[lang].clear()
+                self._vocabulary[lang] = None
+                self._total_length[lang] = 0
+            self.ready = False
+
+    def _remove_locked(self, key: Tuple[str, int]) -> None:
+        for lang in LANGUAGES:
+            doc = self._docs[lang].pop(key, None)
+            if doc is None:
+                continue
+            self._total_length[lang] -= doc.length
+            postings = self._postings[lang]
+            for token in list(postings):
+                entries = postings[token]
+                if entries.pop(key, None) is not None and not entries:
+                    del postings[token]
+                    self._vocabulary[lang] = None
+
+    def _expand(self, lang: str, term: str) -> List[str]:
+        """All indexed tokens that start with term (sorted vocabulary + bisect)."""
+        vocabulary = self._vocabulary[lang]
+        if vocabulary is None:
+            vocabulary = self._vocabulary[lang] = sorted(self._postings[lang])
+        start = bisect.bisect_left(vocabulary, term)
+        matches = []
+        for token in vocabulary[start:]:
+            if not token.startswith(term):
+                break
+            matches.append(token)
+        return matches
+
+    def search(self, query: str, lang: str, limit: int = 20) -> List[Dict]:
+        terms = tokenize(query)
+        if not terms or lang not in LANGUAGES:
+            return []
+        with self._lock:
+            docs = self._docs[lang]
+            if not docs:
+                return []
+            postings = self._postings[lang]
+            avg_length = self._total_length[lang] / len(docs) or 1
+            scores: Optional[Dict[Tuple[str, int], float]] = None
+            for term in terms:
+                term_scores: Dict[Tuple[str, int], float] = {}
+                for token in self._expand(lang, term):
+                    entries = postings[token]
+                    idf = math.log(1 + (len(docs) - len(entries) + 0.5) / (len(entries) + 0.5))
+                    for key, frequency in entries.items():
+                        norm = frequency + _K1 * (1 - _B + _B * docs[key].length / avg_length)
+                        term_scores[key] = term_scores.get(key, 0.0) + idf * frequency * (_K1 + 1) / norm
+                # Every query term must match (same as websearch_to_tsquery)
+                scores = term_scores if scores is None else {
+                    key: score + term_scores[key] for key, score in scores.items() if key in term_scores
+                }
+                if not scores:
+                    return []
+            ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)[:limit]
+            results = []
+            for (kind, id), score in ranked:
+                doc = docs[(kind, id)]
+                results.append({
+                    "kind": kind,
+                    "id": id,
+                    "title": doc.title,
+                    "slug": doc.meta.get("slug"),
+                    "snippet": highlight(doc.body, terms),
+                    "score": round(score, 4),
+                })
+            return results
+
+
+# Singleton instance
+search_index = InvertedIndex()
@@ -1,9 +1,15 @@
+import time
 from datetime import datetime, timedelta
-from typing import Any, Union
+from typing import Any, Dict, Union
 from jose import jwt
+from jose.exceptions import ExpiredSignatureError
 import bcrypt
+from app.core.cache import MISS, LRUCache
 from app.core.config import settings
 
+# Doğrulanmış token -> payload; imza her istekte yeniden hesaplanmaz
+_decoded_tokens = LRUCache(maxsize=settings.AUTH_CACHE_MAX_ENTRIES, ttl=settings.AUTH_CACHE_TTL_SECONDS)
+
 
 def create_access_token(subject: Union[str, Any], expires_delta: timedelta = None) -> str:
     if expires_delta:
@@ -12,11 +18,22 @@ def create_access_token(subject: Union[str, Any], expires_delta: timedelta = Non
         expire = datetime.utcnow() + timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
-    to_encode = {"exp": expire, "sub": str(subject)}
+    to_encode = {"exp": expire, "iat": datetime.utcnow(), "sub": str(subject)}
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 
+def decode_access_token(token: str) -> Dict[str, Any]:
+    """Verify and decode a JWT. Valid payloads are cached; expiry is still checked on every hit."""
+    payload = _decoded_tokens.get(token)
+    if payload is MISS:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        _decoded_tokens.set(token, payload)
+    elif payload.get("exp") is not None and payload["exp"] <= time.time():
+        raise ExpiredSignatureError("Signature has expired.")
+    return payload
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash using bcrypt directly."""
     password_bytes = plain_password.encode('utf-8')
@@ -0,0 +1,94 @@
+"""
+Pre-serialized snapshot of all public homepage content.
+
+The snapshot is built once from the database and kept as ready-to-send JSON
+bytes together with its ETag. It is dropped whenever a commit touches one of
+the public tables, so visitors only pay for a rebuild after an admin write.
+"""
+import asyncio
+from typing import Dict, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, schemas
+from app.core import http_cache, i18n
+from app.db import changes
+from app.models.models import About, BlogPost, Project, Service, Settings, TimelineItem
+
+PUBLIC_TABLES = {
+    model.__table__.name
+    for model in (About, BlogPost, Project, Service, Settings, TimelineItem)
+}
+
+
+class PublicSnapshot:
+    """Holds the serialized public bundle and rebuilds it on demand."""
+
+    def __init__(self):
+        # Dil başına bir gövde (None: iki dil birlikte)
+        self._bodies: Dict[Optional[str], http_cache.CachedBody] = {}
+        self._generation = 0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self, tables: Optional[Set[str]] = None) -> None:
+        """Drop the snapshot if any of the given tables feed it."""
+        if tables is None or tables & PUBLIC_TABLES:
+            self._generation += 1
+            self._bodies = {}
+
+    async def get(self, db: AsyncSession, lang: Optional[str] = None) -> http_cache.CachedBody:
+        """Return the snapshot body for a language, building it if needed."""
+        body = self._bodies.get(lang)
+        if body is not None:
+            return body
+        async with self._lock:
+            if lang in self._bodies:
+                return self._bodies[lang]
+            generation = self._generation
+            body = await self._build(db, lang)
+            # A write committed while we were reading; serve it but don't keep it.
+            if generation == self._generation:
+                self._bodies[lang] = body
+            return body
+
+    async def _build(self, db: AsyncSession, lang: Optional[str]) -> http_cache.CachedBody:
+        async def first(model):
+            return (await db.execute(select(model).limit(1))).scalars().first()
+
+        async def ordered(model, *criteria):
+            query = select(model).where(*criteria).order_by(model.order.asc())
+            return (await db.execute(query)).scalars().all()
+
+        about = await first(About)
+        site_settings = await first(Settings)
+        payload = {
+            "about": http_cache.to_jsonable(schemas.About, about),
+            "settings": (
+                schemas.Settings.model_validate(site_settings)
+                if site_settings
+                else schemas.Settings(id=0, site_title="Portfolio")
+            ).model_dump(mode="json"),
+            "projects": http_cache.to_jsonable(
+                schemas.Project, await ordered(Project, Project.is_published.is_(True))
+            ),
+            # Kartlar için özet; yazının tamamı /resources/blog/{slug} ile alınır
+            "blog": http_cache.to_jsonable(
+                schemas.BlogPostSummary,
+                await crud.blog.get_multi_fields(
+                    db,
+                    fields=tuple(schemas.BlogPostSummary.model_fields),
+                    limit=None,
+                    order_by="order",
+                    published_only=True,
+                ),
+            ),
+            "timeline": http_cache.to_jsonable(schemas.Timeline, await ordered(TimelineItem)),
+            "services": http_cache.to_jsonable(schemas.Service, await ordered(Service)),
+        }
+        return http_cache.render(i18n.localize(payload, lang), PUBLIC_TABLES)
+
+
+# Singleton instance
+public_snapshot = PublicSnapshot()
+changes.subscribe(public_snapshot.invalidate)
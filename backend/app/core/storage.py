@@ -1,113 +1,319 @@
 """
-Supabase Storage utility for handling file uploads.
+File storage backends for uploads.
+
+``StorageBackend`` holds the shared upload logic (extension check, size
+limit, SHA-256 content addressing); subclasses only move bytes. The backend
+is chosen with ``STORAGE_BACKEND``: "local" writes under LOCAL_STORAGE_DIR
+(served at /uploads), "supabase" uses Supabase Storage.
 """
-import uuid
+import hashlib
+import importlib.util
+import os
+import shutil
+import tempfile
+import time
 import httpx
-from typing import Optional, Tuple
+from contextlib import contextmanager
+from typing import AsyncIterator, Optional, Tuple
 from fastapi import UploadFile, HTTPException
+from starlette.concurrency import run_in_threadpool
+from app.core.bodylimit import too_large_detail
 from app.core.config import settings
+from app.core.metrics import storage_operation_seconds
 
+# Dosyalar bu boyutta parçalar halinde okunup gönderilir
+CHUNK_SIZE = 64 * 1024
+
+
+class StorageBackend:
+    """Interface for storage backends. Subclasses implement exists/put/delete/public URL."""
+
+    name = ""
 
-class SupabaseStorage:
-    """Handle file uploads to Supabase Storage."""
-    
     def __init__(self):
-        self.url = settings.SUPABASE_URL
-        self.key = settings.SUPABASE_KEY
-        self.bucket = settings.SUPABASE_BUCKET
-        
-    def _get_headers(self) -> dict:
-        """Get headers for Supabase API requests."""
-        return {
-            "Authorization": f"Bearer {self.key}",
-            "apikey": self.key,
-        }
-    
-    def _get_public_url(self, file_path: str) -> str:
-        """Generate public URL for uploaded file."""
-        return f"{self.url}/storage/v1/object/public/{self.bucket}/{file_path}"
-    
+        self.max_upload_bytes = settings.MAX_UPLOAD_BYTES
+
+    async def startup(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+    def get_public_url(self, file_path: str) -> str:
+        raise NotImplementedError
+
+    async def exists(self, file_path: str) -> bool:
+        raise NotImplementedError
+
+    async def put_file(self, file_path: str, file: UploadFile, content_type: str, size: int) -> None:
+        """Store an upload (already validated, positioned at 0) under file_path."""
+        raise NotImplementedError
+
+    async def put_bytes(self, file_path: str, content: bytes, content_type: str) -> None:
+        raise NotImplementedError
+
+    async def delete_file(self, file_path: str) -> bool:
+        raise NotImplementedError
+
+    @contextmanager
+    def _timed(self, operation: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            storage_operation_seconds.observe(time.perf_counter() - start, self.name, operation)
+
+    def _too_large(self) -> HTTPException:
+        return HTTPException(status_code=413, detail=too_large_detail(self.max_upload_bytes))
+
+    async def _iter_file(self, file: UploadFile) -> AsyncIterator[bytes]:
+        """Yield the upload in chunks, enforcing the size limit as bytes are read."""
+        total = 0
+        while True:
+            chunk = await file.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            total += len(chunk)
+            if total > self.max_upload_bytes:
+                raise self._too_large()
+            yield chunk
+
+    async def _digest(self, file: UploadFile) -> Tuple[str, int]:
+        """SHA-256 and size of the upload, read in chunks; rewinds the file afterwards.
+
+        This is a separate pass over the spooled upload: the key is derived
+        from the digest and has to be known before ``exists``/``put_file``,
+        which then read the file a second time.
+        """
+        sha256 = hashlib.sha256()
+        size = 0
+        async for chunk in self._iter_file(file):
+            sha256.update(chunk)
+            size += len(chunk)
+        await file.seek(0)
+        return sha256.hexdigest(), size
+
     async def upload_file(
-        self, 
-        file: UploadFile, 
+        self,
+        file: UploadFile,
         folder: str = "images",
         allowed_extensions: list = None
     ) -> Tuple[str, str]:
         """
-        Upload a file to Supabase Storage.
-        
+        Upload a file under a content-addressed key.
+
+        The key is ``<folder>/<sha256>.<ext>``, so uploading the same file
+        again only returns the existing object.
+
         Args:
             file: The uploaded file
             folder: Folder path within the bucket
             allowed_extensions: List of allowed file extensions
-            
+
         Returns:
             Tuple of (public_url, file_path)
         """
         if allowed_extensions is None:
             allowed_extensions = ["jpg", "jpeg", "png", "webp", "gif", "pdf"]
-        
+
         # Validate extension
         extension = file.filename.split(".")[-1].lower() if file.filename else ""
         if extension not in allowed_extensions:
             raise HTTPException(
-                status_code=400, 
+                status_code=400,
                 detail=f"Desteklenmeyen dosya türü. İzin verilen: {', '.join(allowed_extensions)}"
             )
-        
-        # Generate unique filename
-        unique_filename = f"{uuid.uuid4()}.{extension}"
-        file_path = f"{folder}/{unique_filename}"
-        
-        # Read file content
-        content = await file.read()
-        
-        # Determine content type
-        content_type = file.content_type or f"image/{extension}"
-        
-        # Upload to Supabase Storage
+
+        # Gövde sınırı BodySizeLimitMiddleware'de istek okunurken uygulanır; burası dosyanın kendisi için son kontrol
+        if file.size is not None and file.size > self.max_upload_bytes:
+            raise self._too_large()
+
+        digest, size = await self._digest(file)
+        file_path = f"{folder}/{digest}.{extension}"
+
+        # Aynı içerik zaten varsa tekrar yüklenmez
+        with self._timed("exists"):
+            found = await self.exists(file_path)
+        if not found:
+            content_type = file.content_type or f"image/{extension}"
+            with self._timed("put"):
+                await self.put_file(file_path, file, content_type, size)
+
+        return self.get_public_url(file_path), file_path
+
+    async def upload_bytes(self, file_path: str, content: bytes, content_type: str) -> str:
+        """
+        Upload generated content (e.g. image variants) to an exact path.
+
+        Returns:
+            Public URL of the stored object
+        """
+        with self._timed("exists"):
+            found = await self.exists(file_path)
+        if not found:
+            with self._timed("put"):
+                await self.put_bytes(file_path, content, content_type)
+        return self.get_public_url(file_path)
+
+
+class LocalStorage(StorageBackend):
+    """Store files on the local filesystem, served by the /uploads mount."""
+
+    name = "local"
+
+    def __init__(self):
+        super().__init__()
+        self.root = settings.LOCAL_STORAGE_DIR
+        self.base_url = f"{settings.BACKEND_URL.rstrip('/')}/uploads"
+
+    def _path(self, file_path: str) -> str:
+        path = os.path.realpath(os.path.join(self.root, file_path))
+        if not path.startswith(os.path.realpath(self.root) + os.sep):
+            raise HTTPException(status_code=400, detail="Geçersiz dosya yolu")
+        return path
+
+    def get_public_url(self, file_path: str) -> str:
+        return f"{self.base_url}/{file_path}"
+
+    async def exists(self, file_path: str) -> bool:
+        return os.path.exists(self._path(file_path))
+
+    def _write(self, path: str, source) -> None:
+        # Geçici dosyaya yazıp taşı: yarım dosya hiçbir zaman yayınlanmaz
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as destination:
+                if isinstance(source, bytes):
+                    destination.write(source)
+                else:
+                    shutil.copyfileobj(source, destination, CHUNK_SIZE)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    async def put_file(self, file_path: str, file: UploadFile, content_type: str, size: int) -> None:
+        await run_in_threadpool(self._write, self._path(file_path), file.file)
+
+    async def put_bytes(self, file_path: str, content: bytes, content_type: str) -> None:
+        await run_in_threadpool(self._write, self._path(file_path), content)
+
+    async def delete_file(self, file_path: str) -> bool:
+        try:
+            await run_in_threadpool(os.remove, self._path(file_path))
+            return True
+        except FileNotFoundError:
+            return False
+
+
+class SupabaseStorage(StorageBackend):
+    """Handle file uploads to Supabase Storage."""
+
+    name = "supabase"
+
+    def __init__(self):
+        super().__init__()
+        self.url = settings.SUPABASE_URL
+        self.key = settings.SUPABASE_KEY
+        self.bucket = settings.SUPABASE_BUCKET
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared keep-alive client; created on startup (or first use in scripts)."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                # HTTP/2 için 'h2' paketi gerekir (httpx[http2]); yoksa HTTP/1.1 keep-alive
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60),
+                timeout=httpx.Timeout(30.0, connect=10.0),
+            )
+        return self._client
+
+    async def startup(self) -> None:
+        self._get_client()
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    def _get_headers(self) -> dict:
+        """Get headers for Supabase API requests."""
+        return {
+            "Authorization": f"Bearer {self.key}",
+            "apikey": self.key,
+        }
+
+    def get_public_url(self, file_path: str) -> str:
+        """Generate public URL for uploaded file."""
+        return f"{self.url}/storage/v1/object/public/{self.bucket}/{file_path}"
+
+    async def exists(self, file_path: str) -> bool:
+        response = await self._get_client().head(
+            f"{self.url}/storage/v1/object/authenticated/{self.bucket}/{file_path}",
+            headers=self._get_headers(),
+        )
+        return response.status_code == 200
+
+    async def _post(self, file_path: str, headers: dict, content) -> None:
         upload_url = f"{self.url}/storage/v1/object/{self.bucket}/{file_path}"
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                upload_url,
-                headers={
-                    **self._get_headers(),
-                    "Content-Type": content_type,
-                },
-                content=content,
+        response = await self._get_client().post(
+            upload_url,
+            headers={**self._get_headers(), **headers},
+            content=content,
+        )
+        # 409: aynı anahtar (dolayısıyla aynı içerik) başka bir istekle yüklenmiş
+        if response.status_code not in [200, 201, 409]:
+            error_detail = response.text
+            raise HTTPException(
+                status_code=500,
+                detail=f"Dosya yüklenemedi: {error_detail}"
             )
-            
-            if response.status_code not in [200, 201]:
-                error_detail = response.text
-                raise HTTPException(
-                    status_code=500,
-                    detail=f"Dosya yüklenemedi: {error_detail}"
-                )
-        
-        public_url = self._get_public_url(file_path)
-        return public_url, file_path
-    
+
+    async def put_file(self, file_path: str, file: UploadFile, content_type: str, size: int) -> None:
+        await self._post(
+            file_path,
+            {"Content-Type": content_type, "Content-Length": str(size)},
+            self._iter_file(file),
+        )
+
+    async def put_bytes(self, file_path: str, content: bytes, content_type: str) -> None:
+        await self._post(file_path, {"Content-Type": content_type}, content)
+
     async def delete_file(self, file_path: str) -> bool:
         """
         Delete a file from Supabase Storage.
-        
+
         Args:
             file_path: Path of the file to delete
-            
+
         Returns:
             True if successful
         """
         delete_url = f"{self.url}/storage/v1/object/{self.bucket}/{file_path}"
-        
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                delete_url,
-                headers=self._get_headers(),
-            )
-            
-            return response.status_code in [200, 204]
+
+        response = await self._get_client().delete(
+            delete_url,
+            headers=self._get_headers(),
+        )
+
+        return response.status_code in [200, 204]
+
+
+_BACKENDS = {
+    "local": LocalStorage,
+    "supabase": SupabaseStorage,
+}
+
+
+def get_storage() -> StorageBackend:
+    """Build the backend selected by STORAGE_BACKEND."""
+    try:
+        return _BACKENDS[settings.STORAGE_BACKEND]()
+    except KeyError:
+        raise ValueError(f"Unknown STORAGE_BACKEND: {settings.STORAGE_BACKEND!r} (expected one of {sorted(_BACKENDS)})")
 
 
 # Singleton instance
-storage = SupabaseStorage()
+storage = get_storage()
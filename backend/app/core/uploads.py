@@ -0,0 +1,240 @@
+"""
+ASGI app that serves LOCAL_STORAGE_DIR at /uploads.
+
+Compared to StaticFiles it adds:
+
+* ``Cache-Control: immutable`` for content-addressed names (``<sha256>.ext``,
+  ``<sha256>_640w.webp``), whose bytes never change, and a strong ETag
+  taken from the hash in the name
+* single byte ranges (206 / 416, If-Range) for large PDFs
+* precompressed ``.br`` / ``.gz`` siblings chosen by Accept-Encoding
+* zero-copy ``http.response.zerocopysend`` (or ``pathsend``) when the server
+  offers it, chunked reads otherwise
+"""
+import mimetypes
+import os
+import re
+from email.utils import format_datetime, parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+
+from app.core import http_cache
+
+CHUNK_SIZE = 64 * 1024
+
+HASHED_NAME = re.compile(r"^(?P<digest>[0-9a-f]{64})(?:_\d+w)?\.[A-Za-z0-9]+$")
+IMMUTABLE = "public, max-age=31536000, immutable"
+
+# Tercih sırasına göre: (Content-Encoding, dosya uzantısı)
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single ``bytes=`` range into inclusive (start, end).
+
+    Returns None when the header should be ignored (other units, several
+    ranges, malformed) so that the full file is sent.
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, _, last = spec.strip().partition("-")
+    try:
+        if not first:
+            suffix = int(last)
+            if suffix <= 0:
+                raise RangeNotSatisfiable()
+            start, end = max(0, size - suffix), size - 1
+        else:
+            start = int(first)
+            end = min(int(last), size - 1) if last else size - 1
+    except ValueError:
+        return None
+    if start < 0 or start > end or start >= size:
+        raise RangeNotSatisfiable()
+    return start, end
+
+
+def _accepted_encodings(header: Optional[str]) -> List[str]:
+    accepted = []
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        if name:
+            accepted.append(name.strip().lower())
+    return accepted
+
+
+class UploadsApp:
+    def __init__(self, directory: str):
+        self.directory = os.path.realpath(directory)
+
+    def _resolve(self, scope) -> Optional[str]:
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+        parts = [part for part in path.split("/") if part]
+        # Gizli/geçici dosyalar (.upload-*) ve üst dizine çıkış servis edilmez
+        if not parts or any(part.startswith(".") for part in parts):
+            return None
+        full_path = os.path.realpath(os.path.join(self.directory, *parts))
+        if not full_path.startswith(self.directory + os.sep):
+            return None
+        return full_path
+
+    def _select(self, path: str, headers: Headers) -> Tuple[str, Optional[str], os.stat_result]:
+        """Pick the representation to send: a precompressed sibling or the file itself."""
+        if "range" not in headers:
+            accepted = _accepted_encodings(headers.get("accept-encoding"))
+            for encoding, suffix in PRECOMPRESSED:
+                if encoding in accepted:
+                    try:
+                        return path + suffix, encoding, os.stat(path + suffix)
+                    except OSError:
+                        continue
+        return path, None, os.stat(path)
+
+    async def __call__(self, scope, receive, send) -> None:
+        assert scope["type"] == "http"
+        method = scope["method"]
+        if method not in ("GET", "HEAD"):
+            await self._send_empty(send, 405, {"allow": "GET, HEAD"})
+            return
+
+        path = self._resolve(scope)
+        if path is None or not await run_in_threadpool(os.path.isfile, path):
+            await self._send_empty(send, 404, {"content-type": "text/plain; charset=utf-8"}, b"Not Found")
+            return
+
+        request_headers = Headers(scope=scope)
+        file_path, encoding, stat = await run_in_threadpool(self._select, path, request_headers)
+        size = stat.st_size
+        name = os.path.basename(path)
+        hashed = HASHED_NAME.match(name)
+
+        etag = hashed.group("digest") if hashed else f"{stat.st_mtime_ns:x}-{size:x}"
+        if encoding:
+            etag = f"{etag}-{encoding}"
+        etag = f'"{etag}"'
+        last_modified = datetime.fromtimestamp(int(stat.st_mtime), timezone.utc)
+
+        media_type, _ = mimetypes.guess_type(name)
+        headers = {
+            "content-type": media_type or "application/octet-stream",
+            "accept-ranges": "bytes",
+            "etag": etag,
+            "last-modified": format_datetime(last_modified, usegmt=True),
+            "cache-control": IMMUTABLE if hashed else http_cache.cache_control(),
+            "vary": "Accept-Encoding",
+        }
+        if encoding:
+            headers["content-encoding"] = encoding
+
+        if self._not_modified(request_headers, etag, last_modified):
+            await self._send_empty(send, 304, headers)
+            return
+
+        start, end, status = 0, size - 1, 200
+        range_header = request_headers.get("range")
+        if range_header and size and self._if_range_ok(request_headers, etag, last_modified):
+            try:
+                requested = parse_range(range_header, size)
+            except RangeNotSatisfiable:
+                await self._send_empty(send, 416, {**headers, "content-range": f"bytes */{size}"})
+                return
+            if requested is not None:
+                start, end = requested
+                status = 206
+                headers["content-range"] = f"bytes {start}-{end}/{size}"
+
+        length = end - start + 1 if size else 0
+        headers["content-length"] = str(length)
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(key.encode("latin-1"), value.encode("latin-1")) for key, value in headers.items()],
+        })
+        if method == "HEAD" or length == 0:
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await self._send_file(scope, send, file_path, start, length, whole=(status == 200))
+
+    @staticmethod
+    def _not_modified(headers: Headers, etag: str, last_modified: datetime) -> bool:
+        if_none_match = headers.get("if-none-match")
+        if if_none_match is not None:
+            return http_cache.etag_matches(if_none_match, etag)
+        if_modified_since = headers.get("if-modified-since")
+        if if_modified_since:
+            try:
+                return last_modified <= parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    @staticmethod
+    def _if_range_ok(headers: Headers, etag: str, last_modified: datetime) -> bool:
+        if_range = headers.get("if-range")
+        if if_range is None:
+            return True
+        if if_range.startswith(('"', "W/")):
+            # If-Range uses the strong comparison function
+            return if_range == etag
+        try:
+            return parsedate_to_datetime(if_range) == last_modified
+        except (TypeError, ValueError):
+            return False
+
+    @staticmethod
+    async def _send_file(scope, send, file_path: str, start: int, length: int, whole: bool) -> None:
+        extensions = scope.get("extensions") or {}
+        if "http.response.zerocopysend" in extensions:
+            file = await run_in_threadpool(open, file_path, "rb")
+            try:
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": file,
+                    "offset": start,
+                    "count": length,
+                })
+            finally:
+                await run_in_threadpool(file.close)
+            return
+        if whole and "http.response.pathsend" in extensions:
+            await send({"type": "http.response.pathsend", "path": file_path})
+            return
+
+        file = await run_in_threadpool(open, file_path, "rb")
+        try:
+            await run_in_threadpool(file.seek, start)
+            remaining = length
+            while remaining > 0:
+                chunk = await run_in_threadpool(file.read, min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining > 0:
+                # Dosya okuma sırasında kısaldı; yanıtı kapat
+                await send({"type": "http.response.body", "body": b""})
+        finally:
+            await run_in_threadpool(file.close)
+
+    @staticmethod
+    async def _send_empty(send, status: int, headers: Dict[str, str], body: bytes = b"") -> None:
+        headers = {**headers, "content-length": str(len(body))}
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [(key.encode("latin-1"), value.encode("latin-1")) for key, value in headers.items()],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -1,2 +1,3 @@
 from .crud_user import user
 from .crud_resources import project, service, timeline, message, blog, about, settings
+from .crud_search import search
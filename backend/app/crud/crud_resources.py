@@ -1,79 +1,316 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
+import base64
+from collections import Counter
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import ColumnElement, case, func, insert, or_, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import CacheBackend, caches, from_row, to_row
+from app.db import changes
+from app.crud.crud_search import search
 from app.models.models import Project, Service, TimelineItem, Message, BlogPost
-from app.schemas.schemas import ProjectCreate, ServiceCreate, TimelineCreate, MessageCreate, BlogPostCreate
+from app.schemas.schemas import ProjectCreate, ServiceCreate, TimelineCreate, BlogPostCreate
+
+class ReorderError(ValueError):
+    """Raised by ``reorder`` for a list with duplicate or unknown IDs; nothing is changed."""
+
+    def __init__(self, *, duplicates=(), missing=()):
+        self.duplicates = sorted(duplicates)
+        self.missing = sorted(missing)
+        if self.duplicates:
+            message = f"Sıralama listesinde tekrarlanan ID var: {self.duplicates}"
+        else:
+            message = f"Bulunamayan ID'ler: {self.missing}"
+        super().__init__(message)
 
 class BaseCRUD:
-    def __init__(self, model):
+    """Generic CRUD helpers with a read-through cache per model.
+
+    Reads are cached as plain column dicts and rebuilt into session-bound
+    instances on a hit. The cache namespace is cleared whenever a commit
+    touches the model's table (see ``app.db.changes``).
+    """
+
+    # Şemada olup modelde kolon olmayan alanlar için SQL ifadeleri (ör. özet metin)
+    computed_fields: Dict[str, ColumnElement] = {}
+
+    def __init__(self, model, cache: Optional[CacheBackend] = None):
         self.model = model
+        self.cache = cache if cache is not None else caches.get(model.__table__.name)
+
+    def _list_query(self, query, *, skip: int, limit: Optional[int], order_by: Optional[str], published_only: bool):
+        if published_only:
+            query = query.where(self.model.is_published.is_(True))
+        if order_by:
+            query = query.order_by(getattr(self.model, order_by).asc())
+        return query.offset(skip).limit(limit)
+
+    async def get(self, db: AsyncSession, id: int):
+        async def load():
+            result = await db.execute(select(self.model).where(self.model.id == id))
+            return to_row(result.scalars().first())
+
+        row = await self.cache.get_or_load(("get", id), load)
+        return await from_row(db, self.model, row)
+
+    async def get_multi(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        order_by: Optional[str] = None,
+        published_only: bool = False,
+    ):
+        async def load():
+            query = self._list_query(
+                select(self.model), skip=skip, limit=limit, order_by=order_by, published_only=published_only
+            )
+            result = await db.execute(query)
+            return [to_row(obj) for obj in result.scalars().all()]
+
+        rows = await self.cache.get_or_load(("multi", skip, limit, order_by, published_only), load)
+        return [await from_row(db, self.model, row) for row in rows]
 
-    def get(self, db: Session, id: int):
-        return db.query(self.model).filter(self.model.id == id).first()
+    async def get_multi_fields(
+        self,
+        db: AsyncSession,
+        *,
+        fields: Tuple[str, ...],
+        skip: int = 0,
+        limit: Optional[int] = 100,
+        order_by: Optional[str] = None,
+        published_only: bool = False,
+    ) -> List[Dict]:
+        """Like get_multi, but SELECTs only the given fields and returns plain dicts.
 
-    def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100):
-        return db.query(self.model).offset(skip).limit(limit).all()
+        Large Text columns that are not requested are never read from the
+        database; ``computed_fields`` (e.g. excerpts) are evaluated in SQL.
+        """
+        columns = [
+            self.computed_fields[name].label(name) if name in self.computed_fields else getattr(self.model, name)
+            for name in fields
+        ]
 
-    def remove(self, db: Session, *, id: int):
-        obj = db.query(self.model).get(id)
-        db.delete(obj)
-        db.commit()
+        async def load():
+            query = self._list_query(
+                select(*columns), skip=skip, limit=limit, order_by=order_by, published_only=published_only
+            )
+            result = await db.execute(query)
+            return [dict(row) for row in result.mappings().all()]
+
+        return await self.cache.get_or_load(("fields", fields, skip, limit, order_by, published_only), load)
+
+    async def remove(self, db: AsyncSession, *, id: int):
+        obj = await db.get(self.model, id)
+        await db.delete(obj)
+        await db.commit()
         return obj
 
-    def update(self, db: Session, *, db_obj, obj_in):
+    async def update(self, db: AsyncSession, *, db_obj, obj_in):
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.dict(exclude_unset=True)
-        
+
         for field in update_data:
             if hasattr(db_obj, field):
                 setattr(db_obj, field, update_data[field])
-        
+
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
         return db_obj
 
+    async def reorder(self, db: AsyncSession, *, ordered_ids: List[int]):
+        """Set ``order`` to each ID's list position in a single UPDATE ... CASE.
+
+        IDs are validated with one SELECT first; the update and the
+        validation share a transaction, so a bad list changes nothing.
+        """
+        duplicates = [item_id for item_id, count in Counter(ordered_ids).items() if count > 1]
+        if duplicates:
+            raise ReorderError(duplicates=duplicates)
+        if not ordered_ids:
+            return []
+
+        result = await db.execute(select(self.model.id).where(self.model.id.in_(ordered_ids)))
+        missing = set(ordered_ids) - set(result.scalars().all())
+        if missing:
+            await db.rollback()
+            raise ReorderError(missing=missing)
+
+        positions = {item_id: index for index, item_id in enumerate(ordered_ids)}
+        await db.execute(
+            update(self.model)
+            .where(self.model.id.in_(ordered_ids))
+            .values({self.model.order: case(positions, value=self.model.id)})
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+
+        result = await db.execute(
+            select(self.model)
+            .where(self.model.id.in_(ordered_ids))
+            .order_by(self.model.order.asc())
+            .execution_options(populate_existing=True)
+        )
+        return result.scalars().all()
+
+# Kart görünümlerindeki özet metnin uzunluğu (karakter)
+EXCERPT_LENGTH = 200
+
 class CRUDProject(BaseCRUD):
-    def create(self, db: Session, *, obj_in: ProjectCreate):
+    computed_fields = {
+        "excerpt": func.substr(Project.description, 1, EXCERPT_LENGTH),
+        "excerpt_en": func.substr(Project.description_en, 1, EXCERPT_LENGTH),
+    }
+
+    async def create(self, db: AsyncSession, *, obj_in: ProjectCreate):
         db_obj = Project(**obj_in.dict())
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        search.index(db_obj)
         return db_obj
 
+    async def update(self, db: AsyncSession, *, db_obj, obj_in):
+        db_obj = await super().update(db, db_obj=db_obj, obj_in=obj_in)
+        search.index(db_obj)
+        return db_obj
+
+    async def remove(self, db: AsyncSession, *, id: int):
+        obj = await super().remove(db, id=id)
+        search.discard(obj)
+        return obj
+
 class CRUDService(BaseCRUD):
-    def create(self, db: Session, *, obj_in: ServiceCreate):
+    async def create(self, db: AsyncSession, *, obj_in: ServiceCreate):
         db_obj = Service(**obj_in.dict())
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
         return db_obj
 
 class CRUDTimeline(BaseCRUD):
-    def create(self, db: Session, *, obj_in: TimelineCreate):
+    async def create(self, db: AsyncSession, *, obj_in: TimelineCreate):
         db_obj = TimelineItem(**obj_in.dict())
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
         return db_obj
 
+def _encode_cursor(created_at: datetime, id: int) -> str:
+    raw = f"{created_at.isoformat()}|{id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(id)
+    except ValueError as exc:
+        # binascii.Error ve UnicodeDecodeError da ValueError'dır
+        raise ValueError("Geçersiz sayfalama imleci") from exc
+
 class CRUDMessage(BaseCRUD):
-    def create(self, db: Session, *, obj_in: MessageCreate):
-        db_obj = Message(**obj_in.dict())
-        db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
-        return db_obj
+    async def create_many(self, db: AsyncSession, *, rows: List[Dict]) -> None:
+        """Insert many messages with one multi-row INSERT (used by the ingestion queue)."""
+        if not rows:
+            return
+        await db.execute(insert(Message), rows)
+        # Core INSERT ORM flush'ından geçmez; cache'in temizlenmesi için elle işaretlenir
+        changes.mark_changed(db.sync_session, Message.__table__.name)
+        await db.commit()
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        is_read: Optional[bool] = None,
+        q: Optional[str] = None,
+    ) -> Tuple[List[Message], Optional[str]]:
+        """Newest-first keyset page on (created_at, id); returns (items, next_cursor).
+
+        Raises ``ValueError`` for a malformed cursor.
+        """
+        query = select(Message)
+        if is_read is not None:
+            query = query.where(Message.is_read.is_(is_read))
+        if q:
+            pattern = "%" + q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            query = query.where(or_(
+                Message.sender_name.ilike(pattern, escape="\\"),
+                Message.sender_email.ilike(pattern, escape="\\"),
+                Message.subject.ilike(pattern, escape="\\"),
+                Message.content.ilike(pattern, escape="\\"),
+            ))
+        if cursor:
+            created_at, last_id = _decode_cursor(cursor)
+            # Compare against the stored value of the anchor row so that the
+            # database's own timestamp format is used; fall back to the cursor's
+            # timestamp if that message has been deleted meanwhile.
+            anchor = func.coalesce(
+                select(Message.created_at).where(Message.id == last_id).scalar_subquery(),
+                created_at,
+            )
+            query = query.where(tuple_(Message.created_at, Message.id) < tuple_(anchor, last_id))
+        query = query.order_by(Message.created_at.desc(), Message.id.desc()).limit(limit + 1)
+
+        items = list((await db.execute(query)).scalars().all())
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = _encode_cursor(items[-1].created_at, items[-1].id)
+        return items, next_cursor
+
+    async def get_counts(self, db: AsyncSession) -> Dict[str, int]:
+        """Total and unread message counts, cached until the next message write."""
+        async def load():
+            result = await db.execute(
+                select(func.count(Message.id), func.coalesce(func.sum(case((Message.is_read.is_(False), 1), else_=0)), 0))
+            )
+            total, unread = result.one()
+            return {"total": total, "unread": unread}
+
+        return await self.cache.get_or_load(("counts",), load)
 
 class CRUDBlogPost(BaseCRUD):
-    def create(self, db: Session, *, obj_in: BlogPostCreate):
+    computed_fields = {
+        "excerpt": func.substr(BlogPost.content, 1, EXCERPT_LENGTH),
+        "excerpt_en": func.substr(BlogPost.content_en, 1, EXCERPT_LENGTH),
+    }
+
+    async def get_by_slug(self, db: AsyncSession, *, slug: str, published_only: bool = False):
+        async def load():
+            query = select(BlogPost).where(BlogPost.slug == slug)
+            if published_only:
+                query = query.where(BlogPost.is_published.is_(True))
+            result = await db.execute(query)
+            return to_row(result.scalars().first())
+
+        row = await self.cache.get_or_load(("slug", slug, published_only), load)
+        return await from_row(db, self.model, row)
+
+    async def create(self, db: AsyncSession, *, obj_in: BlogPostCreate):
         db_obj = BlogPost(**obj_in.dict())
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
+        search.index(db_obj)
         return db_obj
 
+    async def update(self, db: AsyncSession, *, db_obj, obj_in):
+        db_obj = await super().update(db, db_obj=db_obj, obj_in=obj_in)
+        search.index(db_obj)
+        return db_obj
+
+    async def remove(self, db: AsyncSession, *, id: int):
+        obj = await super().remove(db, id=id)
+        search.discard(obj)
+        return obj
+
 project = CRUDProject(Project)
 service = CRUDService(Service)
 timeline = CRUDTimeline(TimelineItem)
@@ -81,25 +318,35 @@ message = CRUDMessage(Message)
 blog = CRUDBlogPost(BlogPost)
 
 class CRUDAbout(BaseCRUD):
-    def get_first(self, db: Session):
-        return db.query(self.model).first()
+    async def get_first(self, db: AsyncSession):
+        async def load():
+            result = await db.execute(select(self.model).limit(1))
+            return to_row(result.scalars().first())
 
-    def create(self, db: Session, *, obj_in):
+        row = await self.cache.get_or_load(("first",), load)
+        return await from_row(db, self.model, row)
+
+    async def create(self, db: AsyncSession, *, obj_in):
         db_obj = self.model(**obj_in.dict())
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
         return db_obj
 
 class CRUDSettings(BaseCRUD):
-    def get_first(self, db: Session):
-        return db.query(self.model).first()
+    async def get_first(self, db: AsyncSession):
+        async def load():
+            result = await db.execute(select(self.model).limit(1))
+            return to_row(result.scalars().first())
+
+        row = await self.cache.get_or_load(("first",), load)
+        return await from_row(db, self.model, row)
 
-    def create(self, db: Session, *, obj_in):
+    async def create(self, db: AsyncSession, *, obj_in):
         db_obj = self.model(**obj_in.dict())
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
         return db_obj
 
 from app.models.models import About, Settings
@@ -0,0 +1,128 @@
+import asyncio
+import html
+from typing import Dict, List
+
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.search import search_index
+from app.models.models import (
+    BLOG_SEARCH_FIELDS,
+    PROJECT_SEARCH_FIELDS,
+    SEARCH_CONFIGS,
+    BlogPost,
+    Project,
+    search_vector,
+)
+
+# ts_headline işaretleri: içerik HTML olarak kaçışlandıktan sonra <mark> ile değiştirilir
+_START, _STOP = "\ue000", "\ue001"
+_HEADLINE_OPTIONS = (
+    f'StartSel="{_START}", StopSel="{_STOP}", MaxWords=35, MinWords=15, '
+    'MaxFragments=2, FragmentDelimiter=" … "'
+)
+
+_SOURCES = (
+    ("project", Project, PROJECT_SEARCH_FIELDS),
+    ("blog", BlogPost, BLOG_SEARCH_FIELDS),
+)
+
+
+def _document(obj) -> Dict:
+    """Title/body per language for the in-process index (mirrors *_SEARCH_FIELDS)."""
+    if isinstance(obj, Project):
+        body, body_en = obj.description, obj.description_en
+    else:
+        body, body_en = obj.content, obj.content_en
+    return {
+        "tr": (obj.title, body),
+        "en": (obj.title_en or obj.title, body_en or body),
+    }
+
+
+def _key(obj):
+    return ("project" if isinstance(obj, Project) else "blog", obj.id)
+
+
+class CRUDSearch:
+    """Full-text search over published projects and blog posts.
+
+    Postgres uses the tsvector GIN indexes defined on the models; other
+    databases use ``app.core.search.search_index``, built on first search
+    and updated by the project/blog CRUD writes.
+    """
+
+    def __init__(self):
+        self._build_lock = asyncio.Lock()
+
+    def index(self, obj) -> None:
+        """Add or refresh a project/blog post in the in-process index."""
+        if not search_index.ready:
+            return  # built from the database on first search instead
+        if not obj.is_published:
+            search_index.remove(_key(obj))
+            return
+        search_index.upsert(_key(obj), _document(obj), {"slug": getattr(obj, "slug", None)})
+
+    def discard(self, obj) -> None:
+        if search_index.ready:
+            search_index.remove(_key(obj))
+
+    async def rebuild(self, db: AsyncSession) -> None:
+        async with self._build_lock:
+            if search_index.ready:
+                return
+            for _, model, _ in _SOURCES:
+                result = await db.execute(select(model).where(model.is_published.is_(True)))
+                for obj in result.scalars().all():
+                    search_index.upsert(_key(obj), _document(obj), {"slug": getattr(obj, "slug", None)})
+            search_index.ready = True
+
+    async def search(self, db: AsyncSession, *, q: str, lang: str = "tr", limit: int = 20) -> List[Dict]:
+        if db.get_bind().dialect.name == "postgresql":
+            return await self._search_postgres(db, q=q, lang=lang, limit=limit)
+        if not search_index.ready:
+            await self.rebuild(db)
+        return search_index.search(q, lang, limit)
+
+    async def _search_postgres(self, db: AsyncSession, *, q: str, lang: str, limit: int) -> List[Dict]:
+        config = literal_column(f"'{SEARCH_CONFIGS[lang]}'::regconfig")
+        query = func.websearch_to_tsquery(config, q)
+        results = []
+        for kind, model, fields in _SOURCES:
+            title, body = fields[lang]
+            vector = literal_column(f"({search_vector(lang, title, body)})")
+            rank = func.ts_rank(vector, query).label("rank")
+            # Sıralama ve LIMIT önce; ts_headline yalnızca dönen satırlar için çalışır
+            top = (
+                select(model.id, rank)
+                .where(model.is_published.is_(True), vector.op("@@")(query))
+                .order_by(rank.desc())
+                .limit(limit)
+                .subquery()
+            )
+            rows = await db.execute(
+                select(
+                    model.id,
+                    literal_column(f"coalesce({title}, '')").label("title"),
+                    getattr(model, "slug", literal_column("NULL")).label("slug"),
+                    top.c.rank,
+                    func.ts_headline(config, literal_column(f"coalesce({body}, '')"), query, _HEADLINE_OPTIONS).label("snippet"),
+                )
+                .join(top, model.id == top.c.id)
+            )
+            for row in rows:
+                snippet = html.escape(row.snippet).replace(_START, "<mark>").replace(_STOP, "</mark>")
+                results.append({
+                    "kind": kind,
+                    "id": row.id,
+                    "title": row.title,
+                    "slug": row.slug,
+                    "snippet": snippet,
+                    "score": round(float(row.rank), 4),
+                })
+        results.sort(key=lambda item: item["score"], reverse=True)
+        return results[:limit]
+
+
+search = CRUDSearch()
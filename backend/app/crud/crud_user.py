@@ -1,35 +1,56 @@
 from typing import Any, Dict, Optional, Union
-from sqlalchemy.orm import Session
-from app.core.security import get_password_hash, verify_password
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import CacheBackend, LRUCache, NullCache, caches, from_row, to_row
+from app.core.config import settings
+from app.core.hashing import password_hasher
 from app.models.models import User
 from app.schemas.user import UserCreate, UserUpdate
 
 class CRUDUser:
-    def get(self, db: Session, *, id: int) -> Optional[User]:
-        return db.query(User).filter(User.id == id).first()
-    
-    def get_by_email(self, db: Session, *, email: str) -> Optional[User]:
-        return db.query(User).filter(User.email == email).first()
+    def __init__(self, cache: Optional[CacheBackend] = None):
+        # Short-TTL principal cache; cleared on every commit that touches the user table
+        self.cache = cache if cache is not None else caches.get(User.__table__.name)
 
-    def create(self, db: Session, *, obj_in: UserCreate) -> User:
+    async def get(self, db: AsyncSession, *, id: int) -> Optional[User]:
+        result = await db.execute(select(User).where(User.id == id))
+        return result.scalars().first()
+
+    async def get_principal(self, db: AsyncSession, *, id: int, iat: Optional[int] = None) -> Optional[User]:
+        """User behind an access token, cached by (sub, iat) for AUTH_CACHE_TTL_SECONDS."""
+        async def load():
+            return to_row(await self.get(db, id=id))
+
+        row = await self.cache.get_or_load(("principal", id, iat), load)
+        return await from_row(db, User, row)
+
+    async def get_by_email(self, db: AsyncSession, *, email: str) -> Optional[User]:
+        result = await db.execute(select(User).where(User.email == email))
+        return result.scalars().first()
+
+    async def create(self, db: AsyncSession, *, obj_in: UserCreate) -> User:
+        # bcrypt CPU-bound; ayrı ve sınırlı bir havuzda çalışır (bkz. app.core.hashing)
+        hashed_password = await password_hasher.hash(obj_in.password)
         db_obj = User(
             email=obj_in.email,
-            hashed_password=get_password_hash(obj_in.password),
+            hashed_password=hashed_password,
             full_name=obj_in.full_name,
             is_superuser=obj_in.is_superuser,
         )
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
         return db_obj
 
-    def authenticate(
-        self, db: Session, *, email: str, password: str
+    async def authenticate(
+        self, db: AsyncSession, *, email: str, password: str
     ) -> Optional[User]:
-        user = self.get_by_email(db, email=email)
+        user = await self.get_by_email(db, email=email)
         if not user:
+            # Bilinmeyen e-posta da aynı bcrypt süresini harcar (zamanlama ile ayırt edilemesin)
+            await password_hasher.verify_dummy(password)
             return None
-        if not verify_password(password, user.hashed_password):
+        if not await password_hasher.verify(password, user.hashed_password):
             return None
         return user
 
@@ -39,26 +60,32 @@ class CRUDUser:
     def is_superuser(self, user: User) -> bool:
         return user.is_superuser
 
-    def update(
-        self, db: Session, *, db_obj: User, obj_in: Union[UserUpdate, Dict[str, Any]]
+    async def update(
+        self, db: AsyncSession, *, db_obj: User, obj_in: Union[UserUpdate, Dict[str, Any]]
     ) -> User:
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.dict(exclude_unset=True)
-        
+
         if "password" in update_data and update_data["password"]:
-            hashed_password = get_password_hash(update_data["password"])
+            hashed_password = await password_hasher.hash(update_data["password"])
             del update_data["password"]
             update_data["hashed_password"] = hashed_password
-            
+
         for field in update_data:
             if hasattr(db_obj, field):
                 setattr(db_obj, field, update_data[field])
 
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        await db.commit()
+        await db.refresh(db_obj)
         return db_obj
 
-user = CRUDUser()
+user = CRUDUser(
+    cache=caches.register(
+        User.__table__.name,
+        LRUCache(maxsize=settings.AUTH_CACHE_MAX_ENTRIES, ttl=settings.AUTH_CACHE_TTL_SECONDS)
+        if settings.CACHE_ENABLED else NullCache(),
+    )
+)
@@ -5,6 +5,9 @@ from sqlalchemy.ext.declarative import as_declarative, declared_attr
 class Base:
     id: Any
     __name__: str
+    # Sunucu tarafı default/onupdate değerlerini (updated_at) flush sırasında geri al;
+    # async session'da commit sonrası lazy-load yapılamaz.
+    __mapper_args__ = {"eager_defaults": True}
     # Generate __tablename__ automatically
     @declared_attr
     def __tablename__(cls) -> str:
@@ -0,0 +1,63 @@
+"""
+Commit-level change tracking for ORM models.
+
+Every flush records which tables were touched; once the surrounding
+transaction commits, subscribers are told about those tables. Read-side
+caches hook in here instead of every write endpoint invalidating by hand.
+"""
+from typing import Callable, List, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+_PENDING_KEY = "changed_tables"
+
+_subscribers: List[Callable[[Set[str]], None]] = []
+
+
+def subscribe(callback: Callable[[Set[str]], None]) -> Callable[[Set[str]], None]:
+    """Register a callback that receives the set of changed table names."""
+    _subscribers.append(callback)
+    return callback
+
+
+def notify(tables: Set[str]) -> None:
+    """Tell every subscriber that the given tables changed."""
+    for callback in list(_subscribers):
+        callback(set(tables))
+
+
+def mark_changed(session: Session, *tables: str) -> None:
+    """Record tables changed outside the unit of work (e.g. bulk statements)."""
+    session.info.setdefault(_PENDING_KEY, set()).update(tables)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed(session: Session, flush_context) -> None:
+    # new/dirty/deleted still describe the pre-flush state at this point
+    changed = {
+        obj.__table__.name
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if hasattr(obj, "__table__")
+    }
+    if changed:
+        mark_changed(session, *changed)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_statements(orm_execute_state) -> None:
+    # ORM-enabled update()/delete() bypass the unit of work and never flush
+    if (orm_execute_state.is_update or orm_execute_state.is_delete) and orm_execute_state.bind_mapper:
+        mark_changed(orm_execute_state.session, orm_execute_state.bind_mapper.local_table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_committed(session: Session) -> None:
+    tables = session.info.pop(_PENDING_KEY, None)
+    if tables:
+        notify(tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,101 @@
+"""
+Connection pool instrumentation.
+
+The pool classes below time every checkout (including the pre-ping round
+trip) and feed a per-engine ``PoolStats``. Stats are keyed by the pool's
+``logging_name`` so they survive ``engine.dispose()`` recreating the pool.
+"""
+import bisect
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Histogram bucket upper bounds, in seconds
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class PoolStats:
+    """Checkout counters and latency histogram for one engine's pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def observe(self, seconds: float, *, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+            self.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+    def snapshot(self, pool: Pool) -> Dict[str, Any]:
+        histogram = {str(bound): count for bound, count in zip(LATENCY_BUCKETS, self.buckets)}
+        histogram["+Inf"] = self.buckets[-1]
+        stats = {
+            "pool_class": type(pool).__name__,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": round(self.wait_seconds_total, 6),
+            "wait_seconds_max": round(self.wait_seconds_max, 6),
+            "wait_seconds_avg": round(self.wait_seconds_total / self.checkouts, 6) if self.checkouts else 0.0,
+            "checkout_latency_histogram": histogram,
+        }
+        if isinstance(pool, QueuePool):
+            stats.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                overflow=pool.overflow(),
+                max_overflow=pool._max_overflow,
+                timeout=pool.timeout(),
+            )
+        return stats
+
+
+_stats: Dict[str, PoolStats] = {}
+_stats_lock = threading.Lock()
+
+
+def stats_for(name: str) -> PoolStats:
+    with _stats_lock:
+        if name not in _stats:
+            _stats[name] = PoolStats()
+        return _stats[name]
+
+
+def all_stats() -> Dict[str, PoolStats]:
+    with _stats_lock:
+        return dict(_stats)
+
+
+class _TimedCheckout:
+    """Mixin that times ``Pool.connect()`` (queue wait + connect + pre-ping)."""
+
+    def connect(self):
+        stats = stats_for(self._orig_logging_name or "default")
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            stats.observe(time.perf_counter() - start, timed_out=True)
+            raise
+        stats.observe(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
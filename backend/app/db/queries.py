@@ -0,0 +1,119 @@
+"""
+Per-request SQL instrumentation.
+
+``instrument(engine)`` hooks an engine's cursor events (called from
+``app.db.session`` for the sync and async engines). While a ``track()``
+block is active, every statement adds to its ``QueryTracker``: statement
+count, total time, and how often each distinct SQL text ran. Statements
+slower than DB_SLOW_QUERY_MS are logged with parameter values replaced by
+their type names, inside or outside a request. ``repeated()`` lists
+statements that ran at least DB_REPEATED_QUERY_THRESHOLD times in one
+request, the usual shape of an N+1 loop.
+"""
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Loglarda gösterilecek en uzun SQL metni (karakter)
+MAX_LOGGED_STATEMENT = 500
+
+
+class QueryTracker:
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Dict[str, int] = {}
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        self.statements[statement] = self.statements.get(statement, 0) + 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statements executed ``threshold`` or more times, most repeated first."""
+        return sorted(
+            ((statement, count) for statement, count in self.statements.items() if count >= threshold),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+
+
+_current: ContextVar[Optional[QueryTracker]] = ContextVar("query_tracker", default=None)
+
+
+@contextmanager
+def track() -> Iterator[QueryTracker]:
+    """Bind a tracker to the current context; nested calls share the outer one."""
+    tracker = _current.get()
+    if tracker is not None:
+        yield tracker
+        return
+    tracker = QueryTracker()
+    token = _current.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current.reset(token)
+
+
+def _compact(statement: str) -> str:
+    statement = " ".join(statement.split())
+    if len(statement) > MAX_LOGGED_STATEMENT:
+        statement = statement[:MAX_LOGGED_STATEMENT] + "..."
+    return statement
+
+
+def _placeholder(value: Any) -> Any:
+    return None if value is None else f"<{type(value).__name__}>"
+
+
+def redact(parameters: Any) -> Any:
+    """Replace parameter values with their type names; executemany batches become a row count."""
+    if isinstance(parameters, dict):
+        return {key: _placeholder(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return f"<{len(parameters)} rows>"
+        return tuple(_placeholder(value) for value in parameters)
+    return _placeholder(parameters)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    tracker = _current.get()
+    if tracker is not None:
+        tracker.record(statement, elapsed)
+    if elapsed * 1000 >= settings.DB_SLOW_QUERY_MS:
+        logger.warning("Yavaş sorgu (%.1f ms): %s | parametreler: %s", elapsed * 1000, _compact(statement), redact(parameters))
+
+
+def _handle_error(exception_context):
+    # Hata alan sorguda after_cursor_execute çağrılmaz; başlangıç zamanı yığında kalmasın
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_start"):
+        connection.info["query_start"].pop()
+
+
+def instrument(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+def report_repeats(tracker: QueryTracker, request_label: str) -> None:
+    """Log statements repeated often enough within one request to suggest an N+1."""
+    for statement, count in tracker.repeated(settings.DB_REPEATED_QUERY_THRESHOLD):
+        logger.warning("Olası N+1: %s isteğinde aynı sorgu %d kez çalıştı: %s", request_label, count, _compact(statement))
@@ -1,18 +1,82 @@
+from typing import Any, AsyncGenerator, Dict, Tuple
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.db import changes  # noqa: F401  (registers commit listeners)
+from app.db import queries
+from app.db.pool import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+
+
+def get_pool_options(url: URL, poolclass, logging_name: str) -> Dict[str, Any]:
+    """Pool settings from Settings. SQLite keeps SQLAlchemy's default pool."""
+    if url.get_backend_name() == "sqlite":
+        return {}
+    return {
+        "poolclass": poolclass,
+        "pool_logging_name": logging_name,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
 
 # PostgreSQL için check_same_thread gerekmez.
+# Senkron engine: init_db.py, migrate_*.py gibi scriptler için
 engine = create_engine(
-    settings.DATABASE_URL
+    settings.DATABASE_URL,
+    **get_pool_options(make_url(settings.DATABASE_URL), InstrumentedQueuePool, "sync"),
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Veritabanı oturumunu yöneten bağımlılık (Dependency)
-def get_db():
-    db = SessionLocal()
-    try:
+queries.instrument(engine)
+
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url(database_url: str) -> Tuple[URL, dict]:
+    """Translate a sync DATABASE_URL into its async driver equivalent.
+
+    asyncpg does not understand libpq's ``sslmode`` query parameter, so it is
+    moved into ``connect_args`` instead.
+    """
+    url = make_url(database_url)
+    backend, _, driver = url.drivername.partition("+")
+    connect_args = {}
+    if backend in _ASYNC_DRIVERS and driver not in ("asyncpg", "aiosqlite"):
+        url = url.set(drivername=_ASYNC_DRIVERS[backend])
+    if url.drivername == "postgresql+asyncpg" and "sslmode" in url.query:
+        sslmode = url.query["sslmode"]
+        url = url.difference_update_query(["sslmode"])
+        if sslmode != "disable":
+            connect_args["ssl"] = sslmode
+    return url, connect_args
+
+
+# Asenkron engine: tüm API endpointleri bunu kullanır
+_async_url, _async_connect_args = get_async_database_url(settings.ASYNC_DATABASE_URL or settings.DATABASE_URL)
+async_engine = create_async_engine(
+    _async_url,
+    connect_args=_async_connect_args,
+    **get_pool_options(_async_url, InstrumentedAsyncQueuePool, "async"),
+)
+
+# Sorgu sayısı/süresi, yavaş sorgu logu ve tekrar eden sorgu tespiti (bkz. app.db.queries)
+queries.instrument(async_engine.sync_engine)
+
+# expire_on_commit=False: commit sonrası response serileştirmesi ekstra sorgu atmasın
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# Veritabanı oturumunu yöneten tek bağımlılık (Dependency)
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
@@ -1,42 +1,112 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 import os
+import secrets
 
 from app.api.v1.api import api_router # Endpointlerin toplandığı yer
-from app.db.session import engine     # Supabase bağlantısı
+from app.db.session import engine, async_engine  # Supabase bağlantısı
 from app.models.models import Base    # Modellerinin merkezi
 from app.core.config import settings  # Ayarlar
+from app.core.bodylimit import BodySizeLimitMiddleware
+from app.core.compression import CompressionMiddleware, compressed_bodies
+from app.core.hashing import HasherBusy, password_hasher
+from app.core.images import image_processor
+from app.core.ingest import message_queue
+from app.core import metrics
+from app.core.profiling import QueryProfilerMiddleware
+from app.core.ratelimit import RateLimitMiddleware, rate_limiter
+from app.core.storage import storage
+from app.core.uploads import UploadsApp
 
 # Tabloları Supabase üzerinde otomatik oluştur
 # Not: Modellerin Base'e kayıtlı olduğundan emin ol (from app.db.base_class import Base)
 Base.metadata.create_all(bind=engine)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await password_hasher.warm_up()
+    await storage.startup()
+    await message_queue.start()
+    yield
+    # Kapanışta bekleyen mesajları yaz, ardından async bağlantı havuzunu, storage istemcisini ve işçi havuzlarını temizle
+    await message_queue.stop()
+    await rate_limiter.aclose()
+    await storage.aclose()
+    await async_engine.dispose()
+    password_hasher.shutdown()
+    image_processor.shutdown()
+
 app = FastAPI(
     title="Portfolio API",
     description="Backend API for Portfolio and Admin Panel",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS ayarları - Environment variable'dan al
 allowed_origins_str = settings.ALLOWED_ORIGINS
 origins = [origin.strip().rstrip("/") for origin in allowed_origins_str.split(",")]
 
+# Yükleme uçlarında gövde sınırı: büyük dosya geçici diske yazılmadan 413 ile reddedilir
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_bytes=settings.MAX_UPLOAD_BYTES,
+    paths=[f"{settings.API_V1_STR}/resources/upload", f"{settings.API_V1_STR}/projects/upload-image"],
+)
+
+# Login ve iletişim formu için istek sınırı; routing'den önce çalışır, reddedilen istek
+# oturum açmaz ve şifre hash'lemez. CORS'un içinde kalır ki 429 yanıtı tarayıcıda okunabilsin
+app.add_middleware(
+    RateLimitMiddleware,
+    limiter=rate_limiter,
+    enabled=settings.RATE_LIMIT_ENABLED,
+)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "Retry-After", "X-DB-Queries", "Server-Timing"],
+)
+
+# gzip/brotli; public yanıtların sıkıştırılmış hali ETag başına bir kez üretilir
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MIN_SIZE,
+    cache=compressed_bodies,
+)
+
+# İstek başına sorgu sayısı/süresi; production dışında X-DB-Queries ve Server-Timing başlıkları eklenir
+app.add_middleware(
+    QueryProfilerMiddleware,
+    expose_headers=settings.ENVIRONMENT != "production",
 )
 
+# En dışta: süre, boyut (sıkıştırılmış) ve 429'lar dahil tüm istekler ölçülür
+if settings.METRICS_ENABLED:
+    app.add_middleware(metrics.MetricsMiddleware)
+
 app.router.redirect_slashes = False
 
-# Resim yüklemeleri için klasör yönetimi
-if not os.path.exists("uploads"):
-    os.makedirs("uploads")
+# bcrypt kuyruğu dolu (login, şifre değişikliği, kullanıcı oluşturma): bekletmek yerine hemen reddet
+@app.exception_handler(HasherBusy)
+async def hasher_busy_handler(request: Request, exc: HasherBusy):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Sunucu yoğun, lütfen tekrar deneyin"},
+        headers={"Retry-After": "1"},
+    )
 
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+# Resim yüklemeleri için klasör yönetimi (STORAGE_BACKEND=local bu klasöre yazar)
+if not os.path.exists(settings.LOCAL_STORAGE_DIR):
+    os.makedirs(settings.LOCAL_STORAGE_DIR)
+
+# Hash'li dosyalar immutable cache, Range, .br/.gz kardeşleri ve zero-copy gönderim ile sunulur
+app.mount("/uploads", UploadsApp(directory=settings.LOCAL_STORAGE_DIR), name="uploads")
 
 # Tüm route'ları (projects, blog, user vb.) buraya bağlar
 app.include_router(api_router, prefix="/api/v1")
@@ -47,4 +117,14 @@ def root():
         "message": "Portfolio API is running",
         "status": "connected",
         "docs": "/docs"
-    }
\ No newline at end of file
+    }
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    def read_metrics(request: Request):
+        """Prometheus scrape endpoint; requires ``Bearer METRICS_TOKEN`` when one is set."""
+        if settings.METRICS_TOKEN:
+            authorization = request.headers.get("authorization", "")
+            if not secrets.compare_digest(authorization, f"Bearer {settings.METRICS_TOKEN}"):
+                raise HTTPException(status_code=403, detail="Geçersiz metrik erişim anahtarı")
+        return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
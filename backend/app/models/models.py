@@ -1,7 +1,40 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, JSON, Index, text
 from sqlalchemy.sql import func
 from app.db.base_class import Base
 
+# Arama dilleri -> Postgres text search yapılandırması
+SEARCH_CONFIGS = {"tr": "turkish", "en": "english"}
+
+def search_vector(lang: str, title: str, body: str) -> str:
+    """tsvector SQL for (title, body) columns; titles rank above body text.
+
+    The same string is used for the GIN index and for queries so that the
+    planner can match the indexed expression.
+    """
+    config = SEARCH_CONFIGS[lang]
+    return (
+        f"setweight(to_tsvector('{config}'::regconfig, coalesce({title}, '')), 'A') || "
+        f"setweight(to_tsvector('{config}'::regconfig, coalesce({body}, '')), 'B')"
+    )
+
+# İngilizce alanlar boşsa Türkçe içerik aranır (sitedeki gösterimle aynı)
+PROJECT_SEARCH_FIELDS = {
+    "tr": ("title", "description"),
+    "en": ("coalesce(title_en, title)", "coalesce(description_en, description)"),
+}
+BLOG_SEARCH_FIELDS = {
+    "tr": ("title", "content"),
+    "en": ("coalesce(title_en, title)", "coalesce(content_en, content)"),
+}
+
+def _search_indexes(prefix: str, fields) -> tuple:
+    # Fonksiyonel GIN indeksleri yalnızca Postgres'te oluşturulur; ifade indeksi çift parantez ister
+    return tuple(
+        Index(f"{prefix}_search_{lang}", text(f"({search_vector(lang, *columns)})"), postgresql_using="gin")
+        .ddl_if(dialect="postgresql")
+        for lang, columns in fields.items()
+    )
+
 class User(Base):
     id = Column(Integer, primary_key=True, index=True)
     full_name = Column(String, index=True)
@@ -25,6 +58,8 @@ class Project(Base):
     description = Column(Text)
     description_en = Column(Text, nullable=True)
     image_url = Column(String)
+    image_variants = Column(JSON, nullable=True) # {"320": url, "640": url, ...} (srcset)
+    image_placeholder = Column(Text, nullable=True) # Bulanık WebP data URI
     github_url = Column(String)
     live_url = Column(String)
     technologies = Column(JSON) # List of tags
@@ -33,7 +68,13 @@ class Project(Base):
     order = Column(Integer, default=0)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    
+
+    # Public liste: WHERE is_published ORDER BY order / Admin liste: ORDER BY order
+    __table_args__ = (
+        Index("ix_project_published_order", "is_published", "order"),
+        Index("ix_project_order", "order"),
+        *_search_indexes("ix_project", PROJECT_SEARCH_FIELDS),
+    )
 
 class Service(Base):
     id = Column(Integer, primary_key=True, index=True)
@@ -69,6 +110,12 @@ class Message(Base):
     is_read = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    # Gelen kutusu keyset sayfalama (created_at, id) ve okunmamış filtresi için
+    __table_args__ = (
+        Index("ix_message_created_at_id", "created_at", "id"),
+        Index("ix_message_is_read_created_at_id", "is_read", "created_at", "id"),
+    )
+
 class BlogPost(Base):
     __tablename__ = "blog_posts"
     id = Column(Integer, primary_key=True, index=True)
@@ -78,6 +125,8 @@ class BlogPost(Base):
     content = Column(Text)
     content_en = Column(Text, nullable=True)
     image_url = Column(String)
+    image_variants = Column(JSON, nullable=True) # {"320": url, "640": url, ...} (srcset)
+    image_placeholder = Column(Text, nullable=True) # Bulanık WebP data URI
     external_url = Column(String, nullable=True)
     tags = Column(JSON) # List of tags
     is_published = Column(Boolean, default=False)
@@ -85,6 +134,13 @@ class BlogPost(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # Public liste: WHERE is_published ORDER BY order / Admin liste: ORDER BY order
+    __table_args__ = (
+        Index("ix_blog_posts_published_order", "is_published", "order"),
+        Index("ix_blog_posts_order", "order"),
+        *_search_indexes("ix_blog_posts", BLOG_SEARCH_FIELDS),
+    )
+
 class About(Base):
     __tablename__ = "about"
     id = Column(Integer, primary_key=True, index=True)
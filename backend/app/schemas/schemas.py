@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 # Project Schemas
@@ -9,6 +9,8 @@ class ProjectBase(BaseModel):
     description: str
     description_en: Optional[str] = None
     image_url: Optional[str] = None
+    image_variants: Optional[Dict[str, str]] = None  # genişlik -> URL (srcset)
+    image_placeholder: Optional[str] = None
     github_url: Optional[str] = None
     live_url: Optional[str] = None
     technologies: List[str] = []
@@ -25,6 +27,8 @@ class ProjectUpdate(BaseModel):
     description: Optional[str] = None
     description_en: Optional[str] = None
     image_url: Optional[str] = None
+    image_variants: Optional[Dict[str, str]] = None  # genişlik -> URL (srcset)
+    image_placeholder: Optional[str] = None
     github_url: Optional[str] = None
     live_url: Optional[str] = None
     technologies: Optional[List[str]] = None
@@ -40,6 +44,28 @@ class Project(ProjectBase):
     class Config:
         from_attributes = True
 
+class ProjectSummary(BaseModel):
+    """Card view of a project: the description is replaced by a short excerpt."""
+    id: int
+    title: str
+    title_en: Optional[str] = None
+    excerpt: Optional[str] = None
+    excerpt_en: Optional[str] = None
+    image_url: Optional[str] = None
+    image_variants: Optional[Dict[str, str]] = None
+    image_placeholder: Optional[str] = None
+    github_url: Optional[str] = None
+    live_url: Optional[str] = None
+    technologies: List[str] = []
+    is_featured: bool = False
+    is_published: bool = True
+    order: int = 0
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
 # Service Schemas
 class ServiceBase(BaseModel):
     title: str
@@ -129,6 +155,8 @@ class BlogPostBase(BaseModel):
     content: str
     content_en: Optional[str] = None
     image_url: Optional[str] = None
+    image_variants: Optional[Dict[str, str]] = None  # genişlik -> URL (srcset)
+    image_placeholder: Optional[str] = None
     external_url: Optional[str] = None
     tags: List[str] = []
     is_published: bool = False
@@ -144,6 +172,8 @@ class BlogPostUpdate(BaseModel):
     content: Optional[str] = None
     content_en: Optional[str] = None
     image_url: Optional[str] = None
+    image_variants: Optional[Dict[str, str]] = None  # genişlik -> URL (srcset)
+    image_placeholder: Optional[str] = None
     external_url: Optional[str] = None
     tags: Optional[List[str]] = None
     is_published: Optional[bool] = None
@@ -157,6 +187,41 @@ class BlogPost(BlogPostBase):
     class Config:
         from_attributes = True
 
+class TocEntry(BaseModel):
+    level: int
+    id: str  # başlığın HTML id'si
+    title: str
+
+class BlogPostDetail(BlogPost):
+    """A post with its Markdown rendered to sanitized HTML (GET /blog/{slug})."""
+    content_html: Optional[str] = None
+    content_html_en: Optional[str] = None
+    toc: List[TocEntry] = []
+    toc_en: List[TocEntry] = []
+    reading_time: Optional[int] = None  # dakika
+    reading_time_en: Optional[int] = None
+
+class BlogPostSummary(BaseModel):
+    """Card view of a post: the body is replaced by a short excerpt (see /blog/{slug})."""
+    id: int
+    title: str
+    title_en: Optional[str] = None
+    slug: str
+    excerpt: Optional[str] = None
+    excerpt_en: Optional[str] = None
+    image_url: Optional[str] = None
+    image_variants: Optional[Dict[str, str]] = None
+    image_placeholder: Optional[str] = None
+    external_url: Optional[str] = None
+    tags: List[str] = []
+    is_published: bool = False
+    order: int = 0
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
 # About Schemas
 class AboutBase(BaseModel):
     full_name: Optional[str] = None
@@ -222,3 +287,21 @@ class Settings(SettingsBase):
 
     class Config:
         from_attributes = True
+
+# Public Bundle Schema
+class PublicBundle(BaseModel):
+    about: Optional[About] = None
+    settings: Settings
+    projects: List[Project] = []
+    blog: List[BlogPostSummary] = []  # tam metin: /resources/blog/{slug}
+    timeline: List[Timeline] = []
+    services: List[Service] = []
+
+# Search Schema
+class SearchResult(BaseModel):
+    kind: str  # project, blog
+    id: int
+    title: str
+    slug: Optional[str] = None
+    snippet: str  # HTML; yalnızca <mark> etiketleri içerir
+    score: float
@@ -7,3 +7,4 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     sub: Optional[int] = None
+    iat: Optional[int] = None
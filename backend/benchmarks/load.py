@@ -0,0 +1,323 @@
+"""
+End-to-end load benchmark.
+
+Seeds a fresh database (a temporary SQLite file, or a throwaway PostgreSQL
+database when --postgres-url points at a server), boots the app with
+uvicorn, drives public and admin endpoints concurrently with httpx and
+prints a JSON report with throughput and p50/p95/p99 latency per route. The
+data and the request mix only depend on --seed, so reports from different
+commits can be compared with --compare.
+
+    cd backend && python -m benchmarks.load --duration 30 --concurrency 32 --output after.json
+    cd backend && python -m benchmarks.load --compare before.json after.json
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from benchmarks import seed as seeding
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEARCH_TERMS = ["fastapi", "postgresql", "önbellek", "react", "docker", "metrik", "cache", "görsel"]
+
+
+@dataclass(frozen=True)
+class Route:
+    name: str  # rapordaki anahtar: "METHOD şablon"
+    weight: int
+    build: Callable[[random.Random, Dict], Tuple[str, str, Optional[dict]]]
+    admin: bool = False
+    write: bool = False
+
+
+def _get(path: str) -> Callable:
+    return lambda rng, data: ("GET", path, None)
+
+
+def _message(rng: random.Random, data: Dict):
+    return "POST", "/api/v1/resources/messages", {
+        "sender_name": f"Yük testi {rng.randint(1, 10 ** 6)}",
+        "sender_email": "load@example.com",
+        "subject": "Benchmark",
+        "content": "Bu mesaj yük testi tarafından gönderildi.",
+    }
+
+
+# Ağırlıklar kabaca ziyaretçi trafiğini yansıtır: çoğunlukla public okuma, az sayıda yazma ve admin
+ROUTES = [
+    Route("GET /api/v1/public/bundle", 10, _get("/api/v1/public/bundle")),
+    Route("GET /api/v1/public/bundle?lang=en", 3, _get("/api/v1/public/bundle?lang=en")),
+    Route("GET /api/v1/projects/", 5, _get("/api/v1/projects/")),
+    Route("GET /api/v1/resources/blog?view=summary", 5, _get("/api/v1/resources/blog?view=summary")),
+    Route(
+        "GET /api/v1/resources/blog/{slug}", 8,
+        lambda rng, data: ("GET", f"/api/v1/resources/blog/{rng.choice(data['slugs'])}", None),
+    ),
+    Route("GET /api/v1/resources/services", 2, _get("/api/v1/resources/services")),
+    Route("GET /api/v1/resources/timeline", 2, _get("/api/v1/resources/timeline")),
+    Route("GET /api/v1/resources/about", 2, _get("/api/v1/resources/about")),
+    Route("GET /api/v1/resources/settings", 2, _get("/api/v1/resources/settings")),
+    Route(
+        "GET /api/v1/search/", 3,
+        lambda rng, data: ("GET", f"/api/v1/search/?q={rng.choice(SEARCH_TERMS)}", None),
+    ),
+    Route("POST /api/v1/resources/messages", 1, _message, write=True),
+    Route("GET /api/v1/resources/messages", 2, _get("/api/v1/resources/messages?limit=50"), admin=True),
+    Route("GET /api/v1/resources/messages/unread-count", 2, _get("/api/v1/resources/messages/unread-count"), admin=True),
+    Route("GET /api/v1/projects/admin", 1, _get("/api/v1/projects/admin"), admin=True),
+    Route("GET /api/v1/resources/blog/admin", 1, _get("/api/v1/resources/blog/admin"), admin=True),
+]
+
+
+def percentile(sorted_samples: List[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(p / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples: List[float], errors: int, duration: float) -> Dict:
+    samples = sorted(samples)
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "throughput_rps": round(len(samples) / duration, 2),
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 3) if samples else 0.0,
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p95_ms": round(percentile(samples, 95) * 1000, 3),
+        "p99_ms": round(percentile(samples, 99) * 1000, 3),
+        "max_ms": round(samples[-1] * 1000, 3) if samples else 0.0,
+    }
+
+
+@contextmanager
+def database(postgres_url: Optional[str], workdir: str) -> Iterator[str]:
+    """Yield a DATABASE_URL for an empty database; a PostgreSQL one is dropped afterwards."""
+    if not postgres_url:
+        yield f"sqlite:///{os.path.join(workdir, 'bench.db')}"
+        return
+    import psycopg2
+    from sqlalchemy.engine import make_url
+
+    name = f"bench_{os.getpid()}_{int(time.time())}"
+    admin = psycopg2.connect(postgres_url)
+    admin.autocommit = True
+    try:
+        with admin.cursor() as cursor:
+            cursor.execute(f'CREATE DATABASE "{name}"')
+        yield make_url(postgres_url).set(database=name).render_as_string(hide_password=False)
+    finally:
+        with admin.cursor() as cursor:
+            cursor.execute("SELECT pg_terminate_backend(pid) FROM pg_stat_activity WHERE datname = %s", (name,))
+            cursor.execute(f'DROP DATABASE IF EXISTS "{name}"')
+        admin.close()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def server(database_url: str, workdir: str, *, workers: int, environment: str) -> Iterator[str]:
+    """Run uvicorn against database_url; yields the base URL once it answers."""
+    port = _free_port()
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "ASYNC_DATABASE_URL": "",
+        "ENVIRONMENT": environment,
+        "SECRET_KEY": os.urandom(32).hex(),
+        # Tüm istekler tek IP'den geldiği için sınır ölçümü bozar
+        "RATE_LIMIT_ENABLED": "false",
+        "RATE_LIMIT_REDIS_URL": "",
+        "STORAGE_BACKEND": "local",
+        "LOCAL_STORAGE_DIR": os.path.join(workdir, "uploads"),
+        "MESSAGE_SPOOL_DIR": os.path.join(workdir, "spool"),
+    }
+    log = open(os.path.join(workdir, "server.log"), "w")
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--no-access-log", "--log-level", "warning",
+        ],
+        cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + 60
+        while True:
+            if process.poll() is not None:
+                log.flush()
+                with open(log.name) as output:
+                    raise RuntimeError(f"Server exited during startup:\n{output.read()}")
+            try:
+                if httpx.get(base_url + "/", timeout=1).status_code == 200:
+                    break
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError("Server did not become ready within 60 s")
+            time.sleep(0.2)
+        yield base_url
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        log.close()
+
+
+async def _worker(client, routes, weights, rng, data, headers, deadline, results) -> None:
+    while time.perf_counter() < deadline:
+        route = rng.choices(routes, weights)[0]
+        method, path, body = route.build(rng, data)
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, path, json=body, headers=headers if route.admin else None)
+            failed = response.status_code >= 400
+        except httpx.HTTPError:
+            failed = True
+        elapsed = time.perf_counter() - start
+        samples, errors = results.setdefault(route.name, ([], [0]))
+        if failed:
+            errors[0] += 1
+        else:
+            samples.append(elapsed)
+
+
+async def drive(base_url: str, routes: List[Route], *, concurrency: int, duration: float, warmup: float, seed: int, data: Dict) -> Dict:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        response = await client.post(
+            "/api/v1/auth/login", data={"username": seeding.ADMIN_EMAIL, "password": seeding.ADMIN_PASSWORD}
+        )
+        response.raise_for_status()
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+        weights = [route.weight for route in routes]
+
+        async def run(seconds: float, results: Dict) -> float:
+            # Her işçinin kendi RNG'si: istek dizisi seed ile tekrarlanabilir
+            deadline = time.perf_counter() + seconds
+            start = time.perf_counter()
+            await asyncio.gather(*(
+                _worker(client, routes, weights, random.Random(seed * 1000 + index), data, headers, deadline, results)
+                for index in range(concurrency)
+            ))
+            return time.perf_counter() - start
+
+        if warmup > 0:
+            await run(warmup, {})
+        results: Dict[str, Tuple[List[float], List[int]]] = {}
+        elapsed = await run(duration, results)
+
+    all_samples = [sample for samples, _ in results.values() for sample in samples]
+    all_errors = sum(errors[0] for _, errors in results.values())
+    return {
+        "total": summarize(all_samples, all_errors, elapsed),
+        "routes": {name: summarize(samples, errors[0], elapsed) for name, (samples, errors) in sorted(results.items())},
+    }
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(["git", *args], cwd=BACKEND_DIR, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(before_path: str, after_path: str) -> None:
+    """Print per-route p50/p95/p99 and throughput changes between two reports."""
+    with open(before_path) as before_file, open(after_path) as after_file:
+        before, after = json.load(before_file), json.load(after_file)
+    print(f"{before['meta'].get('commit', '?')[:10]} -> {after['meta'].get('commit', '?')[:10]}")
+    print(f"{'route':<52}{'p50 ms':>18}{'p95 ms':>18}{'p99 ms':>18}{'rps':>18}")
+    rows = [("total", before["total"], after["total"])]
+    rows += [(name, before["routes"][name], stats) for name, stats in after["routes"].items() if name in before["routes"]]
+    for name, old, new in rows:
+        cells = []
+        for key in ("p50_ms", "p95_ms", "p99_ms", "throughput_rps"):
+            change = (new[key] - old[key]) / old[key] * 100 if old[key] else 0.0
+            cells.append(f"{new[key]:>9.1f} ({change:+5.0f}%)")
+        print(f"{name:<52}" + "".join(f"{cell:>18}" for cell in cells))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="compare two JSON reports and exit")
+    parser.add_argument("--postgres-url", default=os.getenv("BENCH_POSTGRES_URL"),
+                        help="server to create a throwaway database on (default: SQLite)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=20.0, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=3.0, help="unmeasured seconds before the run")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--environment", default="production", help="ENVIRONMENT for the server")
+    parser.add_argument("--no-admin", action="store_true", help="skip authenticated admin routes")
+    parser.add_argument("--no-writes", action="store_true", help="skip POST /resources/messages")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    seeding.add_volume_arguments(parser)
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    volumes = seeding.volumes_from_args(args)
+    routes = [route for route in ROUTES if not (args.no_admin and route.admin) and not (args.no_writes and route.write)]
+    with tempfile.TemporaryDirectory(prefix="bench-") as workdir, database(args.postgres_url, workdir) as database_url:
+        counts = seeding.seed(database_url, volumes, args.seed)
+        data = {"slugs": [row["slug"] for row in seeding.generate(volumes, args.seed)[seeding.BlogPost] if row["is_published"]]}
+        with server(database_url, workdir, workers=args.workers, environment=args.environment) as base_url:
+            results = asyncio.run(drive(
+                base_url, routes,
+                concurrency=args.concurrency, duration=args.duration, warmup=args.warmup, seed=args.seed, data=data,
+            ))
+
+    report = {
+        "meta": {
+            "commit": _git("rev-parse", "HEAD"),
+            "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "database": "postgresql" if args.postgres_url else "sqlite",
+            "rows": counts,
+            "volumes": asdict(volumes),
+            "seed": args.seed,
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "workers": args.workers,
+            "environment": args.environment,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        **results,
+    }
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as report_file:
+            report_file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+Synthetic data for load benchmarks.
+
+Fills a fresh database with projects, services, timeline items, messages and
+blog posts whose bodies are Turkish/English Markdown (headings, lists, code
+blocks, tables, links), plus the about/settings rows and an admin user. The
+output only depends on --seed and the volumes, so runs on different commits
+see identical data.
+
+    cd backend && python -m benchmarks.seed --database-url sqlite:///bench.db --posts 200
+"""
+import argparse
+import os
+import random
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+# Ayarların yüklenebilmesi için; seed() kendi engine'ini açar
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from app.core.security import get_password_hash
+from app.db.base_class import Base
+from app.models.models import About, BlogPost, Message, Project, Service, Settings, TimelineItem, User
+
+# EmailStr ayrılmış alan adlarını (.local, .test) reddeder; /auth/me yanıtı doğrulanabilsin
+ADMIN_EMAIL = "admin@example.com"
+ADMIN_PASSWORD = "bench-admin-password"
+
+# Sabit tarih: aynı seed her commit'te aynı created_at değerlerini üretsin
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+TOPICS = [
+    ("FastAPI ile asenkron servisler", "Async services with FastAPI"),
+    ("PostgreSQL indeks stratejileri", "PostgreSQL indexing strategies"),
+    ("React performans ipuçları", "React performance tips"),
+    ("Önbellek katmanları", "Caching layers"),
+    ("Docker ile dağıtım", "Deploying with Docker"),
+    ("Tip güvenli API istemcileri", "Type-safe API clients"),
+    ("Gözlemlenebilirlik ve metrikler", "Observability and metrics"),
+    ("Görsel optimizasyonu", "Image optimization"),
+]
+SENTENCES = {
+    "tr": [
+        "Bu bölümde gerçek bir projede karşılaştığımız sorunları ele alıyoruz.",
+        "Ölçüm yapmadan yapılan optimizasyon çoğu zaman yanlış yere odaklanır.",
+        "Veritabanına giden her istek gecikmeye ve bağlantı havuzuna yük bindirir.",
+        "Önbelleğin geçersiz kılınması en az doldurulması kadar önemlidir.",
+        "Küçük yanıt gövdeleri mobil ağlarda belirgin bir fark yaratır.",
+        "Şemaları tek bir yerde tutmak istemci ile sunucunun uyumlu kalmasını sağlar.",
+        "Çalışma zamanı profilleri darboğazın nerede olduğunu açıkça gösterir.",
+        "İş parçacığı havuzu dolduğunda yeni istekler sırada beklemeye başlar.",
+        "Türkçe karakterler (ç, ğ, ı, ö, ş, ü) arama ve sıralamada özel ilgi ister.",
+    ],
+    "en": [
+        "In this section we look at problems we hit in a real project.",
+        "Optimizing without measuring usually focuses on the wrong place.",
+        "Every request that reaches the database adds latency and pool pressure.",
+        "Invalidating a cache matters as much as filling it.",
+        "Smaller response bodies make a noticeable difference on mobile networks.",
+        "Keeping schemas in one place keeps the client and server in sync.",
+        "Runtime profiles show clearly where the bottleneck is.",
+        "Once the thread pool is full, new requests start to queue.",
+        "Non-ASCII text needs special care in search and sorting.",
+    ],
+}
+HEADINGS = {
+    "tr": ["Giriş", "Sorun", "Ölçüm", "Çözüm", "Sonuçlar", "Sonraki adımlar"],
+    "en": ["Introduction", "The problem", "Measuring", "The fix", "Results", "Next steps"],
+}
+CODE_SAMPLES = [
+    ("python", "async def read_items(db: AsyncSession):\n    result = await db.execute(select(Item))\n    return result.scalars().all()"),
+    ("sql", "CREATE INDEX CONCURRENTLY ix_items_created_at\n    ON items (created_at DESC, id DESC);"),
+    ("tsx", "const items = useMemo(() => sortBy(data, 'order'), [data]);"),
+]
+TECHNOLOGIES = ["Python", "FastAPI", "PostgreSQL", "React", "TypeScript", "Docker", "Redis", "Tailwind", "SQLAlchemy", "Vite"]
+
+
+@dataclass
+class Volumes:
+    projects: int = 50
+    posts: int = 200
+    timeline: int = 30
+    services: int = 12
+    messages: int = 5000
+    paragraphs: int = 12  # yazı başına, dil başına
+
+
+def _paragraph(rng: random.Random, lang: str) -> str:
+    return " ".join(rng.choice(SENTENCES[lang]) for _ in range(rng.randint(3, 6)))
+
+
+def markdown(rng: random.Random, lang: str, title: str, paragraphs: int) -> str:
+    """A blog body with the constructs the renderer handles (TOC headings, lists, code, tables)."""
+    parts = [f"# {title}", _paragraph(rng, lang)]
+    headings = HEADINGS[lang]
+    for index in range(paragraphs):
+        if index % 3 == 0:
+            parts.append(f"## {headings[(index // 3) % len(headings)]}")
+        kind = rng.random()
+        if kind < 0.15:
+            language, code = rng.choice(CODE_SAMPLES)
+            parts.append(f"```{language}\n{code}\n```")
+        elif kind < 0.25:
+            items = rng.sample(TECHNOLOGIES, 4)
+            parts.append("\n".join(f"- **{item}**: {rng.choice(SENTENCES[lang])}" for item in items))
+        elif kind < 0.30:
+            header = "| Ölçüm | Önce | Sonra |" if lang == "tr" else "| Metric | Before | After |"
+            rows = [f"| p{p} | {rng.randint(80, 400)} ms | {rng.randint(10, 80)} ms |" for p in (50, 95, 99)]
+            parts.append("\n".join([header, "|---|---:|---:|", *rows]))
+        else:
+            parts.append(_paragraph(rng, lang) + f" [{'kaynak' if lang == 'tr' else 'source'}](https://example.com/{rng.randint(1, 999)})")
+    return "\n\n".join(parts)
+
+
+def generate(volumes: Volumes, seed: int = 0) -> Dict[type, List[dict]]:
+    """Rows per model; deterministic for a given seed."""
+    rng = random.Random(seed)
+    rows: Dict[type, List[dict]] = {}
+
+    rows[Project] = [
+        {
+            "title": f"Proje {index}: {rng.choice(TOPICS)[0]}",
+            "title_en": f"Project {index}: {rng.choice(TOPICS)[1]}",
+            "description": " ".join(_paragraph(rng, "tr") for _ in range(3)),
+            "description_en": " ".join(_paragraph(rng, "en") for _ in range(3)),
+            "image_url": f"https://example.com/uploads/images/{rng.getrandbits(256):064x}.jpg",
+            "image_variants": {str(width): f"https://example.com/uploads/images/p{index}_{width}w.webp" for width in (320, 640, 1280)},
+            "github_url": f"https://github.com/example/project-{index}",
+            "live_url": f"https://project-{index}.example.com",
+            "technologies": rng.sample(TECHNOLOGIES, 4),
+            "is_featured": index < 6,
+            "is_published": rng.random() < 0.9,
+            "order": index,
+            "created_at": EPOCH + timedelta(days=index),
+        }
+        for index in range(volumes.projects)
+    ]
+
+    posts = []
+    for index in range(volumes.posts):
+        title_tr, title_en = rng.choice(TOPICS)
+        posts.append({
+            "title": f"{title_tr} #{index}",
+            "title_en": f"{title_en} #{index}",
+            "slug": f"yazi-{index}",
+            "content": markdown(rng, "tr", f"{title_tr} #{index}", volumes.paragraphs),
+            # Yazıların bir kısmının çevirisi yok; ?lang=en Türkçeye düşer
+            "content_en": markdown(rng, "en", f"{title_en} #{index}", volumes.paragraphs) if rng.random() < 0.8 else None,
+            "image_url": f"https://example.com/uploads/images/{rng.getrandbits(256):064x}.jpg",
+            "image_variants": {str(width): f"https://example.com/uploads/images/b{index}_{width}w.webp" for width in (320, 640, 1280)},
+            "tags": rng.sample(TECHNOLOGIES, 3),
+            "is_published": rng.random() < 0.9,
+            "order": index,
+            "created_at": EPOCH + timedelta(hours=index * 7),
+            "updated_at": EPOCH + timedelta(hours=index * 7 + 1),
+        })
+    rows[BlogPost] = posts
+
+    rows[TimelineItem] = [
+        {
+            "year": str(2025 - index),
+            "year_en": str(2025 - index),
+            "title": f"Kıdemli Geliştirici {index}",
+            "title_en": f"Senior Developer {index}",
+            "company": f"Şirket {index}",
+            "company_en": f"Company {index}",
+            "description": _paragraph(rng, "tr"),
+            "description_en": _paragraph(rng, "en"),
+            "icon": rng.choice(["work", "school", "laptop_mac", "star"]),
+            "order": index,
+        }
+        for index in range(volumes.timeline)
+    ]
+
+    rows[Service] = [
+        {
+            "title": f"Hizmet {index}",
+            "title_en": f"Service {index}",
+            "description": _paragraph(rng, "tr"),
+            "description_en": _paragraph(rng, "en"),
+            "icon": "code",
+            "icon_color": "#6366f1",
+            "status": "Yayında",
+            "tags": rng.sample(TECHNOLOGIES, 3),
+            "order": index,
+        }
+        for index in range(volumes.services)
+    ]
+
+    rows[Message] = [
+        {
+            "sender_name": f"Gönderen {index}",
+            "sender_email": f"user{index}@example.com",
+            "subject": rng.choice(["Genel", "Proje teklifi", "İş birliği", "Soru"]),
+            "content": _paragraph(rng, rng.choice(["tr", "en"])),
+            "is_read": rng.random() < 0.7,
+            "created_at": EPOCH + timedelta(minutes=index * 13),
+        }
+        for index in range(volumes.messages)
+    ]
+
+    rows[About] = [{
+        "full_name": "Bench Kullanıcı",
+        "title": "Yazılım Geliştirici",
+        "title_en": "Software Developer",
+        "bio": " ".join(_paragraph(rng, "tr") for _ in range(4)),
+        "bio_en": " ".join(_paragraph(rng, "en") for _ in range(4)),
+        "email": "hello@example.com",
+        "location": "İstanbul",
+        "skills": [{"name": name, "level": rng.randint(60, 100)} for name in TECHNOLOGIES],
+        "experience": [{"company": f"Şirket {index}", "role": "Geliştirici"} for index in range(5)],
+        "education": [{"school": "Üniversite", "degree": "Bilgisayar Mühendisliği"}],
+        "social_links": {"github": "https://github.com/example"},
+    }]
+    rows[Settings] = [{
+        "site_title": "Portfolyo",
+        "site_title_en": "Portfolio",
+        "site_description": _paragraph(rng, "tr"),
+        "site_description_en": _paragraph(rng, "en"),
+        "site_author": "Bench",
+        "contact_email": "hello@example.com",
+    }]
+    return rows
+
+
+def seed(database_url: str, volumes: Volumes, seed: int = 0) -> Dict[str, int]:
+    """Recreate all tables at database_url and insert the generated rows; returns row counts."""
+    engine = create_engine(database_url)
+    try:
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        counts = {}
+        with Session(engine) as db:
+            for model, model_rows in generate(volumes, seed).items():
+                if model_rows:
+                    db.execute(insert(model), model_rows)
+                counts[model.__tablename__] = len(model_rows)
+            db.execute(insert(User), [{
+                "email": ADMIN_EMAIL,
+                "hashed_password": get_password_hash(ADMIN_PASSWORD),
+                "full_name": "Admin",
+                "is_active": True,
+                "is_superuser": True,
+            }])
+            db.commit()
+        return counts
+    finally:
+        engine.dispose()
+
+
+def add_volume_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = Volumes()
+    for name, value in asdict(defaults).items():
+        parser.add_argument(f"--{name}", type=int, default=value)
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def volumes_from_args(args: argparse.Namespace) -> Volumes:
+    return Volumes(**{name: getattr(args, name) for name in asdict(Volumes())})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", required=True)
+    add_volume_arguments(parser)
+    args = parser.parse_args()
+    print(seed(args.database_url, volumes_from_args(args), args.seed))
+
+
+if __name__ == "__main__":
+    main()
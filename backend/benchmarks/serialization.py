@@ -0,0 +1,98 @@
+"""
+Microbenchmark: per-item cost of serializing the public blog listing.
+
+Compares the previous path (``model_validate`` + ``model_dump(mode="json")``
+per row, then the stdlib encoder) with the current one (a single list
+validation through a cached TypeAdapter, then pydantic-core ``to_json``).
+
+    cd backend && python -m benchmarks.serialization --items 200 --repeat 50
+"""
+import argparse
+import json
+import os
+import statistics
+import time
+from datetime import datetime, timezone
+
+import pydantic_core
+
+# Veritabanına bağlanılmaz; ayarların yüklenebilmesi için yeterli
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app import schemas
+from app.core import http_cache
+from app.models.models import BlogPost
+
+PARAGRAPH_TR = (
+    "Bu yazıda **FastAPI** ile asenkron bir portfolyo arka ucunu nasıl "
+    "ölçeklendirdiğimizi anlatıyorum. Önbellek, sıkıştırma ve `ETag` başlıkları "
+    "sayesinde çoğu istek veritabanına hiç uğramıyor.\n\n"
+)
+PARAGRAPH_EN = (
+    "In this post I describe how we scaled an async portfolio backend with "
+    "**FastAPI**. Thanks to caching, compression and `ETag` headers most "
+    "requests never reach the database.\n\n"
+)
+
+
+def make_posts(count: int, paragraphs: int):
+    now = datetime.now(timezone.utc)
+    return [
+        BlogPost(
+            id=index + 1,
+            title=f"Yazı {index}",
+            title_en=f"Post {index}",
+            slug=f"post-{index}",
+            content=f"# Başlık {index}\n\n" + PARAGRAPH_TR * paragraphs,
+            content_en=f"# Title {index}\n\n" + PARAGRAPH_EN * paragraphs,
+            image_url=f"https://example.com/uploads/images/{index:064x}.jpg",
+            image_variants={str(width): f"https://example.com/{index}_{width}w.webp" for width in (320, 640, 1280)},
+            tags=["python", "fastapi", "performans"],
+            is_published=True,
+            order=index,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(count)
+    ]
+
+
+def legacy(schema, rows) -> bytes:
+    payload = [schema.model_validate(row).model_dump(mode="json") for row in rows]
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def current(schema, rows) -> bytes:
+    return pydantic_core.to_json(http_cache.to_jsonable(schema, rows))
+
+
+def measure(func, rows, repeat: int) -> float:
+    """Median seconds per call."""
+    func(schemas.BlogPost, rows)  # ısınma (TypeAdapter oluşturma vb.)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(schemas.BlogPost, rows)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--paragraphs", type=int, default=10, help="Markdown paragraphs per language")
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = make_posts(args.items, args.paragraphs)
+    assert json.loads(legacy(schemas.BlogPost, rows)) == json.loads(current(schemas.BlogPost, rows))
+
+    print(f"{args.items} posts, {len(current(schemas.BlogPost, rows)) / 1024:.0f} KiB JSON")
+    results = {name: measure(func, rows, args.repeat) for name, func in (("legacy", legacy), ("current", current))}
+    for name, seconds in results.items():
+        print(f"{name:>8}: {seconds * 1000:8.2f} ms/listing  {seconds / args.items * 1e6:8.1f} us/item")
+    print(f" speedup: {results['legacy'] / results['current']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
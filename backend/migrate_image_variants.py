@@ -0,0 +1,33 @@
+import sys
+import os
+
+# Ensure backend directory is in path
+sys.path.insert(0, os.getcwd())
+
+from app.db.session import engine
+from sqlalchemy import text
+
+COLUMNS = [
+    ("project", "image_variants", "JSON"),
+    ("project", "image_placeholder", "TEXT"),
+    ("blog_posts", "image_variants", "JSON"),
+    ("blog_posts", "image_placeholder", "TEXT"),
+]
+
+def migrate():
+    try:
+        with engine.connect() as conn:
+            for table, column, column_type in COLUMNS:
+                print(f"Attempting to add '{column}' column to {table}...")
+                try:
+                    conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}"))
+                    conn.commit()
+                    print(f"Migration successful: Added '{column}' column to {table}")
+                except Exception as e:
+                    conn.rollback()
+                    print(f"Column might already exist or error occurred: {e}")
+    except Exception as e:
+        print(f"Migration failed: {e}")
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,29 @@
+import sys
+import os
+
+# Ensure backend directory is in path
+sys.path.insert(0, os.getcwd())
+
+from app.db.session import engine
+from sqlalchemy import text
+
+INDEXES = [
+    'CREATE INDEX IF NOT EXISTS ix_project_published_order ON project (is_published, "order")',
+    'CREATE INDEX IF NOT EXISTS ix_project_order ON project ("order")',
+    'CREATE INDEX IF NOT EXISTS ix_blog_posts_published_order ON blog_posts (is_published, "order")',
+    'CREATE INDEX IF NOT EXISTS ix_blog_posts_order ON blog_posts ("order")',
+]
+
+def migrate():
+    try:
+        with engine.connect() as conn:
+            for statement in INDEXES:
+                print(f"Running: {statement}")
+                conn.execute(text(statement))
+            conn.commit()
+            print("Migration successful: Added listing indexes to project and blog_posts")
+    except Exception as e:
+        print(f"Migration failed: {e}")
+
+if __name__ == "__main__":
+    migrate()
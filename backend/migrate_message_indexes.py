@@ -0,0 +1,27 @@
+import sys
+import os
+
+# Ensure backend directory is in path
+sys.path.insert(0, os.getcwd())
+
+from app.db.session import engine
+from sqlalchemy import text
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_message_created_at_id ON message (created_at, id)",
+    "CREATE INDEX IF NOT EXISTS ix_message_is_read_created_at_id ON message (is_read, created_at, id)",
+]
+
+def migrate():
+    try:
+        with engine.connect() as conn:
+            for statement in INDEXES:
+                print(f"Running: {statement}")
+                conn.execute(text(statement))
+            conn.commit()
+            print("Migration successful: Added inbox indexes to message")
+    except Exception as e:
+        print(f"Migration failed: {e}")
+
+if __name__ == "__main__":
+    migrate()
@@ -0,0 +1,31 @@
+import sys
+import os
+
+# Ensure backend directory is in path
+sys.path.insert(0, os.getcwd())
+
+from app.db.session import engine
+from app.models.models import Project, BlogPost
+from sqlalchemy.schema import CreateIndex
+
+def migrate():
+    if engine.dialect.name != "postgresql":
+        print("Skipped: full-text indexes are Postgres-only (SQLite uses the in-process index)")
+        return
+    try:
+        with engine.connect() as conn:
+            for table in (Project.__table__, BlogPost.__table__):
+                for index in table.indexes:
+                    if not index.name.endswith(("_search_tr", "_search_en")):
+                        continue
+                    # Same expression as the model, so the planner can use it for /search
+                    statement = CreateIndex(index, if_not_exists=True)
+                    print(f"Running: {statement.compile(dialect=engine.dialect)}")
+                    conn.execute(statement)
+            conn.commit()
+            print("Migration successful: Added full-text search indexes to project and blog_posts")
+    except Exception as e:
+        print(f"Migration failed: {e}")
+
+if __name__ == "__main__":
+    migrate()
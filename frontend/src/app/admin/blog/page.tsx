@@ -78,7 +78,7 @@ export default function BlogManagement() {
     const [loading, setLoading] = useState(true);
     const [isModalOpen, setIsModalOpen] = useState(false);
     const [currentPost, setCurrentPost] = useState<any>(null); // For editing
-    const [formData, setFormData] = useState({ title: '', title_en: '', slug: '', content: '', content_en: '', image_url: '', external_url: '', is_published: false });
+    const [formData, setFormData] = useState({ title: '', title_en: '', slug: '', content: '', content_en: '', image_url: '', image_variants: null as Record<string, string> | null, image_placeholder: null as string | null, external_url: '', is_published: false });
 
     const sensors = useSensors(
         useSensor(PointerSensor),
@@ -93,7 +93,7 @@ export default function BlogManagement() {
 
     const fetchPosts = async () => {
         try {
-            const data = await api.getBlogPosts();
+            const data = await api.getAdminBlogPosts();
             setPosts(data);
         } catch (error) {
             console.error('Blog yazıları yüklenemedi:', error);
@@ -112,12 +112,14 @@ export default function BlogManagement() {
                 content: post.content,
                 content_en: post.content_en || '',
                 image_url: post.image_url || '',
+                image_variants: post.image_variants || null,
+                image_placeholder: post.image_placeholder || null,
                 external_url: post.external_url || '',
                 is_published: post.is_published
             });
         } else {
             setCurrentPost(null);
-            setFormData({ title: '', title_en: '', slug: '', content: '', content_en: '', image_url: '', external_url: '', is_published: false });
+            setFormData({ title: '', title_en: '', slug: '', content: '', content_en: '', image_url: '', image_variants: null as Record<string, string> | null, image_placeholder: null as string | null, external_url: '', is_published: false });
         }
         setIsModalOpen(true);
     };
@@ -270,7 +272,7 @@ export default function BlogManagement() {
                                         <span className="text-admin-muted text-xs uppercase font-bold">Resim Linki (URL)</span>
                                         <input
                                             value={formData.image_url}
-                                            onChange={(e) => setFormData({ ...formData, image_url: e.target.value })}
+                                            onChange={(e) => setFormData({ ...formData, image_url: e.target.value, image_variants: null, image_placeholder: null })}
                                             placeholder="https://example.com/image.jpg"
                                             className="bg-admin-bg border border-admin-border rounded-xl px-4 py-3 text-white focus:outline-none focus:border-admin-primary"
                                         />
@@ -289,7 +291,7 @@ export default function BlogManagement() {
                                                         try {
                                                             const res = await api.uploadImage(file);
                                                             // Backend returns { image_url: "..." }
-                                                            setFormData({ ...formData, image_url: res.image_url || '' });
+                                                            setFormData({ ...formData, image_url: res.image_url || '', image_variants: res.image_variants || null, image_placeholder: res.image_placeholder || null });
                                                         } catch (err) {
                                                             console.error(err);
                                                             alert("Resim yüklenirken hata oluştu.");
@@ -311,7 +313,7 @@ export default function BlogManagement() {
                                             <img src={formData.image_url} alt="Önizleme" className="w-full h-full object-cover" />
                                             <button
                                                 type="button"
-                                                onClick={() => setFormData({ ...formData, image_url: '' })}
+                                                onClick={() => setFormData({ ...formData, image_url: '', image_variants: null, image_placeholder: null })}
                                                 className="absolute top-2 right-2 p-1 bg-black/50 text-white rounded-full hover:bg-red-500 transition-colors"
                                             >
                                                 <span className="material-symbols-outlined text-sm">close</span>
@@ -23,7 +23,7 @@ export default function AdminDashboard() {
                 setStatsData(stats);
 
                 // Fetch recent projects
-                const projects = await api.getProjects();
+                const projects = await api.getAdminProjects();
                 if (Array.isArray(projects)) {
                     setRecentProjects(projects.slice(0, 3));
                 }
@@ -23,6 +23,8 @@ export default function EditProject({ params }: { params: Promise<{ id: string }
         description_en: '',
         content: '',
         image_url: '',
+        image_variants: null as Record<string, string> | null,
+        image_placeholder: null as string | null,
         github_url: '',
         live_url: '',
         is_featured: false,
@@ -42,6 +44,8 @@ export default function EditProject({ params }: { params: Promise<{ id: string }
                     description_en: project.description_en || '',
                     content: project.content || '',
                     image_url: project.image_url || '',
+                    image_variants: project.image_variants || null,
+                    image_placeholder: project.image_placeholder || null,
                     github_url: project.github_url || '',
                     live_url: project.live_url || '',
                     is_featured: project.is_featured || false,
@@ -81,7 +85,7 @@ export default function EditProject({ params }: { params: Promise<{ id: string }
 
         try {
             const res = await api.uploadProjectImage(file);
-            setFormData({ ...formData, image_url: res.image_url });
+            setFormData({ ...formData, image_url: res.image_url, image_variants: res.image_variants || null, image_placeholder: res.image_placeholder || null });
         } catch (err: any) {
             setError('Görsel yüklenirken bir hata oluştu.');
         } finally {
@@ -324,7 +328,7 @@ export default function EditProject({ params }: { params: Promise<{ id: string }
                                 <div className="flex gap-2">
                                     <input
                                         value={formData.image_url}
-                                        onChange={(e) => setFormData({ ...formData, image_url: e.target.value })}
+                                        onChange={(e) => setFormData({ ...formData, image_url: e.target.value, image_variants: null, image_placeholder: null })}
                                         className="flex-1 bg-admin-surface-light border border-admin-border rounded-xl px-4 py-2 text-xs text-white focus:ring-1 focus:ring-admin-primary outline-none"
                                         placeholder="Görsel URL veya dosya seçin"
                                     />
@@ -18,6 +18,8 @@ export default function NewProject() {
         description_en: '',
         content: '',
         image_url: '',
+        image_variants: null as Record<string, string> | null,
+        image_placeholder: null as string | null,
         github_url: '',
         live_url: '',
         is_featured: false,
@@ -51,7 +53,7 @@ export default function NewProject() {
 
         try {
             const res = await api.uploadProjectImage(file);
-            setFormData({ ...formData, image_url: res.image_url });
+            setFormData({ ...formData, image_url: res.image_url, image_variants: res.image_variants || null, image_placeholder: res.image_placeholder || null });
         } catch (err: any) {
             setError('Görsel yüklenirken bir hata oluştu.');
         } finally {
@@ -276,7 +278,7 @@ export default function NewProject() {
                                 <div className="flex gap-2">
                                     <input
                                         value={formData.image_url}
-                                        onChange={(e) => setFormData({ ...formData, image_url: e.target.value })}
+                                        onChange={(e) => setFormData({ ...formData, image_url: e.target.value, image_variants: null, image_placeholder: null })}
                                         className="flex-1 bg-admin-surface-light border border-admin-border rounded-xl px-4 py-2 text-xs text-white focus:ring-1 focus:ring-admin-primary outline-none"
                                         placeholder="Görsel URL veya dosya seçin"
                                     />
@@ -123,7 +123,7 @@ export default function ProjectsManagement() {
     useEffect(() => {
         const fetchProjects = async () => {
             try {
-                const data = await api.getProjects();
+                const data = await api.getAdminProjects();
                 setProjects(data);
             } catch (error) {
                 console.error('Projeler yüklenirken hata:', error);
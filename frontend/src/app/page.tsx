@@ -11,14 +11,17 @@ const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000/api/v1
 
 async function getInitialData() {
   try {
-    const [about, projects, blog, timeline] = await Promise.all([
-      fetch(`${API_URL}/resources/about`, { next: { revalidate: 60 } }).then(res => res.ok ? res.json() : null),
-      fetch(`${API_URL}/projects/`, { next: { revalidate: 60 } }).then(res => res.ok ? res.json() : []),
-      fetch(`${API_URL}/resources/blog`, { next: { revalidate: 60 } }).then(res => res.ok ? res.json() : []),
-      fetch(`${API_URL}/resources/timeline`, { next: { revalidate: 60 } }).then(res => res.ok ? res.json() : []),
-    ]);
+    // Tek istekte tüm public içerik (about, projeler, blog, timeline)
+    const res = await fetch(`${API_URL}/public/bundle`, { next: { revalidate: 60 } });
+    if (!res.ok) throw new Error(`Bundle request failed: ${res.status}`);
+    const bundle = await res.json();
 
-    return { about, projects, blog, timeline };
+    return {
+      about: bundle.about ?? null,
+      projects: bundle.projects ?? [],
+      blog: bundle.blog ?? [],
+      timeline: bundle.timeline ?? [],
+    };
   } catch (error) {
     console.error("Initial data fetch failed:", error);
     return { about: null, projects: [], blog: [], timeline: [] };
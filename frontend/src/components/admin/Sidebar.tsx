@@ -27,10 +27,8 @@ const Sidebar = () => {
     React.useEffect(() => {
         const fetchCount = async () => {
             try {
-                const messages = await api.getMessages();
-                if (Array.isArray(messages)) {
-                    setMessageCount(messages.filter((m: any) => !m.is_read).length);
-                }
+                const counts = await api.getMessageCounts();
+                setMessageCount(counts?.unread ?? 0);
             } catch (error) {
                 console.error('Sidebar count error:', error);
             }
@@ -2,16 +2,22 @@
 
 import React, { useState, useEffect } from 'react';
 import { api } from '@/utils/api';
+import { CARD_IMAGE_SIZES, ImageVariants, toSrcSet } from '@/utils/images';
 import { useTranslation } from 'react-i18next';
 
 interface BlogPost {
     id: string | number;
     title: string;
     title_en?: string;
-    description?: string;
+    excerpt?: string;
+    excerpt_en?: string;
     content?: string;
     content_en?: string;
+    content_html?: string | null; // Sunucuda işlenmiş, temizlenmiş HTML
+    content_html_en?: string | null;
     image_url?: string;
+    image_variants?: ImageVariants;
+    image_placeholder?: string | null;
     link?: string; // External link
     pubDate?: string;
     source: 'internal' | 'medium';
@@ -39,10 +45,14 @@ const Blog = ({ initialData }: BlogProps) => {
                     id: p.id,
                     title: p.title,
                     title_en: p.title_en,
-                    description: p.content ? p.content.substring(0, 150) + "..." : "",
+                    // Liste yanıtı yalnızca özet içerir; tam metin modal açılınca yüklenir
+                    excerpt: p.excerpt ?? p.content,
+                    excerpt_en: p.excerpt_en ?? p.content_en,
                     content: p.content,
                     content_en: p.content_en,
                     image_url: p.image_url,
+                    image_variants: p.image_variants,
+                    image_placeholder: p.image_placeholder,
                     link: p.external_url,
                     pubDate: p.created_at,
                     source: (p.external_url ? 'medium' : 'internal') as 'internal' | 'medium',
@@ -75,11 +85,27 @@ const Blog = ({ initialData }: BlogProps) => {
 
 
 
-    const handleCardClick = (post: BlogPost) => {
+    const handleCardClick = async (post: BlogPost) => {
         if (post.link) {
             window.open(post.link, '_blank');
-        } else {
-            setSelectedPost(post);
+            return;
+        }
+        setSelectedPost(post);
+        if (post.content === undefined && post.slug) {
+            try {
+                const full = await api.getBlogPost(post.slug);
+                const loaded = {
+                    ...post,
+                    content: full.content,
+                    content_en: full.content_en,
+                    content_html: full.content_html,
+                    content_html_en: full.content_html_en,
+                };
+                setPosts(prev => prev.map(p => (p.id === post.id ? loaded : p)));
+                setSelectedPost(current => (current?.id === post.id ? loaded : current));
+            } catch (error) {
+                console.error("Blog yazısı yüklenirken hata:", error);
+            }
         }
     };
 
@@ -119,8 +145,8 @@ const Blog = ({ initialData }: BlogProps) => {
                     ) : (
                         posts.map((post, index) => {
                             const currentTitle = (isEn && post.title_en) ? post.title_en : post.title;
-                            const currentContent = (isEn && post.content_en) ? post.content_en : post.content;
-                            const currentDesc = currentContent ? currentContent.substring(0, 150) + "..." : "";
+                            const currentExcerpt = (isEn && post.excerpt_en) ? post.excerpt_en : post.excerpt;
+                            const currentDesc = currentExcerpt ? currentExcerpt.substring(0, 150) + "..." : "";
 
                             return (
                                 <div
@@ -131,20 +157,22 @@ const Blog = ({ initialData }: BlogProps) => {
                                     {/* Image Container */}
                                     <div className="relative h-48 w-full overflow-hidden bg-white/5">
                                         <div className="absolute inset-0 bg-gradient-to-t from-background via-transparent to-transparent opacity-90 z-10"></div>
-                                        <div
-                                            className="w-full h-full bg-cover bg-center transition-transform duration-700 group-hover:scale-110"
-                                            style={{
-                                                backgroundImage: post.image_url
-                                                    ? `url(${post.image_url})`
-                                                    : 'none'
-                                            }}
-                                        >
-                                            {!post.image_url && (
-                                                <div className="flex items-center justify-center h-full text-gray-600">
-                                                    <span className="material-symbols-outlined text-4xl">article</span>
-                                                </div>
-                                            )}
-                                        </div>
+                                        {post.image_url ? (
+                                            <img
+                                                src={post.image_url}
+                                                srcSet={toSrcSet(post.image_variants)}
+                                                sizes={CARD_IMAGE_SIZES}
+                                                loading="lazy"
+                                                decoding="async"
+                                                alt={currentTitle}
+                                                className="w-full h-full object-cover bg-cover bg-center transition-transform duration-700 group-hover:scale-110"
+                                                style={{ backgroundImage: post.image_placeholder ? `url(${post.image_placeholder})` : 'none' }}
+                                            />
+                                        ) : (
+                                            <div className="flex items-center justify-center h-full text-gray-600">
+                                                <span className="material-symbols-outlined text-4xl">article</span>
+                                            </div>
+                                        )}
 
                                         {/* Source Badge */}
                                         <div className="absolute top-4 right-4 z-20">
@@ -194,7 +222,7 @@ const Blog = ({ initialData }: BlogProps) => {
 
                             <div className="relative h-64 w-full">
                                 {selectedPost.image_url ? (
-                                    <img src={selectedPost.image_url} alt={(isEn && selectedPost.title_en) ? selectedPost.title_en : selectedPost.title} className="w-full h-full object-cover" />
+                                    <img src={selectedPost.image_url} srcSet={toSrcSet(selectedPost.image_variants)} sizes="(min-width: 768px) 768px, 100vw" alt={(isEn && selectedPost.title_en) ? selectedPost.title_en : selectedPost.title} className="w-full h-full object-cover" />
                                 ) : (
                                     <div className="w-full h-full bg-gradient-to-br from-gray-800 to-black flex items-center justify-center">
                                         <span className="material-symbols-outlined text-6xl text-white/20">article</span>
@@ -205,11 +233,21 @@ const Blog = ({ initialData }: BlogProps) => {
 
                             <div className="p-8">
                                 <h2 className="text-3xl font-bold text-white mb-6">{(isEn && selectedPost.title_en) ? selectedPost.title_en : selectedPost.title}</h2>
-                                <div className="prose prose-invert max-w-none text-gray-300">
-                                    <p className="whitespace-pre-wrap leading-relaxed">
-                                        {(isEn && selectedPost.content_en) ? selectedPost.content_en : selectedPost.content}
-                                    </p>
-                                </div>
+                                {selectedPost.content_html ? (
+                                    <div
+                                        className="prose prose-invert max-w-none text-gray-300"
+                                        dangerouslySetInnerHTML={{
+                                            __html: (isEn && selectedPost.content_html_en) ? selectedPost.content_html_en : selectedPost.content_html
+                                        }}
+                                    />
+                                ) : (
+                                    <div className="prose prose-invert max-w-none text-gray-300">
+                                        <p className="whitespace-pre-wrap leading-relaxed">
+                                            {((isEn && selectedPost.content_en) ? selectedPost.content_en : selectedPost.content)
+                                                ?? ((isEn && selectedPost.excerpt_en) ? selectedPost.excerpt_en : selectedPost.excerpt)}
+                                        </p>
+                                    </div>
+                                )}
                             </div>
                         </div>
                     </div>
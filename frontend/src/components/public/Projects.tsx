@@ -3,6 +3,7 @@
 import React, { useState, useEffect } from 'react';
 import { Github } from 'lucide-react';
 import { api } from '@/utils/api';
+import { CARD_IMAGE_SIZES, toSrcSet } from '@/utils/images';
 import { useTranslation } from 'react-i18next';
 
 interface ProjectProps {
@@ -85,20 +86,22 @@ const Projects = ({ initialData }: ProjectProps) => {
                             {/* Image Container */}
                             <div className="relative h-48 w-full overflow-hidden bg-white/5">
                                 <div className="absolute inset-0 bg-gradient-to-t from-background via-transparent to-transparent opacity-90 z-10"></div>
-                                <div
-                                    className="w-full h-full bg-cover bg-center transition-transform duration-700 group-hover:scale-110"
-                                    style={{
-                                        backgroundImage: project.image_url
-                                            ? `url(${project.image_url.startsWith('http') ? project.image_url : `http://localhost:8000${project.image_url}`})`
-                                            : 'none'
-                                    }}
-                                >
-                                    {!project.image_url && (
-                                        <div className="flex items-center justify-center h-full text-gray-600">
-                                            <span className="material-symbols-outlined text-5xl">image</span>
-                                        </div>
-                                    )}
-                                </div>
+                                {project.image_url ? (
+                                    <img
+                                        src={project.image_url.startsWith('http') ? project.image_url : `http://localhost:8000${project.image_url}`}
+                                        srcSet={toSrcSet(project.image_variants)}
+                                        sizes={CARD_IMAGE_SIZES}
+                                        loading="lazy"
+                                        decoding="async"
+                                        alt={(isEn && project.title_en) ? project.title_en : project.title}
+                                        className="w-full h-full object-cover bg-cover bg-center transition-transform duration-700 group-hover:scale-110"
+                                        style={{ backgroundImage: project.image_placeholder ? `url(${project.image_placeholder})` : 'none' }}
+                                    />
+                                ) : (
+                                    <div className="flex items-center justify-center h-full text-gray-600">
+                                        <span className="material-symbols-outlined text-5xl">image</span>
+                                    </div>
+                                )}
                                 <div className="absolute inset-0 z-20 flex items-center justify-center opacity-0 group-hover:opacity-100 transition-opacity duration-300 bg-background/60 ">
                                     {project.live_url && <a href={project.live_url} target="_blank" rel="noopener noreferrer" className="flex items-center gap-2 bg-primary text-black px-5 py-2.5 rounded-full font-bold text-sm transform translate-y-4 group-hover:translate-y-0 transition-all duration-300 shadow-[0_0_20px_rgba(59,130,246,0.4)] hover:scale-105">
                                         <span>{isEn ? 'Live Demo' : 'Canlı Demo'}</span>
@@ -83,6 +83,19 @@ export const api = {
         return response.json();
     },
 
+    // Admin listesi: taslaklar dahil
+    async getAdminProjects() {
+        const token = localStorage.getItem('token');
+        const response = await fetch(`${API_URL}/projects/admin`, {
+            credentials: 'include',
+            headers: {
+                'Authorization': `Bearer ${token}`
+            }
+        });
+        if (!response.ok) throw new Error('Projeler yüklenemedi');
+        return response.json();
+    },
+
     async getProject(projectId: number) {
         const response = await fetch(`${API_URL}/projects/${projectId}`, {
             credentials: 'include'
@@ -273,7 +286,7 @@ export const api = {
 
     async getMessages() {
         const token = localStorage.getItem('token');
-        const response = await fetch(`${API_URL}/resources/messages`, {
+        const response = await fetch(`${API_URL}/resources/messages?limit=100`, {
             credentials: 'include',
             headers: {
                 'Authorization': `Bearer ${token}`
@@ -283,6 +296,19 @@ export const api = {
         return response.json();
     },
 
+    // Sadece sayılar: { total, unread } - tüm listeyi indirmeden
+    async getMessageCounts() {
+        const token = localStorage.getItem('token');
+        const response = await fetch(`${API_URL}/resources/messages/unread-count`, {
+            credentials: 'include',
+            headers: {
+                'Authorization': `Bearer ${token}`
+            }
+        });
+        if (!response.ok) throw new Error('Mesaj sayısı alınamadı');
+        return response.json();
+    },
+
     async deleteMessage(id: number) {
         const token = localStorage.getItem('token');
         const response = await fetch(`${API_URL}/resources/messages/${id}`, {
@@ -310,10 +336,33 @@ export const api = {
     },
 
     // Blog
+    // Kart görünümü: içerik yerine kısa özet (excerpt) döner
     async getBlogPosts() {
-        const response = await fetch(`${API_URL}/resources/blog`, {
+        const response = await fetch(`${API_URL}/resources/blog?view=summary`, {
+            credentials: 'include'
+        });
+        if (!response.ok) throw new Error('Blog yazıları yüklenemedi');
+        return response.json();
+    },
+
+    // Yazının tamamı
+    async getBlogPost(slug: string) {
+        const response = await fetch(`${API_URL}/resources/blog/${encodeURIComponent(slug)}`, {
             credentials: 'include'
         });
+        if (!response.ok) throw new Error('Blog yazısı yüklenemedi');
+        return response.json();
+    },
+
+    // Admin listesi: taslaklar dahil
+    async getAdminBlogPosts() {
+        const token = localStorage.getItem('token');
+        const response = await fetch(`${API_URL}/resources/blog/admin`, {
+            credentials: 'include',
+            headers: {
+                'Authorization': `Bearer ${token}`
+            }
+        });
         if (!response.ok) throw new Error('Blog yazıları yüklenemedi');
         return response.json();
     },
@@ -494,15 +543,16 @@ export const api = {
     async getDashboardStats() {
         const token = localStorage.getItem('token');
         try {
-            const [projects, messages, blogPosts] = await Promise.all([
-                fetch(`${API_URL}/projects/`, { credentials: 'include' }).then(res => res.json()),
-                fetch(`${API_URL}/resources/messages`, { headers: { 'Authorization': `Bearer ${token}` }, credentials: 'include' }).then(res => res.json()),
-                fetch(`${API_URL}/resources/blog`, { credentials: 'include' }).then(res => res.json())
+            // Yalnızca satır sayısı gerekiyor; ?fields=id gövde kolonlarını çekmez
+            const [projects, messageCounts, blogPosts] = await Promise.all([
+                fetch(`${API_URL}/projects/admin?fields=id`, { headers: { 'Authorization': `Bearer ${token}` }, credentials: 'include' }).then(res => res.json()),
+                fetch(`${API_URL}/resources/messages/unread-count`, { headers: { 'Authorization': `Bearer ${token}` }, credentials: 'include' }).then(res => res.json()),
+                fetch(`${API_URL}/resources/blog/admin?fields=id`, { headers: { 'Authorization': `Bearer ${token}` }, credentials: 'include' }).then(res => res.json())
             ]);
 
             return {
                 projectsCount: Array.isArray(projects) ? projects.length : 0,
-                messagesCount: Array.isArray(messages) ? messages.length : 0,
+                messagesCount: messageCounts?.total ?? 0,
                 blogCount: Array.isArray(blogPosts) ? blogPosts.length : 0
             };
         } catch (error) {
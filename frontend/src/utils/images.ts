@@ -0,0 +1,10 @@
+// Backend'in yüklemede ürettiği WebP varyantları ({"320": url, "640": url, ...})
+export type ImageVariants = Record<string, string> | null | undefined;
+
+// Kart görselleri: mobilde tam genişlik, tablette 2, masaüstünde 3 sütun
+export const CARD_IMAGE_SIZES = '(min-width: 1024px) 33vw, (min-width: 768px) 50vw, 100vw';
+
+export const toSrcSet = (variants: ImageVariants) =>
+    variants && Object.keys(variants).length > 0
+        ? Object.entries(variants).map(([width, url]) => `${url} ${width}w`).join(', ')
+        : undefined;